@@ -1,6 +1,12 @@
 import abc
+import decimal
+import json
+import math
+import os
+import time
 from concurrent.futures import as_completed, Future
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import chain
 from typing import (
@@ -16,6 +22,8 @@ from typing import (
     Iterator,
     Union,
     Set,
+    FrozenSet,
+    Sequence,
 )
 
 import agate
@@ -35,15 +43,21 @@ from dbt.adapters.protocol import (
     AdapterConfig,
     ConnectionManagerProtocol,
 )
-from dbt.clients.agate_helper import empty_table, merge_tables, table_from_rows
+from dbt.clients.agate_helper import ColumnarTable, empty_table, merge_tables, table_from_rows
 from dbt.clients.jinja import MacroGenerator
 from dbt.contracts.graph.compiled import CompileResultNode, CompiledSeedNode
 from dbt.contracts.graph.manifest import Manifest, MacroManifest
 from dbt.contracts.graph.parsed import ParsedSeedNode
 from dbt.exceptions import warn_or_error
 from dbt.events.functions import fire_event
-from dbt.events.types import CacheMiss, ListRelations
-from dbt.utils import filter_null_values, executor
+from dbt.events.types import (
+    CacheMiss,
+    ListRelations,
+    RelationCacheSnapshotSkipped,
+    RelationCacheSnapshotUsed,
+)
+from dbt.utils import filter_null_values, executor, lowercase, md5
+from dbt import flags
 
 from dbt.adapters.base.connections import Connection, AdapterResponse
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -59,6 +73,8 @@ from dbt.adapters.cache import RelationsCache, _make_key
 
 SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
 
+RELATION_CACHE_SNAPSHOT_FILE_NAME = "relation_cache.json"
+
 
 GET_CATALOG_MACRO_NAME = "get_catalog"
 FRESHNESS_MACRO_NAME = "collect_freshness"
@@ -72,11 +88,15 @@ def _expect_row_value(key: str, row: agate.Row):
     return row[key]
 
 
+def _catalog_used_schemas(manifest: Manifest) -> FrozenSet[Tuple[str, str]]:
+    return frozenset((d.lower(), s.lower()) for d, s in manifest.get_used_schemas())
+
+
 def _catalog_filter_schemas(manifest: Manifest) -> Callable[[agate.Row], bool]:
     """Return a function that takes a row and decides if the row should be
     included in the catalog output.
     """
-    schemas = frozenset((d.lower(), s.lower()) for d, s in manifest.get_used_schemas())
+    schemas = _catalog_used_schemas(manifest)
 
     def test(row: agate.Row) -> bool:
         table_database = _expect_row_value("table_database", row)
@@ -90,6 +110,44 @@ def _catalog_filter_schemas(manifest: Manifest) -> Callable[[agate.Row], bool]:
     return test
 
 
+# The columns _catalog_filter_table forces to be strings
+_CATALOG_TEXT_COLUMNS = ("table_database", "table_schema", "table_name")
+
+
+def _catalog_rows_from_columns(table: ColumnarTable, manifest: Manifest) -> List[Tuple[Any, ...]]:
+    """Return the rows of a catalog query result that _catalog_filter_table
+    would keep, with the values it would give them, without building an
+    agate table.
+    """
+    column_names = list(table.column_names)
+    for key in ("table_database", "table_schema"):
+        if key not in column_names:
+            raise InternalException(
+                'Got a row without "{}" column, columns: {}'.format(key, column_names)
+            )
+    database_idx = column_names.index("table_database")
+    schema_idx = column_names.index("table_schema")
+    text_only = set(table.text_only_columns).union(_CATALOG_TEXT_COLUMNS)
+    text_idxs = [idx for idx, name in enumerate(column_names) if name in text_only]
+    number_idxs = [idx for idx, name in enumerate(column_names) if name not in text_only]
+    schemas = _catalog_used_schemas(manifest)
+
+    rows: List[Tuple[Any, ...]] = []
+    for raw_row in table.raw_rows():
+        row = list(raw_row)
+        for idx in text_idxs:
+            if row[idx] is not None and not isinstance(row[idx], str):
+                row[idx] = str(row[idx])
+        # agate casts the numbers in the other columns to decimals
+        for idx in number_idxs:
+            if isinstance(row[idx], int) and not isinstance(row[idx], bool):
+                row[idx] = decimal.Decimal(row[idx])
+        database, schema = row[database_idx], row[schema_idx]
+        if schema is not None and (lowercase(database), schema.lower()) in schemas:
+            rows.append(tuple(row))
+    return rows
+
+
 def _utc(dt: Optional[datetime], source: BaseRelation, field_name: str) -> datetime:
     """If dt has a timezone, return a new datetime that's in UTC. Otherwise,
     assume the datetime is already for UTC and add the timezone.
@@ -121,6 +179,38 @@ def _relation_name(rel: Optional[BaseRelation]) -> str:
         return str(rel)
 
 
+@dataclass
+class RelationsCacheSnapshotInfo:
+    """Where the relations cache is saved for --relation-cache-ttl, and what
+    it was filled from.
+    """
+
+    path: str
+    key: str
+    schemas: Set[BaseRelation]
+    listed_at: float
+    # set once the saved file no longer matches the cache
+    invalidated: bool = False
+
+
+@dataclass
+class CatalogBatch:
+    """The catalog of some of the schemas in an information_schema, as rows
+    with the catalog query's columns.
+
+    The schemas whose token is the same as in previous_tokens aren't queried,
+    they're in 'unchanged'. If the batch failed, 'exception' is set instead.
+    """
+
+    information_schema: Optional[InformationSchema]
+    schemas: Set[str]
+    column_names: List[str] = field(default_factory=list)
+    rows: Sequence[Sequence[Any]] = ()
+    tokens: Dict[str, str] = field(default_factory=dict)
+    unchanged: Set[str] = field(default_factory=set)
+    exception: Optional[Exception] = None
+
+
 class BaseAdapter(metaclass=AdapterMeta):
     """The BaseAdapter provides an abstract base class for adapters.
 
@@ -166,11 +256,25 @@ class BaseAdapter(metaclass=AdapterMeta):
     # for use in materializations
     AdapterSpecificConfigs: Type[AdapterConfig] = AdapterConfig
 
+    # Adapters that can list the relations in many schemas of a database with
+    # a single query set this, and implement
+    # list_relations_in_schemas_without_caching
+    LIST_RELATIONS_IN_BULK: bool = False
+
+    # The most schemas of an information_schema whose catalog is queried at
+    # once by iter_catalog
+    CATALOG_BATCH_SIZE: int = 20
+
     def __init__(self, config):
         self.config = config
         self.cache = RelationsCache()
+        self.cache.on_change = self._invalidate_relations_cache_snapshot
         self.connections = self.ConnectionManager(config)
         self._macro_manifest_lazy: Optional[MacroManifest] = None
+        self._relations_cache_snapshot: Optional[RelationsCacheSnapshotInfo] = None
+        # whether a snapshot left by an earlier run has been removed, when
+        # there's no snapshot info for this one
+        self._stale_relations_cache_snapshot_removed = False
 
     ###
     # Methods that pass through to the connection manager
@@ -344,20 +448,33 @@ class BaseAdapter(metaclass=AdapterMeta):
         cache_schemas = self._get_cache_schemas(manifest)
         with executor(self.config) as tpe:
             futures: List[Future[List[BaseRelation]]] = []
-            for cache_schema in cache_schemas:
-                fut = tpe.submit_connected(
-                    self,
-                    f"list_{cache_schema.database}_{cache_schema.schema}",
-                    self.list_relations_without_caching,
-                    cache_schema,
-                )
-                futures.append(fut)
+            if self.LIST_RELATIONS_IN_BULK:
+                # one query for all the schemas in each database
+                schemas_by_database: Dict[Optional[str], List[BaseRelation]] = {}
+                for cache_schema in cache_schemas:
+                    schemas_by_database.setdefault(cache_schema.database, []).append(cache_schema)
+                for database, schema_relations in schemas_by_database.items():
+                    fut = tpe.submit_connected(
+                        self,
+                        f"list_{database}",
+                        self.list_relations_in_schemas_without_caching,
+                        schema_relations,
+                    )
+                    futures.append(fut)
+            else:
+                for cache_schema in cache_schemas:
+                    fut = tpe.submit_connected(
+                        self,
+                        f"list_{cache_schema.database}_{cache_schema.schema}",
+                        self.list_relations_without_caching,
+                        cache_schema,
+                    )
+                    futures.append(fut)
 
             for future in as_completed(futures):
                 # if we can't read the relations we need to just raise anyway,
                 # so just call future.result() and let that raise on failure
-                for relation in future.result():
-                    self.cache.add(relation)
+                self.cache.add_many(future.result())
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
@@ -374,7 +491,140 @@ class BaseAdapter(metaclass=AdapterMeta):
         with self.cache.lock:
             if clear:
                 self.cache.clear()
-            self._relations_cache_for_schemas(manifest)
+            if not self._restore_relations_cache_snapshot(manifest):
+                self._relations_cache_for_schemas(manifest)
+
+    def relation_cache_validation_token(
+        self, schema_relations: List[BaseRelation]
+    ) -> Optional[str]:
+        """Return a value that changes whenever relations are created, dropped
+        or renamed in the given schemas, and is cheap to query. A saved
+        relations cache is only used if the value is the same as when it was
+        saved.
+
+        By default there's no such value, and the saved cache is used until
+        --relation-cache-ttl seconds after the schemas were last listed.
+        """
+        return None
+
+    def _relations_cache_snapshot_key(self, schemas: Set[BaseRelation]) -> str:
+        credentials = self.config.credentials
+        return md5(
+            json.dumps(
+                [
+                    self.type(),
+                    self.config.profile_name,
+                    self.config.target_name,
+                    list(credentials.connection_info()),
+                    sorted(
+                        [lowercase(schema.database) or "", lowercase(schema.schema) or ""]
+                        for schema in schemas
+                    ),
+                ],
+                default=str,
+            )
+        )
+
+    def _restore_relations_cache_snapshot(self, manifest: Manifest) -> bool:
+        """With --relation-cache-ttl, fill the cache from the one saved at the
+        end of the last run if it's for the same target and schemas, the
+        schemas were listed less than the ttl ago, and the validation token
+        hasn't changed. Return whether the cache was filled.
+        """
+        if not flags.RELATION_CACHE_TTL:
+            self._relations_cache_snapshot = None
+            self._stale_relations_cache_snapshot_removed = False
+            return False
+        schemas = self._get_cache_schemas(manifest)
+        info = RelationsCacheSnapshotInfo(
+            path=os.path.join(self.config.target_path, RELATION_CACHE_SNAPSHOT_FILE_NAME),
+            key=self._relations_cache_snapshot_key(schemas),
+            schemas=schemas,
+            listed_at=time.time(),
+        )
+        self._relations_cache_snapshot = info
+
+        try:
+            with open(info.path) as fp:
+                saved = json.load(fp)
+            relations = [self.Relation.from_dict(relation) for relation in saved["relations"]]
+            links = [(referenced, dependent) for referenced, dependent in saved["links"]]
+            listed_at = float(saved["listed_at"])
+        except FileNotFoundError:
+            fire_event(RelationCacheSnapshotSkipped(path=info.path, reason="it doesn't exist"))
+            return False
+        except Exception as exc:
+            fire_event(
+                RelationCacheSnapshotSkipped(path=info.path, reason=f"it can't be read: {exc}")
+            )
+            return False
+
+        reason: Optional[str]
+        if saved.get("key") != info.key:
+            reason = "it was saved for another target or set of schemas"
+        elif not 0 <= info.listed_at - listed_at <= flags.RELATION_CACHE_TTL:
+            reason = "the schemas were listed more than the ttl ago"
+        elif saved.get("token") != self.relation_cache_validation_token(list(schemas)):
+            reason = "the relations in the database changed"
+        else:
+            reason = None
+        if reason is not None:
+            fire_event(RelationCacheSnapshotSkipped(path=info.path, reason=reason))
+            return False
+
+        self.cache.restore(relations, links)
+        self.cache.update_schemas((schema.database, schema.schema) for schema in schemas)
+        # the ttl counts from when the schemas were actually listed
+        info.listed_at = listed_at
+        fire_event(RelationCacheSnapshotUsed(path=info.path, relations=len(relations)))
+        return True
+
+    def _invalidate_relations_cache_snapshot(self) -> None:
+        info = self._relations_cache_snapshot
+        if info is not None:
+            if info.invalidated:
+                return
+            info.invalidated = True
+            path = info.path
+        else:
+            # Without --relation-cache-ttl nothing keeps a snapshot saved by
+            # an earlier run up to date, so it's removed once the cache
+            # changes. Otherwise a later run with the flag could restore
+            # relations that were dropped or renamed in the meantime.
+            if self._stale_relations_cache_snapshot_removed:
+                return
+            self._stale_relations_cache_snapshot_removed = True
+            path = os.path.join(self.config.target_path, RELATION_CACHE_SNAPSHOT_FILE_NAME)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def save_relations_cache_snapshot(self) -> None:
+        """Save the relations cache for the next run to use, if it was filled
+        with --relation-cache-ttl set. This runs a query for the validation
+        token, so it needs a connection.
+        """
+        info = self._relations_cache_snapshot
+        if info is None:
+            return
+        schemas = {
+            (lowercase(schema.database), lowercase(schema.schema)) for schema in info.schemas
+        }
+        relations, links = self.cache.snapshot(schemas)
+        saved = {
+            "key": info.key,
+            "listed_at": info.listed_at,
+            "token": self.relation_cache_validation_token(list(info.schemas)),
+            "relations": [relation.to_dict(omit_none=True) for relation in relations],
+            "links": links,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(info.path)), exist_ok=True)
+        tmp_path = f"{info.path}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump(saved, fp)
+        os.replace(tmp_path, info.path)
+        info.invalidated = False
 
     @available
     def cache_added(self, relation: Optional[BaseRelation]) -> str:
@@ -522,6 +772,22 @@ class BaseAdapter(metaclass=AdapterMeta):
             "`list_relations_without_caching` is not implemented for this " "adapter!"
         )
 
+    def list_relations_in_schemas_without_caching(
+        self, schema_relations: List[BaseRelation]
+    ) -> List[BaseRelation]:
+        """List the relations in the given schemas, which are all in the same
+        database, bypassing the cache. Only used when LIST_RELATIONS_IN_BULK
+        is set.
+
+        :param schema_relations: Relations containing the database and schema
+            as appropriate for the underlying data warehouse
+        :return: The relations in all of the schemas
+        :rtype: List[self.Relation]
+        """
+        raise NotImplementedException(
+            "`list_relations_in_schemas_without_caching` is not implemented for this adapter!"
+        )
+
     ###
     # Provided methods about relations
     ###
@@ -679,7 +945,13 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     @available.parse_none
     def get_relation(self, database: str, schema: str, identifier: str) -> Optional[BaseRelation]:
-        relations_list = self.list_relations(database, schema)
+        if identifier is not None and self._schema_is_cached(database, schema):
+            # only a relation with the same lowercased name can match
+            relations_list = self.cache.get_relations_named(
+                database, schema, identifier.strip(self.Relation.quote_character)
+            )
+        else:
+            relations_list = self.list_relations(database, schema)
 
         matches = self._make_match(relations_list, database, schema, identifier)
 
@@ -976,6 +1248,129 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return catalogs, exceptions
 
+    def catalog_validation_tokens(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[str],
+        manifest: Manifest,
+    ) -> Dict[str, str]:
+        """Return a value for each of the (lowercase) schemas that changes
+        whenever the catalog of the schema does. iter_catalog doesn't query
+        the catalog of a schema whose value it was given.
+
+        By default there are no such values, and the catalog of every schema
+        is always queried.
+        """
+        return {}
+
+    def _get_catalog_batches(self, manifest: Manifest) -> List[Tuple[InformationSchema, Set[str]]]:
+        """Split the schemas of each information_schema in batches, so the
+        threads have about the same number of schemas to query.
+        """
+        batches: List[Tuple[InformationSchema, Set[str]]] = []
+        for info, schemas in self._get_catalog_schemas(manifest).items():
+            # every relation dbt builds has a schema
+            names = sorted(schema for schema in schemas if schema is not None)
+            if not names:
+                continue
+            size = min(self.CATALOG_BATCH_SIZE, math.ceil(len(names) / self.config.threads))
+            for start in range(0, len(names), max(size, 1)):
+                batches.append((info, set(names[start : start + size])))
+        return batches
+
+    def _catalog_rows(
+        self, table: agate.Table, manifest: Manifest
+    ) -> Tuple[List[str], Sequence[Sequence[Any]]]:
+        if (
+            isinstance(table, ColumnarTable)
+            and not table.is_built
+            and type(self)._catalog_filter_table.__func__  # type: ignore[attr-defined] # noqa
+            is BaseAdapter._catalog_filter_table.__func__  # type: ignore[attr-defined] # noqa
+        ):
+            return list(table.column_names), _catalog_rows_from_columns(table, manifest)
+        table = self._catalog_filter_table(table, manifest)
+        return list(table.column_names), [row.values() for row in table]
+
+    def _get_catalog_batch(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[str],
+        manifest: Manifest,
+        previous_tokens: Optional[Mapping[Tuple[Optional[str], str], str]],
+    ) -> CatalogBatch:
+        batch = CatalogBatch(information_schema=information_schema, schemas=schemas)
+        if previous_tokens is not None:
+            batch.tokens = self.catalog_validation_tokens(information_schema, schemas, manifest)
+            database = lowercase(information_schema.database)
+            batch.unchanged = {
+                schema
+                for schema, token in batch.tokens.items()
+                if previous_tokens.get((database, schema)) == token
+            }
+        changed = schemas - batch.unchanged
+        if changed:
+            table = self.execute_macro(
+                GET_CATALOG_MACRO_NAME,
+                kwargs={"information_schema": information_schema, "schemas": changed},
+                manifest=manifest,
+            )
+            batch.column_names, batch.rows = self._catalog_rows(table, manifest)
+        return batch
+
+    def iter_catalog(
+        self,
+        manifest: Manifest,
+        previous_tokens: Optional[Mapping[Tuple[Optional[str], str], str]] = None,
+    ) -> Iterator[CatalogBatch]:
+        """Query the catalog in batches of schemas across the threads, and
+        yield each batch as soon as it's done. previous_tokens maps
+        (database, schema) pairs, lowercase, to the values
+        catalog_validation_tokens returned when their catalog was last
+        queried. The tokens are only computed when previous_tokens is given,
+        even if it's empty.
+
+        Adapters that override get_catalog get a single batch with all its
+        rows, and one per exception.
+        """
+        if type(self).get_catalog is not BaseAdapter.get_catalog:
+            table, exceptions = self.get_catalog(manifest)
+            yield CatalogBatch(
+                information_schema=None,
+                schemas=set(),
+                column_names=list(table.column_names),
+                rows=[row.values() for row in table],
+            )
+            for error in exceptions:
+                yield CatalogBatch(information_schema=None, schemas=set(), exception=error)
+            return
+
+        with executor(self.config) as tpe:
+            futures: Dict[Future[CatalogBatch], Tuple[InformationSchema, Set[str]]] = {}
+            for info, schemas in self._get_catalog_batches(manifest):
+                name = "{}.information_schema.{}".format(info.database, len(futures))
+                fut = tpe.submit_connected(
+                    self,
+                    name,
+                    self._get_catalog_batch,
+                    info,
+                    schemas,
+                    manifest,
+                    previous_tokens,
+                )
+                futures[fut] = (info, schemas)
+
+            for future in as_completed(futures):
+                exc = future.exception()
+                if exc is None:
+                    yield future.result()
+                elif not isinstance(exc, Exception):
+                    # KeyboardInterrupt and the other BaseExceptions
+                    raise exc
+                else:
+                    warn_or_error(f"Encountered an error while generating catalog: {str(exc)}")
+                    info, schemas = futures[future]
+                    yield CatalogBatch(information_schema=info, schemas=schemas, exception=exc)
+
     def cancel_open_connections(self):
         """Cancel all open connections."""
         return self.connections.cancel_open()
@@ -1,6 +1,6 @@
 import threading
 from copy import deepcopy
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from dbt.adapters.reference_keys import _make_key, _ReferenceKey
 import dbt.exceptions
@@ -45,6 +45,8 @@ class _CachedRelation:
     def __init__(self, inner):
         self.referenced_by = {}
         self.inner = inner
+        # the lowercased names are looked up far more often than they change
+        self._key = _make_key(inner)
 
     def __str__(self) -> str:
         return ("_CachedRelation(database={}, schema={}, identifier={}, inner={})").format(
@@ -53,15 +55,15 @@ class _CachedRelation:
 
     @property
     def database(self) -> Optional[str]:
-        return lowercase(self.inner.database)
+        return self._key.database
 
     @property
     def schema(self) -> Optional[str]:
-        return lowercase(self.inner.schema)
+        return self._key.schema
 
     @property
     def identifier(self) -> Optional[str]:
-        return lowercase(self.inner.identifier)
+        return self._key.identifier
 
     def __copy__(self):
         new = self.__class__(self.inner)
@@ -81,7 +83,7 @@ class _CachedRelation:
 
         :return _ReferenceKey: A key for this relation.
         """
-        return _make_key(self)
+        return self._key
 
     def add_reference(self, referrer: "_CachedRelation"):
         """Add a reference from referrer to self, indicating that if this node
@@ -132,6 +134,7 @@ class _CachedRelation:
                 "identifier": new_relation.inner.identifier,
             },
         )
+        self._key = _make_key(self.inner)
 
     def rename_key(self, old_key, new_key):
         """Rename a reference that may or may not exist. Only handles the
@@ -163,6 +166,21 @@ class _CachedRelation:
         return [dot_separated(r) for r in self.referenced_by]
 
 
+class _CachedSchema:
+    """The cached relations in one (database, schema), by their lowercased
+    identifier.
+
+    The lock only guards this schema's relations, so looking up relations in
+    one schema doesn't wait for lookups or changes in another. Changes also
+    hold the RelationsCache lock, because a drop or rename can cascade to
+    other schemas.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.relations: Dict[Optional[str], _CachedRelation] = {}
+
+
 class RelationsCache:
     """A cache of the relations known to dbt. Keeps track of relationships
     declared between tables and handles renames/drops as a real database would.
@@ -171,12 +189,22 @@ class RelationsCache:
     :attr threading.RLock lock: The lock around relations, held during updates.
         The adapters also hold this lock while filling the cache.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
+    :attr Dict[Tuple[str, str], _CachedSchema] partitions: The relations
+        in each lowercased (database, schema), for lookups.
+    :attr Optional[Callable[[], None]] on_change: Called whenever relations
+        are added, dropped, renamed or linked.
     """
 
     def __init__(self) -> None:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
         self.lock = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
+        self.partitions: Dict[Tuple[Optional[str], Optional[str]], _CachedSchema] = {}
+        self.on_change: Optional[Callable[[], None]] = None
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
 
     def add_schema(
         self,
@@ -207,6 +235,7 @@ class RelationsCache:
         # collecting the list first.
 
         with self.lock:
+            self._changed()
             to_remove = self._list_relations_in_schema(database, schema)
             self._remove_all(to_remove)
             # handle a drop_schema race by using discard() over remove()
@@ -239,6 +268,26 @@ class RelationsCache:
         with self.lock:
             return {dot_separated(k): v.dump_graph_entry() for k, v in self.relations.items()}
 
+    def _index(self, relation: _CachedRelation) -> None:
+        """Add a relation to the partition for its schema. Callers should
+        hold the lock.
+        """
+        schema_id = (relation.database, relation.schema)
+        partition = self.partitions.get(schema_id)
+        if partition is None:
+            partition = self.partitions.setdefault(schema_id, _CachedSchema())
+        with partition.lock:
+            partition.relations[relation.identifier] = relation
+
+    def _unindex(self, key: _ReferenceKey) -> None:
+        """Remove a relation from the partition for its schema. Callers
+        should hold the lock.
+        """
+        partition = self.partitions.get((key.database, key.schema))
+        if partition is not None:
+            with partition.lock:
+                partition.relations.pop(key.identifier, None)
+
     def _setdefault(self, relation: _CachedRelation):
         """Add a relation to the cache, or return it if it already exists.
 
@@ -248,7 +297,10 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        cached = self.relations.setdefault(key, relation)
+        if cached is relation:
+            self._index(relation)
+        return cached
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
@@ -311,6 +363,7 @@ class RelationsCache:
             self.add(dependent)
         fire_event(AddLink(dep_key=dep_key, ref_key=ref_key))
         with self.lock:
+            self._changed()
             self._add_link(ref_key, dep_key)
 
     def add(self, relation):
@@ -324,9 +377,68 @@ class RelationsCache:
         fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
 
         with self.lock:
+            self._changed()
             self._setdefault(cached)
         fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
 
+    def add_many(self, relations: Iterable[Any]) -> None:
+        """Add the relations to the cache, holding the lock once for all of
+        them.
+
+        :param Iterable[BaseRelation] relations: The underlying relations.
+        """
+        cached_relations = [_CachedRelation(relation) for relation in relations]
+        for cached in cached_relations:
+            fire_event(AddRelation(relation=_make_key(cached)))
+        fire_event(DumpBeforeAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
+        with self.lock:
+            self._changed()
+            for cached in cached_relations:
+                self._setdefault(cached)
+        fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
+    def snapshot(
+        self, schemas: Optional[Set[Tuple[Optional[str], Optional[str]]]] = None
+    ) -> Tuple[List[Any], List[Tuple[int, int]]]:
+        """Return the cached relations, and the links between them as pairs
+        of (referenced, dependent) indexes into the relations. restore() takes
+        them back.
+
+        :param schemas: If given, only the relations in these lowercased
+            (database, schema) pairs are returned.
+        """
+        with self.lock:
+            cached_relations = [
+                cached
+                for key, cached in self.relations.items()
+                if schemas is None or (key.database, key.schema) in schemas
+            ]
+            indexes = {cached.key(): idx for idx, cached in enumerate(cached_relations)}
+            links = [
+                (indexes[cached.key()], indexes[dependent_key])
+                for cached in cached_relations
+                for dependent_key in cached.referenced_by
+                if dependent_key in indexes
+            ]
+        return [cached.inner for cached in cached_relations], links
+
+    def restore(self, relations: List[Any], links: Iterable[Tuple[int, int]]) -> None:
+        """Add the relations and links returned by snapshot(). Restoring a
+        snapshot doesn't count as a change.
+        """
+        cached_relations = [_CachedRelation(relation) for relation in relations]
+        for cached in cached_relations:
+            fire_event(AddRelation(relation=_make_key(cached)))
+        with self.lock:
+            for cached in cached_relations:
+                self._setdefault(cached)
+            for referenced_idx, dependent_idx in links:
+                self._add_link(
+                    cached_relations[referenced_idx].key(), cached_relations[dependent_idx].key()
+                )
+        fire_event(DumpAfterAddGraph(dump=Lazy.defer(lambda: self.dump_graph())))
+
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
         cascade!
@@ -336,6 +448,7 @@ class RelationsCache:
         # remove direct refs
         for key in keys:
             del self.relations[key]
+            self._unindex(key)
         # then remove all entries from each child
         for cached in self.relations.values():
             cached.release_references(keys)
@@ -367,6 +480,7 @@ class RelationsCache:
         dropped_key = _make_key(relation)
         fire_event(DropRelation(dropped=dropped_key))
         with self.lock:
+            self._changed()
             self._drop_cascade_relation(dropped_key)
 
     def _rename_relation(self, old_key, new_relation):
@@ -381,6 +495,7 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._unindex(old_key)
         new_key = new_relation.key()
 
         # relaton has to rename its innards, so it needs the _CachedRelation.
@@ -394,6 +509,7 @@ class RelationsCache:
                 cached.rename_key(old_key, new_key)
 
         self.relations[new_key] = relation
+        self._index(relation)
         # also fixup the schemas!
         self.add_schema(new_key.database, new_key.schema)
 
@@ -443,6 +559,7 @@ class RelationsCache:
         fire_event(DumpBeforeRenameSchema(dump=Lazy.defer(lambda: self.dump_graph())))
 
         with self.lock:
+            self._changed()
             if self._check_rename_constraints(old_key, new_key):
                 self._rename_relation(old_key, _CachedRelation(new))
             else:
@@ -457,14 +574,11 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        database = lowercase(database)
-        schema = lowercase(schema)
-        with self.lock:
-            results = [
-                r.inner
-                for r in self.relations.values()
-                if (lowercase(r.schema) == schema and lowercase(r.database) == database)
-            ]
+        partition = self.partitions.get((lowercase(database), lowercase(schema)))
+        if partition is None:
+            return []
+        with partition.lock:
+            results = [r.inner for r in partition.relations.values()]
 
         if None in results:
             dbt.exceptions.raise_cache_inconsistent(
@@ -472,23 +586,42 @@ class RelationsCache:
             )
         return results
 
+    def get_relations_named(
+        self, database: Optional[str], schema: Optional[str], identifier: Optional[str]
+    ) -> List[Any]:
+        """Case-insensitively return the relation with the given name in a list,
+        or an empty list if it isn't cached.
+
+        :param str database: The case-insensitive database name.
+        :param str schema: The case-insensitive schema name.
+        :param str identifier: The case-insensitive identifier.
+        :return List[BaseRelation]: The relations with the given name.
+        """
+        partition = self.partitions.get((lowercase(database), lowercase(schema)))
+        if partition is None:
+            return []
+        with partition.lock:
+            cached = partition.relations.get(lowercase(identifier))
+        if cached is None:
+            return []
+        return [cached.inner]
+
     def clear(self):
         """Clear the cache"""
         with self.lock:
             self.relations.clear()
+            self.partitions.clear()
             self.schemas.clear()
 
     def _list_relations_in_schema(
         self, database: Optional[str], schema: Optional[str]
     ) -> List[_CachedRelation]:
         """Get the relations in a schema. Callers should hold the lock."""
-        key = (lowercase(database), lowercase(schema))
-
-        to_remove: List[_CachedRelation] = []
-        for cachekey, relation in self.relations.items():
-            if (cachekey.database, cachekey.schema) == key:
-                to_remove.append(relation)
-        return to_remove
+        partition = self.partitions.get((lowercase(database), lowercase(schema)))
+        if partition is None:
+            return []
+        with partition.lock:
+            return list(partition.relations.values())
 
     def _remove_all(self, to_remove: List[_CachedRelation]):
         """Remove all the listed relations. Ignore relations that have been
@@ -1,6 +1,6 @@
 import abc
 import time
-from typing import List, Optional, Tuple, Any, Iterable, Dict, Union
+from typing import List, Optional, Tuple, Any, Iterable, Iterator, Dict, Union
 
 import agate
 
@@ -22,6 +22,9 @@ class SQLConnectionManager(BaseConnectionManager):
         - open
     """
 
+    # The number of rows fetched from the cursor at a time
+    FETCH_BATCH_SIZE: int = 10000
+
     @abc.abstractmethod
     def cancel(self, connection: Connection):
         """Cancel the given connection."""
@@ -85,9 +88,7 @@ class SQLConnectionManager(BaseConnectionManager):
         )
 
     @classmethod
-    def process_results(
-        cls, column_names: Iterable[str], rows: Iterable[Any]
-    ) -> List[Dict[str, Any]]:
+    def _make_column_names_unique(cls, column_names: Iterable[str]) -> None:
         # TODO CT-211
         unique_col_names = dict()  # type: ignore[var-annotated]
         # TODO CT-211
@@ -101,8 +102,22 @@ class SQLConnectionManager(BaseConnectionManager):
             else:
                 # TODO CT-211
                 unique_col_names[column_names[idx]] = 1  # type: ignore[index]
+
+    @classmethod
+    def process_results(
+        cls, column_names: Iterable[str], rows: Iterable[Any]
+    ) -> List[Dict[str, Any]]:
+        cls._make_column_names_unique(column_names)
         return [dict(zip(column_names, row)) for row in rows]
 
+    @classmethod
+    def fetch_batches(cls, cursor: Any) -> Iterator[List[Any]]:
+        while True:
+            rows = cursor.fetchmany(cls.FETCH_BATCH_SIZE)
+            if not rows:
+                return
+            yield rows
+
     @classmethod
     def get_result_from_cursor(cls, cursor: Any) -> agate.Table:
         data: List[Any] = []
@@ -110,6 +125,12 @@ class SQLConnectionManager(BaseConnectionManager):
 
         if cursor.description is not None:
             column_names = [col[0] for col in cursor.description]
+            if cls.process_results.__func__ is SQLConnectionManager.process_results.__func__:  # type: ignore[attr-defined] # noqa
+                cls._make_column_names_unique(column_names)
+                return dbt.clients.agate_helper.table_from_batches(
+                    column_names, cls.fetch_batches(cursor)
+                )
+            # adapters that override process_results get every row as a dict
             rows = cursor.fetchall()
             data = cls.process_results(column_names, rows)
 
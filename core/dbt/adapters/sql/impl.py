@@ -14,6 +14,7 @@ from dbt.events.types import ColTypeChange, SchemaCreation, SchemaDrop
 from dbt.adapters.base.relation import BaseRelation
 
 LIST_RELATIONS_MACRO_NAME = "list_relations_without_caching"
+LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME = "list_relations_in_schemas_without_caching"
 GET_COLUMNS_IN_RELATION_MACRO_NAME = "get_columns_in_relation"
 LIST_SCHEMAS_MACRO_NAME = "list_schemas"
 CHECK_SCHEMA_EXISTS_MACRO_NAME = "check_schema_exists"
@@ -180,7 +181,17 @@ class SQLAdapter(BaseAdapter):
     ) -> List[BaseRelation]:
         kwargs = {"schema_relation": schema_relation}
         results = self.execute_macro(LIST_RELATIONS_MACRO_NAME, kwargs=kwargs)
+        return self._relations_from_results(results)
 
+    def list_relations_in_schemas_without_caching(
+        self,
+        schema_relations: List[BaseRelation],
+    ) -> List[BaseRelation]:
+        kwargs = {"schema_relations": schema_relations}
+        results = self.execute_macro(LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME, kwargs=kwargs)
+        return self._relations_from_results(results)
+
+    def _relations_from_results(self, results: agate.Table) -> List[BaseRelation]:
         relations = []
         quote_policy = {"database": True, "schema": True, "identifier": True}
         for _database, name, _schema, _type in results:
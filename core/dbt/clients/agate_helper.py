@@ -1,11 +1,12 @@
 from codecs import BOM_UTF8
+import csv
 
 import agate
 import datetime
 import isodate
 import json
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Union, Optional, Any, Set, Tuple
 
 from dbt.exceptions import RuntimeException
 
@@ -123,6 +124,106 @@ def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
     )
 
 
+# The attributes agate.Table.__init__ sets, besides the column names
+_AGATE_TABLE_ATTRIBUTES = frozenset(("_column_types", "_row_names", "_rows", "_columns"))
+
+_CONTAINER_TYPES = (dict, list, tuple)
+
+
+class ColumnarTable(agate.Table):
+    """A query result, held as a list of values per column.
+
+    It can be used as an agate.Table, but the agate column types, rows and
+    columns are only built the first time something needs them, with the
+    same types table_from_data_flat would give. column_names, len(),
+    column_values() and raw_rows() never build them.
+    """
+
+    def __init__(
+        self,
+        column_names: Iterable[str],
+        columns: List[List[Any]],
+        num_rows: int,
+        text_only_columns: Iterable[str] = (),
+    ) -> None:
+        # agate.Table.__init__ isn't called until the agate table is needed
+        self._column_names = agate.utils.deduplicate(column_names, column_names=True)
+        self._raw_columns = columns
+        self._num_rows = num_rows
+        self._text_only_columns = set(text_only_columns)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes that haven't been set yet
+        if name in _AGATE_TABLE_ATTRIBUTES:
+            self._build()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def _build(self) -> None:
+        table = table_from_rows(
+            rows=list(zip(*self._raw_columns)),
+            column_names=self._column_names,
+            text_only_columns=self._text_only_columns,
+        )
+        self.__dict__.update(table.__dict__)
+
+    @property
+    def text_only_columns(self) -> Set[str]:
+        """The names of the columns with strings or containers in them."""
+        return self._text_only_columns
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the agate rows and columns have been built."""
+        return "_rows" in self.__dict__
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def column_values(self, key: Union[int, str]) -> List[Any]:
+        """Return the values in a column, by index or name, as the database
+        driver returned them. Containers are json strings.
+        """
+        idx = self._column_names.index(key) if isinstance(key, str) else key
+        return self._raw_columns[idx]
+
+    def raw_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate over the rows as tuples of the values the database driver
+        returned. Containers are json strings.
+        """
+        return zip(*self._raw_columns)
+
+
+def table_from_batches(
+    column_names: Iterable[str], batches: Iterable[List[Tuple[Any, ...]]]
+) -> ColumnarTable:
+    """Build a ColumnarTable from batches of rows, like the lists a cursor's
+    fetchmany() returns. Like table_from_data_flat, container values are
+    stored as json strings, and columns with strings or containers in them
+    are text only.
+    """
+    column_names = list(column_names)
+    columns: List[List[Any]] = [[] for _ in column_names]
+    text_only_columns: Set[str] = set()
+    num_rows = 0
+    for batch in batches:
+        num_rows += len(batch)
+        for idx, values in enumerate(zip(*batch)):
+            types = set(map(type, values))
+            if any(issubclass(t, _CONTAINER_TYPES) for t in types):
+                values = tuple(
+                    json.dumps(value, cls=dbt.utils.JSONEncoder)
+                    if isinstance(value, _CONTAINER_TYPES)
+                    else value
+                    for value in values
+                )
+                text_only_columns.add(column_names[idx])
+            elif any(issubclass(t, str) for t in types):
+                text_only_columns.add(column_names[idx])
+            columns[idx].extend(values)
+    return ColumnarTable(column_names, columns, num_rows, text_only_columns)
+
+
 def empty_table():
     "Returns an empty Agate table. To be used in place of None"
 
@@ -135,12 +236,53 @@ def as_matrix(table):
     return [r.values() for r in table.rows.values()]
 
 
-def from_csv(abspath, text_columns):
+def from_csv(abspath, text_columns, row_limit: Optional[int] = None):
+    """Load a csv file into an agate table. With a row_limit, only that many
+    rows are read, and the column types are inferred from them.
+    """
     type_tester = build_type_tester(text_columns=text_columns)
     with open(abspath, encoding="utf-8") as fp:
         if fp.read(1) != BOM:
             fp.seek(0)
-        return agate.Table.from_csv(fp, column_types=type_tester)
+        return agate.Table.from_csv(fp, column_types=type_tester, row_limit=row_limit)
+
+
+def cast_csv_rows(
+    abspath: str, column_types: Iterable[agate.data_types.DataType]
+) -> Iterator[List[Any]]:
+    """Yield the rows of a csv file, after its header, with every value cast
+    to its column's type like agate.Table.from_csv does. Only one row is
+    held in memory at a time.
+    """
+    casts = [column_type.cast for column_type in column_types]
+    num_columns = len(casts)
+    with open(abspath, encoding="utf-8") as fp:
+        if fp.read(1) != BOM:
+            fp.seek(0)
+        reader = csv.reader(fp)
+        column_names: List[str] = next(reader, [])
+        for row in reader:
+            # line_num counts from 1 and includes the header
+            if len(row) > num_columns:
+                raise RuntimeException(
+                    f"Line {reader.line_num} has {len(row)} values, but the table only has "
+                    f"{num_columns} columns."
+                )
+            values: List[Optional[str]] = [*row, *([None] * (num_columns - len(row)))]
+            try:
+                yield [cast(value) for cast, value in zip(casts, values)]
+            except agate.exceptions.CastError as exc:
+                # find the column that failed
+                for column_idx, (cast, value) in enumerate(zip(casts, values)):
+                    try:
+                        cast(value)
+                    except agate.exceptions.CastError:
+                        break
+                raise RuntimeException(
+                    f"{exc} Error at line {reader.line_num} column {column_names[column_idx]}. "
+                    f"The column type was inferred from the first rows of {abspath}, set it "
+                    f"with column_types in the seed's config."
+                )
 
 
 class _NullMarker:
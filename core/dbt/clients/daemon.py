@@ -0,0 +1,86 @@
+"""A thin client for `dbt daemon`.
+
+Run it with the arguments you'd pass to `dbt`, for example
+`python -m dbt.clients.daemon compile --select my_model`. The arguments are
+sent to the daemon serving the project in the current directory, and the
+daemon's output and exit code are passed through.
+
+This module only uses the standard library, so it starts quickly.
+"""
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, IO, Iterator, List, Optional
+
+DAEMON_SOCKET_FILE_NAME = "dbt-daemon.sock"
+# Set this when the project's target-path isn't 'target'
+DAEMON_SOCKET_ENV_VAR = "DBT_DAEMON_SOCKET"
+
+# dbt.utils.ExitCodes.UnhandledError, which is too slow to import here
+UNHANDLED_ERROR_EXIT_CODE = 2
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def read_messages(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    for line in stream:
+        yield json.loads(line)
+
+
+def find_socket_path(cwd: Optional[str] = None) -> Optional[str]:
+    """Return the socket of the daemon serving the project that contains
+    'cwd', or None if 'cwd' isn't in a dbt project.
+    """
+    if os.getenv(DAEMON_SOCKET_ENV_VAR):
+        return os.environ[DAEMON_SOCKET_ENV_VAR]
+    path = os.path.abspath(cwd or os.getcwd())
+    while True:
+        if os.path.exists(os.path.join(path, "dbt_project.yml")):
+            return os.path.join(path, "target", DAEMON_SOCKET_FILE_NAME)
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def send_request(path: str, args: List[str], out: IO[str]) -> int:
+    """Send the dbt arguments to the daemon listening on 'path', writing its
+    output to 'out'. Return the exit code of the command.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        # relative paths in the arguments are relative to the client's directory
+        sock.sendall(encode_message({"args": args, "cwd": os.getcwd()}))
+        with sock.makefile("rb") as stream:
+            for message in read_messages(stream):
+                if "output" in message:
+                    out.write(message["output"])
+                    out.flush()
+                elif "exit_code" in message:
+                    return message["exit_code"]
+    # the daemon went away before the command finished
+    return UNHANDLED_ERROR_EXIT_CODE
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    if args is None:
+        args = sys.argv[1:]
+    path = find_socket_path()
+    if path is None:
+        sys.stderr.write("fatal: Not a dbt project (or any of the parent directories).\n")
+        sys.exit(UNHANDLED_ERROR_EXIT_CODE)
+    try:
+        exit_code = send_request(path, args, sys.stdout)
+    except OSError as exc:
+        sys.stderr.write(f"Could not connect to the dbt daemon at {path}: {exc}\n")
+        exit_code = UNHANDLED_ERROR_EXIT_CODE
+    except KeyboardInterrupt:
+        exit_code = UNHANDLED_ERROR_EXIT_CODE
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,17 @@
 import codecs
+import hashlib
+import importlib.util
 import linecache
+import marshal
 import os
 import re
 import tempfile
 import threading
 from ast import literal_eval
+from collections import OrderedDict
 from contextlib import contextmanager
 from itertools import chain, islice
+from types import CodeType
 from typing import List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple, Callable
 
 import jinja2
@@ -37,6 +42,7 @@ from dbt.exceptions import (
     UndefinedMacroException,
 )
 from dbt import flags
+from dbt.version import __version__ as dbt_version
 
 
 def _linecache_inject(source, write):
@@ -97,6 +103,27 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
 
         return super()._compile(source, filename)  # type: ignore
 
+    def compile(self, source, name=None, filename=None, raw=False, defer_init=False):
+        """Look up the code for template source in the bytecode cache
+        before parsing and compiling it.
+        """
+        cacheable = (
+            isinstance(source, str)
+            and name is None
+            and filename is None
+            and not raw
+            and not defer_init
+            and not flags.MACRO_DEBUGGING
+        )
+        if not cacheable:
+            return super().compile(source, name, filename, raw, defer_init)
+        key = bytecode_cache.get_key(self, source)
+        code = bytecode_cache.get(key)
+        if code is None:
+            code = super().compile(source)
+            bytecode_cache.set(key, code)
+        return code
+
 
 class NativeSandboxEnvironment(MacroFuzzEnvironment):
     code_generator_class = jinja2.nativetypes.NativeCodeGenerator
@@ -207,6 +234,180 @@ class TemplateCache:
 template_cache = TemplateCache()
 
 
+JINJA_BYTECODE_CACHE_FILE_NAME = "jinja_bytecode.cache"
+# The most compiled code the bytecode cache holds, in bytes
+DEFAULT_BYTECODE_CACHE_SIZE = 64 * 1024 * 1024
+
+
+class BytecodeCache:
+    """The python code jinja compiled each template source to, by a
+    checksum of the source. MacroFuzzEnvironment.compile uses it for every
+    template dbt renders, so a template is only parsed and compiled once.
+
+    When it's opened on a path, the cache is loaded from the file there and
+    save writes it back, so the templates in files that haven't changed
+    aren't compiled again by the next invocation either. dbt only does this
+    with --jinja-bytecode-cache, since the code in the file is executed. The file is only
+    used by the same version of dbt, jinja and python that wrote it.
+
+    The least recently used code is evicted once the cache holds more than
+    max_size bytes of it.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_BYTECODE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.path: Optional[str] = None
+        # [checksum] = marshalled code, least recently used first
+        self._entries: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._size = 0
+        self._changed = False
+        self._added: Optional[List[Tuple[bytes, bytes]]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def version() -> Tuple[str, str, bytes]:
+        # the jinja2 stubs don't declare __version__
+        jinja_version = getattr(jinja2, "__version__")
+        return (dbt_version, jinja_version, importlib.util.MAGIC_NUMBER)
+
+    @staticmethod
+    def get_key(env: jinja2.Environment, source: str) -> bytes:
+        # the environment class decides how the source is compiled, so the
+        # same source compiles to different code in the native environment
+        env_cls = type(env)
+        checksum = hashlib.sha256(f"{env_cls.__module__}.{env_cls.__qualname__}\n".encode())
+        checksum.update(source.encode("utf-8", "surrogatepass"))
+        return checksum.digest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: bytes) -> Optional[CodeType]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            return marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _add(self, key: bytes, data: bytes) -> None:
+        if len(data) > self.max_size:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def set(self, key: bytes, code: CodeType) -> None:
+        data = marshal.dumps(code)
+        with self._lock:
+            self._add(key, data)
+            self._changed = True
+            if self._added is not None:
+                self._added.append((key, data))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._changed = True
+
+    def load(self, path: str) -> None:
+        """Add the code in the cache file at path, if there is a usable one"""
+        try:
+            with open(path, "rb") as fp:
+                version, entries = marshal.load(fp)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if version != self.version():
+            return
+        with self._lock:
+            # the file has the least recently used entries first, and the
+            # code compiled before it was loaded is more recent
+            current = list(self._entries.items())
+            self._entries.clear()
+            self._size = 0
+            for key, data in entries:
+                if isinstance(key, bytes) and isinstance(data, bytes):
+                    self._add(key, data)
+            loaded = set(self._entries)
+            for key, data in current:
+                self._add(key, data)
+            # the file only needs saving for code it doesn't have yet
+            self._changed = any(key not in loaded for key, _ in current)
+
+    def open(self, path: str) -> None:
+        """Load the cache file at path, and save to it from now on"""
+        self.load(path)
+        self.path = path
+
+    def record_added(self) -> None:
+        """Keep the code that's compiled from now on for take_added. Parse
+        workers send it back to the process that saves the cache.
+        """
+        with self._lock:
+            self._added = []
+
+    def take_added(self) -> List[Tuple[bytes, bytes]]:
+        with self._lock:
+            added = self._added or []
+            if self._added is not None:
+                self._added = []
+        return added
+
+    def update(self, entries: List[Tuple[bytes, bytes]]) -> None:
+        if not entries:
+            return
+        with self._lock:
+            for key, data in entries:
+                self._add(key, data)
+            self._changed = True
+
+    def save(self) -> None:
+        """Write the cache to its path, if anything was compiled since it
+        was opened or last saved. The file is replaced atomically, so
+        invocations that run at the same time never read a partial file.
+        """
+        if self.path is None or not self._changed:
+            return
+        with self._lock:
+            data = marshal.dumps((self.version(), list(self._entries.items())))
+            self._changed = False
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            try:
+                with open(tmp_path, "wb") as fp:
+                    fp.write(data)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except OSError:
+            # the cache only saves time, an unwritable target path isn't an error
+            self._changed = True
+
+    def close(self) -> None:
+        """Save the cache and stop using its file"""
+        self.save()
+        self.path = None
+
+
+bytecode_cache = BytecodeCache()
+
+
 class BaseMacroGenerator:
     def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
         self.context: Optional[Dict[str, Any]] = context
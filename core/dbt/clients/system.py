@@ -46,10 +46,18 @@ def find_matching(
 
       [ { 'absolute_path': '/root/path/models/model_one.sql',
           'relative_path': 'model_one.sql',
-          'searched_path': 'models' },
+          'searched_path': 'models',
+          'modification_time': 1644359411.0627382,
+          'size': 104,
+          'mtime_ns': 1644359411062738200,
+          'inode': 2246709 },
         { 'absolute_path': '/root/path/models/subdirectory/model_two.sql',
           'relative_path': 'subdirectory/model_two.sql',
-          'searched_path': 'models' } ]
+          'searched_path': 'models',
+          ... } ]
+
+    The size, mtime_ns and inode come from the same stat call as the
+    modification time, and are None if the file couldn't be stat'ed.
     """
     matching = []
     root_path = os.path.normpath(root_path)
@@ -58,30 +66,64 @@ def find_matching(
 
     for relative_path_to_search in relative_paths_to_search:
         absolute_path_to_search = os.path.join(root_path, relative_path_to_search)
-        walk_results = os.walk(absolute_path_to_search)
-
-        for current_path, subdirectories, local_files in walk_results:
-            for local_file in local_files:
-                absolute_path = os.path.join(current_path, local_file)
-                relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
-                modification_time = 0.0
-                try:
-                    modification_time = os.path.getmtime(absolute_path)
-                except OSError:
-                    fire_event(SystemErrorRetrievingModTime(path=absolute_path))
-                if reobj.match(local_file):
-                    matching.append(
-                        {
-                            "searched_path": relative_path_to_search,
-                            "absolute_path": absolute_path,
-                            "relative_path": relative_path,
-                            "modification_time": modification_time,
-                        }
-                    )
+
+        for absolute_path, relative_path, entry in _scan_files(absolute_path_to_search, ""):
+            if not reobj.match(entry.name):
+                continue
+            modification_time = 0.0
+            size = mtime_ns = inode = None
+            try:
+                # On Windows the stat result of a DirEntry comes from the
+                # directory listing, without another system call. There the
+                # inode is always 0.
+                file_stat = entry.stat()
+                modification_time = file_stat.st_mtime
+                size = file_stat.st_size
+                mtime_ns = file_stat.st_mtime_ns
+                inode = file_stat.st_ino
+            except OSError:
+                fire_event(SystemErrorRetrievingModTime(path=absolute_path))
+            matching.append(
+                {
+                    "searched_path": relative_path_to_search,
+                    "absolute_path": absolute_path,
+                    "relative_path": relative_path,
+                    "modification_time": modification_time,
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                    "inode": inode,
+                }
+            )
 
     return matching
 
 
+def _scan_files(path: str, relative_path: str):
+    """Yield the absolute path, the path relative to the search path and the
+    os.DirEntry of every file under 'path', in the same order as os.walk.
+    Like os.walk, symlinks to directories aren't followed and directories
+    that can't be listed are skipped.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirectories = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirectories.append(entry)
+            continue
+        yield entry.path, os.path.join(relative_path, entry.name), entry
+    for entry in subdirectories:
+        yield from _scan_files(entry.path, os.path.join(relative_path, entry.name))
+
+
 def load_file_contents(path: str, strip: bool = True) -> str:
     path = convert_path(path)
     with open(path, "rb") as handle:
@@ -1,6 +1,7 @@
 import os
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, cast, Optional
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Tuple, cast, Optional
 
 import networkx as nx  # type: ignore
 import pickle
@@ -15,7 +16,6 @@ from dbt.contracts.graph.manifest import Manifest, UniqueID
 from dbt.contracts.graph.compiled import (
     COMPILED_TYPES,
     CompiledGenericTestNode,
-    GraphMemberNode,
     InjectedCTE,
     ManifestNode,
     NonSourceCompiledNode,
@@ -71,28 +71,14 @@ def print_compile_stats(stats):
     fire_event(FoundStats(stat_line=stat_line))
 
 
-def _node_enabled(node: ManifestNode):
-    # Disabled models are already excluded from the manifest
-    if node.resource_type == NodeType.Test and not node.config.enabled:
-        return False
-    else:
-        return True
-
-
 def _generate_stats(manifest: Manifest):
     stats: Dict[NodeType, int] = defaultdict(int)
-    for node in manifest.nodes.values():
-        if _node_enabled(node):
-            stats[node.resource_type] += 1
-
-    for source in manifest.sources.values():
-        stats[source.resource_type] += 1
-    for exposure in manifest.exposures.values():
-        stats[exposure.resource_type] += 1
-    for metric in manifest.metrics.values():
-        stats[metric.resource_type] += 1
-    for macro in manifest.macros.values():
-        stats[macro.resource_type] += 1
+    for _, summary in manifest.graph_member_summaries():
+        # Disabled models are already excluded from the manifest
+        if summary.resource_type == NodeType.Test and not summary.enabled:
+            continue
+        stats[summary.resource_type] += 1
+    stats[NodeType.Macro] += len(manifest.macros)
     return stats
 
 
@@ -122,6 +108,17 @@ def _get_tests_for_node(manifest: Manifest, unique_id: UniqueID) -> List[UniqueI
     return tests
 
 
+def _set_bits(value: int) -> Iterator[int]:
+    """Yield the indexes of the bits that are set in value, lowest first."""
+    if not value:
+        return
+    bits = bin(value)[:1:-1]
+    idx = bits.find("1")
+    while idx != -1:
+        yield idx
+        idx = bits.find("1", idx + 1)
+
+
 class Linker:
     def __init__(self, data=None):
         if data is None:
@@ -389,26 +386,20 @@ class Compiler:
         if flags.WRITE_JSON:
             linker.write_graph(graph_path, manifest)
 
-    def link_node(self, linker: Linker, node: GraphMemberNode, manifest: Manifest):
-        linker.add_node(node.unique_id)
+    def link_node(self, linker: Linker, unique_id: str, manifest: Manifest):
+        linker.add_node(unique_id)
 
-        for dependency in node.depends_on_nodes:
-            if dependency in manifest.nodes:
-                linker.dependency(node.unique_id, (manifest.nodes[dependency].unique_id))
-            elif dependency in manifest.sources:
-                linker.dependency(node.unique_id, (manifest.sources[dependency].unique_id))
+        for dependency in manifest.graph_member_summary(unique_id).depends_on_nodes:
+            if dependency in manifest.nodes or dependency in manifest.sources:
+                linker.dependency(unique_id, dependency)
             else:
-                dependency_not_found(node, dependency)
+                dependency_not_found(manifest.expect(unique_id), dependency)
 
     def link_graph(self, linker: Linker, manifest: Manifest, add_test_edges: bool = False):
-        for source in manifest.sources.values():
-            linker.add_node(source.unique_id)
-        for node in manifest.nodes.values():
-            self.link_node(linker, node, manifest)
-        for exposure in manifest.exposures.values():
-            self.link_node(linker, exposure, manifest)
-        for metric in manifest.metrics.values():
-            self.link_node(linker, metric, manifest)
+        for source_id in manifest.sources:
+            linker.add_node(source_id)
+        for unique_id in chain(manifest.nodes, manifest.exposures, manifest.metrics):
+            self.link_node(linker, unique_id, manifest)
 
         cycle = linker.find_cycles()
 
@@ -439,37 +430,83 @@ class Compiler:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
-        for node_id in linker.graph:
+        # Visit the nodes in topological order, with three sets of bits for
+        # each node: the nodes upstream of it, the upstream tests whose
+        # depends_on are all upstream of it, and the other upstream tests.
+        # A node's sets start from the union of its parents', so the graph
+        # is only walked once.
+        graph = linker.graph
+        order = list(nx.topological_sort(graph))
+
+        # only nodes with children can be upstream of another node
+        node_bits: Dict[UniqueID, int] = {}
+        for node_id in order:
+            if graph.out_degree(node_id):
+                node_bits[node_id] = 1 << len(node_bits)
+        not_in_graph = 1 << len(node_bits)
+
+        test_ids: List[UniqueID] = []
+        test_indexes: Dict[UniqueID, int] = {}
+        test_depends_on: List[int] = []
+
+        # kept until all the children of a node have been visited
+        upstream: Dict[UniqueID, int] = {}
+        complete: Dict[UniqueID, int] = {}
+        incomplete: Dict[UniqueID, int] = {}
+        children_left: Dict[UniqueID, int] = {}
+
+        for node_id in order:
+            parent_ids = list(graph.predecessors(node_id))
             # If node is executable (in manifest.nodes) and does _not_
-            # represent a test, continue.
-            if (
+            # represent a test, it gets an edge from every complete upstream
+            # test
+            add_edges = (
                 node_id in manifest.nodes
-                and manifest.nodes[node_id].resource_type != NodeType.Test
-            ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
-
-                # Get all tests that depend on any upstream nodes.
-                upstream_tests = []
-                for upstream_node in upstream_nodes:
-                    upstream_tests += _get_tests_for_node(manifest, upstream_node)
-
-                for upstream_test in upstream_tests:
-                    # Get the set of all nodes that the test depends on
-                    # including the upstream_node itself. This is necessary
-                    # because tests can depend on multiple nodes (ex:
-                    # relationship tests). Test nodes do not distinguish
-                    # between what node the test is "testing" and what
-                    # node(s) it depends on.
-                    test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
-
-                    # If the set of nodes that an upstream test depends on
-                    # is a subset of all upstream nodes of the current node,
-                    # add an edge from the upstream test to the current node.
-                    if test_depends_on.issubset(upstream_nodes):
-                        linker.graph.add_edge(upstream_test, node_id)
+                and manifest.graph_member_summary(node_id).resource_type != NodeType.Test
+            )
+            if add_edges or node_id in node_bits:
+                node_upstream = 0
+                node_complete = 0
+                candidates = 0
+                for parent_id in parent_ids:
+                    node_upstream |= upstream[parent_id]
+                    node_complete |= complete[parent_id]
+                    candidates |= incomplete[parent_id]
+
+                # Tests can depend on multiple nodes (ex: relationship
+                # tests), a test is complete once all of them are upstream.
+                candidates &= ~node_complete
+                for idx in _set_bits(candidates):
+                    if not test_depends_on[idx] & ~node_upstream:
+                        node_complete |= 1 << idx
+                candidates &= ~node_complete
+
+                if add_edges:
+                    graph.add_edges_from(
+                        (test_ids[idx], node_id) for idx in _set_bits(node_complete)
+                    )
+
+            for parent_id in parent_ids:
+                children_left[parent_id] -= 1
+                if children_left[parent_id] == 0:
+                    del upstream[parent_id], complete[parent_id], incomplete[parent_id]
+                    del children_left[parent_id]
+
+            if node_id not in node_bits:
+                continue
+            for test_id in _get_tests_for_node(manifest, node_id):
+                if test_id not in test_indexes:
+                    depends_on = 0
+                    for dependency in manifest.graph_member_summary(test_id).depends_on_nodes:
+                        depends_on |= node_bits.get(dependency, not_in_graph)
+                    test_indexes[test_id] = len(test_ids)
+                    test_ids.append(test_id)
+                    test_depends_on.append(depends_on)
+                candidates |= 1 << test_indexes[test_id]
+            upstream[node_id] = node_upstream | node_bits[node_id]
+            complete[node_id] = node_complete
+            incomplete[node_id] = candidates
+            children_left[node_id] = graph.out_degree(node_id)
 
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
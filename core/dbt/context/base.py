@@ -1,6 +1,18 @@
 import json
 import os
-from typing import Any, Dict, NoReturn, Optional, Mapping
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    NoReturn,
+    Optional,
+    Mapping,
+    Tuple,
+    TypeVar,
+)
 
 from dbt import flags
 from dbt import tracking
@@ -24,6 +36,8 @@ import pytz
 import datetime
 import re
 
+T = TypeVar("T")
+
 # Contexts in dbt Core
 # Contexts are used for Jinja rendering. They include context methods,
 # executable macros, and various settings that are available in Jinja.
@@ -86,9 +100,11 @@ def get_context_modules() -> Dict[str, Dict[str, Any]]:
 
 
 class ContextMember:
-    def __init__(self, value, name=None):
+    def __init__(self, value, name=None, shared=False):
         self.name = name
         self.inner = value
+        # see BaseContext.shared_builtins
+        self.shared = shared
 
     def key(self, default):
         if self.name is None:
@@ -96,15 +112,15 @@ class ContextMember:
         return self.name
 
 
-def contextmember(value):
-    if isinstance(value, str):
-        return lambda v: ContextMember(v, name=value)
+def contextmember(value=None, shared=False):
+    if value is None or isinstance(value, str):
+        return lambda v: ContextMember(v, name=value, shared=shared)
     return ContextMember(value)
 
 
-def contextproperty(value):
-    if isinstance(value, str):
-        return lambda v: ContextMember(property(v), name=value)
+def contextproperty(value=None, shared=False):
+    if value is None or isinstance(value, str):
+        return lambda v: ContextMember(property(v), name=value, shared=shared)
     return ContextMember(property(value))
 
 
@@ -112,24 +128,57 @@ class ContextMeta(type):
     def __new__(mcls, name, bases, dct):
         context_members = {}
         context_attrs = {}
+        shared_members = set()
         new_dct = {}
 
         for base in bases:
             context_members.update(getattr(base, "_context_members_", {}))
             context_attrs.update(getattr(base, "_context_attrs_", {}))
+            shared_members.update(getattr(base, "_shared_context_members_", ()))
 
         for key, value in dct.items():
             if isinstance(value, ContextMember):
                 context_key = value.key(key)
                 context_members[context_key] = value.inner
                 context_attrs[context_key] = key
+                # a member that overrides a shared one isn't shared unless
+                # it says so
+                if value.shared:
+                    shared_members.add(context_key)
+                else:
+                    shared_members.discard(context_key)
                 value = value.inner
             new_dct[key] = value
         new_dct["_context_members_"] = context_members
         new_dct["_context_attrs_"] = context_attrs
+        new_dct["_shared_context_members_"] = frozenset(shared_members)
+        new_dct["_node_context_members_"] = {
+            key: value for key, value in context_members.items() if key not in shared_members
+        }
         return type.__new__(mcls, name, bases, new_dct)
 
 
+# The layers of shared context values that don't depend on a config, by key
+_STATIC_LAYERS: Dict[Hashable, Any] = {}
+# The config the shared layers were last built for, and the layers. Only
+# the layers of one config are kept, which is the config of the invocation.
+_config_layers: Tuple[Any, Dict[Hashable, Any]] = (None, {})
+
+
+def get_context_layers(owner: Any) -> Dict[Hashable, Any]:
+    """Return the shared context values of the contexts built for the owner,
+    a config, or the ones that don't depend on a config if it's None.
+    """
+    global _config_layers
+    if owner is None:
+        return _STATIC_LAYERS
+    current_owner, layers = _config_layers
+    if current_owner is not owner:
+        layers = {}
+        _config_layers = (owner, layers)
+    return layers
+
+
 class Var:
     UndefinedVarError = "Required var '{}' not found in config:\nVars " "supplied to {} = {}"
     _VAR_NOTSET = object()
@@ -139,10 +188,13 @@ class Var:
         context: Mapping[str, Any],
         cli_vars: Mapping[str, Any],
         node: Optional[CompiledResource] = None,
+        on_read: Optional[Callable[[str], None]] = None,
     ) -> None:
         self._context: Mapping[str, Any] = context
         self._cli_vars: Mapping[str, Any] = cli_vars
         self._node: Optional[CompiledResource] = node
+        # called with the name of every var that's looked up
+        self._on_read: Optional[Callable[[str], None]] = on_read
         self._merged: Mapping[str, Any] = self._generate_merged()
 
     def _generate_merged(self) -> Mapping[str, Any]:
@@ -172,7 +224,12 @@ class Var:
 
         return get_rendered(raw, self._context)
 
+    def record_read(self, var_name: str) -> None:
+        if self._on_read is not None:
+            self._on_read(var_name)
+
     def __call__(self, var_name, default=_VAR_NOTSET):
+        self.record_read(var_name)
         if self.has_var(var_name):
             return self.get_rendered_var(var_name)
         elif default is not self._VAR_NOTSET:
@@ -182,19 +239,59 @@ class Var:
 
 
 class BaseContext(metaclass=ContextMeta):
+    # set by ContextMeta
+    _context_members_: Dict[str, Any]
+    _context_attrs_: Dict[str, str]
+    _shared_context_members_: FrozenSet[str]
+    _node_context_members_: Dict[str, Any]
+
     # subclass is TargetContext
     def __init__(self, cli_vars):
         self._ctx = {}
         self.cli_vars = cli_vars
         self.env_vars = {}
 
-    def generate_builtins(self):
-        builtins: Dict[str, Any] = {}
-        for key, value in self._context_members_.items():
+    def _member_values(self, members: Mapping[str, Any]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for key, value in members.items():
             if hasattr(value, "__get__"):
                 # handle properties, bound methods, etc
                 value = value.__get__(self)
-            builtins[key] = value
+            values[key] = value
+        return values
+
+    def _shared_layer_owner(self) -> Any:
+        # The shared members of a BaseContext don't depend on its arguments
+        return None
+
+    def _shared_layer_key(self) -> Hashable:
+        return type(self)
+
+    def shared_value(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Return the value for the key that's shared by every context built
+        for the same owner, building it the first time.
+        """
+        layers = get_context_layers(self._shared_layer_owner())
+        if key not in layers:
+            layers[key] = build()
+        return layers[key]
+
+    def shared_builtins(self) -> Mapping[str, Any]:
+        """The values of the members declared with `shared=True`. They're the
+        same for every context with the same shared layer owner and key, so
+        they're only computed for the first one, and the other contexts copy
+        them instead.
+        """
+        return self.shared_value(
+            ("builtins", self._shared_layer_key()),
+            lambda: self._member_values(
+                {key: self._context_members_[key] for key in self._shared_context_members_}
+            ),
+        )
+
+    def generate_builtins(self):
+        builtins: Dict[str, Any] = dict(self.shared_builtins())
+        builtins.update(self._member_values(self._node_context_members_))
         return builtins
 
     # no dbtClassMixin so this is not an actual override
@@ -205,7 +302,7 @@ class BaseContext(metaclass=ContextMeta):
         self._ctx.update(builtins)
         return self._ctx
 
-    @contextproperty
+    @contextproperty(shared=True)
     def dbt_version(self) -> str:
         """The `dbt_version` variable returns the installed version of dbt that
         is currently running. It can be used for debugging or auditing
@@ -318,7 +415,7 @@ class BaseContext(metaclass=ContextMeta):
 
     if os.environ.get("DBT_MACRO_DEBUGGING"):
 
-        @contextmember
+        @contextmember(shared=True)
         @staticmethod
         def debug():
             """Enter a debugger at this line in the compiled jinja code."""
@@ -329,7 +426,7 @@ class BaseContext(metaclass=ContextMeta):
             ipdb.set_trace(frame)
             return ""
 
-    @contextmember("return")
+    @contextmember("return", shared=True)
     @staticmethod
     def _return(data: Any) -> NoReturn:
         """The `return` function can be used in macros to return data to the
@@ -357,7 +454,7 @@ class BaseContext(metaclass=ContextMeta):
         """
         raise MacroReturn(data)
 
-    @contextmember
+    @contextmember(shared=True)
     @staticmethod
     def fromjson(string: str, default: Any = None) -> Any:
         """The `fromjson` context method can be used to deserialize a json
@@ -378,7 +475,7 @@ class BaseContext(metaclass=ContextMeta):
         except ValueError:
             return default
 
-    @contextmember
+    @contextmember(shared=True)
     @staticmethod
     def tojson(value: Any, default: Any = None, sort_keys: bool = False) -> Any:
         """The `tojson` context method can be used to serialize a Python
@@ -401,7 +498,7 @@ class BaseContext(metaclass=ContextMeta):
         except ValueError:
             return default
 
-    @contextmember
+    @contextmember(shared=True)
     @staticmethod
     def fromyaml(value: str, default: Any = None) -> Any:
         """The fromyaml context method can be used to deserialize a yaml string
@@ -432,7 +529,7 @@ class BaseContext(metaclass=ContextMeta):
 
     # safe_dump defaults to sort_keys=True, but we act like json.dumps (the
     # opposite)
-    @contextmember
+    @contextmember(shared=True)
     @staticmethod
     def toyaml(
         value: Any, default: Optional[str] = None, sort_keys: bool = False
@@ -457,7 +554,7 @@ class BaseContext(metaclass=ContextMeta):
         except (ValueError, yaml.YAMLError):
             return default
 
-    @contextmember
+    @contextmember(shared=True)
     @staticmethod
     def log(msg: str, info: bool = False) -> str:
         """Logs a line to either the log file or stdout.
@@ -513,8 +610,8 @@ class BaseContext(metaclass=ContextMeta):
         """
         return get_invocation_id()
 
-    @contextproperty
-    def modules(self) -> Dict[str, Any]:
+    @contextproperty(shared=True)
+    def modules(self) -> Mapping[str, Mapping[str, Any]]:
         """The `modules` variable in the Jinja context contains useful Python
         modules for operating on data.
 
@@ -536,9 +633,12 @@ class BaseContext(metaclass=ContextMeta):
             {% set dt_local = modules.pytz.timezone('US/Eastern').localize(dt) %}
             {{ dt_local }}
         """  # noqa
-        return get_context_modules()
+        # every context shares the same modules, so they're read-only
+        return MappingProxyType(
+            {name: MappingProxyType(module) for name, module in get_context_modules().items()}
+        )
 
-    @contextproperty
+    @contextproperty(shared=True)
     def flags(self) -> Any:
         """The `flags` variable contains true/false values for flags provided
         on the command line.
@@ -556,7 +656,7 @@ class BaseContext(metaclass=ContextMeta):
         """
         return flags
 
-    @contextmember
+    @contextmember(shared=True)
     @staticmethod
     def print(msg: str) -> str:
         """Prints a line to stdout.
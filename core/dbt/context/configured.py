@@ -1,5 +1,6 @@
+import copy
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set
 
 from dbt.contracts.connection import AdapterRequiredConfig
 from dbt.logger import SECRET_ENV_PREFIX
@@ -7,7 +8,7 @@ from dbt.node_types import NodeType
 from dbt.utils import MultiDict
 
 from dbt.context.base import contextproperty, contextmember, Var
-from dbt.context.target import TargetContext
+from dbt.context.target import ParseTarget, TargetContext
 from dbt.exceptions import raise_parsing_error, disallow_secret_env_var
 
 
@@ -18,7 +19,10 @@ class ConfiguredContext(TargetContext):
     def __init__(self, config: AdapterRequiredConfig) -> None:
         super().__init__(config, config.cli_vars)
 
-    @contextproperty
+    def _shared_layer_owner(self) -> Any:
+        return self.config
+
+    @contextproperty(shared=True)
     def project_name(self) -> str:
         return self.config.project_name
 
@@ -36,12 +40,14 @@ class ConfiguredVar(Var):
         context: Dict[str, Any],
         config: AdapterRequiredConfig,
         project_name: str,
+        on_read: Optional[Callable[[str], None]] = None,
     ):
-        super().__init__(context, config.cli_vars)
+        super().__init__(context, config.cli_vars, on_read=on_read)
         self._config = config
         self._project_name = project_name
 
     def __call__(self, var_name, default=Var._VAR_NOTSET):
+        self.record_read(var_name)
         my_config = self._config.load_dependencies()[self._project_name]
 
         # cli vars > active project > local project
@@ -68,7 +74,17 @@ class ConfiguredVar(Var):
 class SchemaYamlVars:
     def __init__(self):
         self.env_vars = {}
-        self.vars = {}
+        self.vars: Set[str] = set()
+        self.target_keys: Set[str] = set()
+
+    def clear(self):
+        # the sets are bound into the rendering context, so clear them in place
+        self.env_vars = {}
+        self.vars.clear()
+        self.target_keys.clear()
+
+    def is_empty(self) -> bool:
+        return not (self.env_vars or self.vars or self.target_keys)
 
 
 class SchemaYamlContext(ConfiguredContext):
@@ -80,7 +96,17 @@ class SchemaYamlContext(ConfiguredContext):
 
     @contextproperty
     def var(self) -> ConfiguredVar:
-        return ConfiguredVar(self._ctx, self.config, self._project_name)
+        on_read = self.schema_yaml_vars.vars.add if self.schema_yaml_vars is not None else None
+        return ConfiguredVar(self._ctx, self.config, self._project_name, on_read=on_read)
+
+    @contextproperty
+    def target(self) -> Dict[str, Any]:
+        # Every context gets its own copy of the dictionary, but it's only
+        # built from the config once
+        target = self.shared_value("target", self.config.to_target_dict)
+        if self.schema_yaml_vars is not None:
+            return ParseTarget(target, self.schema_yaml_vars.target_keys.add)
+        return copy.copy(target)
 
     @contextmember
     def env_var(self, var: str, default: Optional[str] = None) -> str:
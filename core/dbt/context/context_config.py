@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import List, Iterator, Dict, Any, TypeVar, Generic
 
 from dbt.config import RuntimeConfig, Project, IsFQNResource
+from dbt.context.base import get_context_layers
 from dbt.contracts.graph.model_config import BaseConfig, get_config_for
 from dbt.exceptions import InternalException
 from dbt.node_types import NodeType
@@ -70,6 +71,18 @@ class RenderedConfig(ConfigSource):
         return model_configs
 
 
+class FqnConfigLayer(Generic[T]):
+    """The initial result of a config generator, merged with each level of
+    a project's config tree along an fqn prefix. The layers for the longer
+    prefixes are its children, by the next fqn level.
+    """
+
+    def __init__(self, result: T, level_config: Dict[str, Any]) -> None:
+        self.result = result
+        self.level_config = level_config
+        self.children: Dict[str, "FqnConfigLayer[T]"] = {}
+
+
 class BaseContextConfigGenerator(Generic[T]):
     def __init__(self, active_project: RuntimeConfig):
         self._active_project = active_project
@@ -88,20 +101,57 @@ class BaseContextConfigGenerator(Generic[T]):
             )
         return dependencies[project_name]
 
+    @staticmethod
+    def _level_config(level_config: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for key, value in level_config.items():
+            if key.startswith("+"):
+                result[key[1:].strip()] = deepcopy(value)
+            elif not isinstance(value, dict):
+                result[key] = deepcopy(value)
+        return result
+
     def _project_configs(
         self, project: Project, fqn: List[str], resource_type: NodeType
     ) -> Iterator[Dict[str, Any]]:
         src = self.get_config_source(project)
         model_configs = src.get_config_dict(resource_type)
         for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith("+"):
-                    result[key[1:].strip()] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
+            yield self._level_config(level_config)
+
+    def _merged_project_configs(
+        self, project: Project, fqn: List[str], resource_type: NodeType, base: bool
+    ) -> T:
+        """Return the initial result updated from the configs of each level
+        of the project's config tree along the fqn.
+
+        The merged layer for every fqn prefix is kept with the shared context
+        layers of the active project, so nodes that share a prefix only merge
+        the levels below it. Each node gets a deep copy of its layer, so it
+        can't change the nested values of the layer or its siblings.
+        """
+        model_configs = self.get_config_source(project).get_config_dict(resource_type)
+        layers = get_context_layers(self._active_project)
+        key = ("fqn_configs", type(self), project.project_name, resource_type, base)
+        layer = layers.get(key)
+        if layer is None or layer.level_config is not model_configs:
+            result = self.initial_result(resource_type=resource_type, base=base)
+            result = self._update_from_config(result, self._level_config(model_configs))
+            layer = FqnConfigLayer(result, model_configs)
+            layers[key] = layer
+        for level in fqn:
+            child = layer.children.get(level)
+            if child is None:
+                level_config = layer.level_config.get(level, None)
+                if not isinstance(level_config, dict):
+                    break
+                result = self._update_from_config(
+                    self._copy_result(layer.result), self._level_config(level_config)
+                )
+                child = FqnConfigLayer(result, level_config)
+                layer.children[level] = child
+            layer = child
+        return deepcopy(layer.result)
 
     def _active_project_configs(
         self, fqn: List[str], resource_type: NodeType
@@ -112,6 +162,11 @@ class BaseContextConfigGenerator(Generic[T]):
     def _update_from_config(self, result: T, partial: Dict[str, Any], validate: bool = False) -> T:
         ...
 
+    def _copy_result(self, result: T) -> T:
+        # the merged layers are shared, so a layer is copied before it's
+        # updated to build the next one
+        return deepcopy(result)
+
     @abstractmethod
     def initial_result(self, resource_type: NodeType, base: bool) -> T:
         ...
@@ -127,11 +182,7 @@ class BaseContextConfigGenerator(Generic[T]):
     ) -> BaseConfig:
         own_config = self.get_node_project(project_name)
 
-        result = self.initial_result(resource_type=resource_type, base=base)
-
-        project_configs = self._project_configs(own_config, fqn, resource_type)
-        for fqn_config in project_configs:
-            result = self._update_from_config(result, fqn_config)
+        result = self._merged_project_configs(own_config, fqn, resource_type, base)
 
         # When schema files patch config, it has lower precedence than
         # config in the models (config_call_dict), so we add the patch_config_dict
@@ -186,6 +237,11 @@ class ContextConfigGenerator(BaseContextConfigGenerator[C]):
             translated, self._active_project.credentials.type, validate=validate
         )
 
+    def _copy_result(self, result: C) -> C:
+        # update_from returns a new config and doesn't change this one, so
+        # the next layer can be built from it without a copy
+        return result
+
     def calculate_node_config_dict(
         self,
         config_call_dict: Dict[str, Any],
@@ -1,16 +1,31 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from dbt.exceptions import (
     doc_invalid_args,
     doc_target_not_found,
 )
 from dbt.config.runtime import RuntimeConfig
+from dbt.contracts.files import SchemaSourceFile
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.contracts.graph.parsed import ParsedMacro, ParsedSourceDefinition
+from dbt.node_types import NodeType
 
-from dbt.context.base import contextmember
-from dbt.context.configured import SchemaYamlContext
+from dbt.context.base import contextmember, contextproperty
+from dbt.context.configured import ConfiguredVar, SchemaYamlContext
+from dbt.context.target import ParseTarget
+
+# The schema file keys that the descriptions of each resource type are in
+DESCRIPTION_YAML_KEYS = {
+    NodeType.Model: "models",
+    NodeType.Seed: "seeds",
+    NodeType.Snapshot: "snapshots",
+    NodeType.Analysis: "analyses",
+    NodeType.Macro: "macros",
+    NodeType.Source: "sources",
+    NodeType.Exposure: "exposures",
+    NodeType.Metric: "metrics",
+}
 
 
 class DocsRuntimeContext(SchemaYamlContext):
@@ -25,6 +40,51 @@ class DocsRuntimeContext(SchemaYamlContext):
         self.node = node
         self.manifest = manifest
 
+    @contextproperty
+    def var(self) -> ConfiguredVar:
+        return ConfiguredVar(self._ctx, self.config, self._project_name, on_read=self.record_var)
+
+    @contextproperty
+    def target(self) -> Dict[str, Any]:
+        target = self.shared_value("target", self.config.to_target_dict)
+        return ParseTarget(target, self.record_target_key)
+
+    def _schema_file_entry(self) -> Optional[Tuple[SchemaSourceFile, str, str]]:
+        # Reads of vars and of the target while rendering descriptions are
+        # saved with the schema file entry the descriptions come from, so
+        # partial parsing parses the entry again when they change.
+        yaml_key = DESCRIPTION_YAML_KEYS.get(self.node.resource_type)
+        if yaml_key is None:
+            return None
+        name = self.node.name
+        if isinstance(self.node, ParsedSourceDefinition):
+            file_id: Optional[str] = self.node.file_id
+            name = self.node.source_name
+        elif self.node.resource_type in (NodeType.Exposure, NodeType.Metric):
+            file_id = self.node.file_id
+        else:
+            # models, seeds, snapshots, analyses and macros are described
+            # by a patch
+            file_id = getattr(self.node, "patch_path", None)
+        if file_id is None:
+            return None
+        source_file = self.manifest.files.get(file_id)
+        if not isinstance(source_file, SchemaSourceFile):
+            return None
+        return source_file, yaml_key, name
+
+    def record_var(self, var_name: str) -> None:
+        entry = self._schema_file_entry()
+        if entry is not None:
+            (source_file, yaml_key, name) = entry
+            source_file.add_var(var_name, yaml_key, name)
+
+    def record_target_key(self, key: str) -> None:
+        entry = self._schema_file_entry()
+        if entry is not None:
+            (source_file, yaml_key, name) = entry
+            source_file.add_target_key(key, yaml_key, name)
+
     @contextmember
     def doc(self, *args: str) -> str:
         """The `doc` function is used to reference docs blocks in schema.yml
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set
+from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Tuple
+
+import jinja2
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.parsed import ParsedMacro
@@ -6,81 +8,249 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.exceptions import raise_duplicate_macro_name, raise_compiler_error
 
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = Mapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
 FullNamespace = Dict[str, NamespaceMember]
+PackageMacros = Dict[str, ParsedMacro]
+
+# The key in a ManifestContext's dictionary that holds its MacroNamespace,
+# which the MacroProxy objects in the same dictionary call macros through
+MACRO_NAMESPACE_KEY = "_macro_namespace"
+
+
+# A MacroProxy stands in for a macro in the dictionaries that jinja renders
+# with. It's shared by every context that's built from the same MacroIndex,
+# so building a context doesn't create anything per macro. Jinja calls it
+# with the context it's rendering in, and it calls the MacroGenerator bound
+# to that context's namespace.
+class MacroProxy:
+    def __init__(self, macro: ParsedMacro) -> None:
+        self.macro = macro
+
+    @jinja2.contextfunction
+    def __call__(self, context, *args, **kwargs):
+        namespace: Optional[MacroNamespace] = context.get(MACRO_NAMESPACE_KEY)
+        if namespace is None:
+            raise_compiler_error(
+                f"The macro '{self.macro.name}' was called outside of the context it belongs to",
+                self.macro,
+            )
+        return namespace.bind(self.macro)(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<MacroProxy {self.macro.unique_id}>"
+
+
+# A MacroIndex holds the macros in a manifest by package and name, and
+# computes the lookups a MacroNamespace makes once for each search package.
+# ManifestContexts get the index for their manifest from get_macro_index, so
+# it's built once and shared by every context built from the manifest.
+class MacroIndex:
+    def __init__(self, root_package: str, internal_packages: List[str]) -> None:
+        self.root_package = root_package
+        # internal packages comes from get_adapter_package_names
+        self.internal_package_names = set(internal_packages)
+        self.internal_package_names_order = internal_packages
+        # [package name][macro name] = ParsedMacro
+        self.internal_packages: Dict[str, PackageMacros] = {}
+        self.packages: Dict[str, PackageMacros] = {}
+        self._global_project: Optional[PackageMacros] = None
+        # [search package][key] = ParsedMacro, or the package name for
+        # the keys that are packages
+        self._members: Dict[str, Dict[str, Union[ParsedMacro, str]]] = {}
+        self._context_members: Dict[str, Dict[str, Any]] = {}
+        self._package_proxies: Dict[str, Dict[str, MacroProxy]] = {}
+        # the mapping and size of the manifest's macros the index was built
+        # from, see is_current
+        self.source: Optional[Mapping[str, ParsedMacro]] = None
+        self.source_size = 0
+
+    def add_macro(self, macro: ParsedMacro) -> None:
+        # internal macros (from plugins) will be processed separately from
+        # project macros, so store them in a different place
+        if macro.package_name in self.internal_package_names:
+            hierarchy = self.internal_packages
+        else:
+            hierarchy = self.packages
+        namespace = hierarchy.setdefault(macro.package_name, {})
+        if macro.name in namespace:
+            raise_duplicate_macro_name(namespace[macro.name], macro, macro.package_name)
+        namespace[macro.name] = macro
+        self._global_project = None
+        self._members.clear()
+        self._context_members.clear()
+        self._package_proxies.clear()
+
+    def add_macros(self, macros: Iterable[ParsedMacro]) -> None:
+        for macro in macros:
+            self.add_macro(macro)
+
+    def is_current(self, macros: Mapping[str, ParsedMacro]) -> bool:
+        return self.source is macros and self.source_size == len(macros)
+
+    @property
+    def global_project(self) -> PackageMacros:
+        if self._global_project is None:
+            # Iterate in reverse-order and overwrite: the packages that are
+            # first in the list are the ones we want to "win".
+            global_project: PackageMacros = {}
+            for pkg in reversed(self.internal_package_names_order):
+                if pkg in self.internal_packages:
+                    global_project.update(self.internal_packages[pkg])
+            self._global_project = global_project
+        return self._global_project
+
+    def package_macros(self, package_name: str) -> Optional[PackageMacros]:
+        if package_name == GLOBAL_PROJECT_NAME:
+            return self.global_project
+        return self.packages.get(package_name)
+
+    def members(self, search_package: str) -> Dict[str, Union[ParsedMacro, str]]:
+        """The keys a MacroNamespace for the search package has. The search
+        order is the local package, the root package, the non-internal
+        packages by name, the dbt package, then the internal packages, so
+        the members are added in reverse and the first in the order wins.
+        """
+        members = self._members.get(search_package)
+        if members is None:
+            members = dict(self.global_project)
+            members[GLOBAL_PROJECT_NAME] = GLOBAL_PROJECT_NAME
+            members.update((pkg, pkg) for pkg in self.packages)
+            # the root package acts as a "global" namespace, overriding
+            # everything else except local external package macro calls
+            members.update(self.packages.get(self.root_package, {}))
+            members.update(self.packages.get(search_package, {}))
+            self._members[search_package] = members
+        return members
+
+    def package_proxies(self, package_name: str) -> Dict[str, MacroProxy]:
+        proxies = self._package_proxies.get(package_name)
+        if proxies is None:
+            macros = self.package_macros(package_name) or {}
+            proxies = {name: MacroProxy(macro) for name, macro in macros.items()}
+            self._package_proxies[package_name] = proxies
+        return proxies
+
+    def context_members(self, search_package: str) -> Dict[str, Any]:
+        """The members for the search package as they're added to a
+        context's dictionary, with a MacroProxy for every macro.
+        """
+        context_members = self._context_members.get(search_package)
+        if context_members is None:
+            context_members = {}
+            for key, member in self.members(search_package).items():
+                if isinstance(member, str):
+                    context_members[key] = self.package_proxies(member)
+                else:
+                    context_members[key] = MacroProxy(member)
+            self._context_members[search_package] = context_members
+        return context_members
+
+
+def get_macro_index(manifest: Any, root_package: str, internal_packages: List[str]) -> MacroIndex:
+    """Return the MacroIndex of the manifest's macros, building it if the
+    macros changed since it was last built.
+    """
+    key: Tuple[str, Tuple[str, ...]] = (root_package, tuple(internal_packages))
+    indexes: Optional[Dict[Tuple[str, Tuple[str, ...]], MacroIndex]]
+    indexes = vars(manifest).get("_macro_indexes")
+    if indexes is None:
+        indexes = {}
+        manifest._macro_indexes = indexes
+    index = indexes.get(key)
+    if index is None or not index.is_current(manifest.macros):
+        index = MacroIndex(root_package, internal_packages)
+        index.add_macros(manifest.macros.values())
+        index.source = manifest.macros
+        index.source_size = len(manifest.macros)
+        indexes[key] = index
+    return index
+
+
+# The macros of one package in a MacroNamespace, bound when they're looked up
+class PackageNamespace(Mapping):
+    def __init__(self, namespace: "MacroNamespace", macros: PackageMacros) -> None:
+        self.namespace = namespace
+        self.macros = macros
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.macros)
+
+    def __len__(self) -> int:
+        return len(self.macros)
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        return self.namespace.bind(self.macros[key])
 
 
-# The point of this class is to collect the various macros
-# and provide the ability to flatten them into the ManifestContexts
-# that are created for jinja, so that macro calls can be resolved.
-# Creates special iterators and _keys methods to flatten the lists.
-# When this class is created it has a static 'local_namespace' which
-# depends on the package of the node, so it only works for one
-# particular local package at a time for "flattening" into a context.
-# 'get_by_package' should work for any macro.
+# The point of this class is to resolve the macros in a MacroIndex for the
+# package of one node, and provide the ability to flatten them into the
+# ManifestContexts that are created for jinja, so that macro calls can be
+# resolved. The keys come from the index, and a MacroGenerator is only bound
+# to the node's context when a macro is looked up, or called through the
+# MacroProxy objects that ManifestContext.to_dict adds to the context.
+# 'get_from_package' should work for any macro.
 class MacroNamespace(Mapping):
     def __init__(
         self,
-        global_namespace: FlatNamespace,  # root package macros
-        local_namespace: FlatNamespace,  # packages for *this* node
-        global_project_namespace: FlatNamespace,  # internal packages
-        packages: Dict[str, FlatNamespace],  # non-internal packages
+        index: MacroIndex,
+        search_package: str,
+        ctx: Dict[str, Any],
+        node: Optional[Any] = None,
+        thread_ctx: Optional[MacroStack] = None,
     ):
-        self.global_namespace: FlatNamespace = global_namespace
-        self.local_namespace: FlatNamespace = local_namespace
-        self.packages: Dict[str, FlatNamespace] = packages
-        self.global_project_namespace: FlatNamespace = global_project_namespace
-
-    def _search_order(self) -> Iterable[Union[FullNamespace, FlatNamespace]]:
-        yield self.local_namespace  # local package
-        yield self.global_namespace  # root package
-        # TODO CT-211
-        yield self.packages  # type: ignore[misc] # non-internal packages
-        yield {
-            # TODO CT-211
-            GLOBAL_PROJECT_NAME: self.global_project_namespace,  # type: ignore[misc] # dbt
-        }
-        yield self.global_project_namespace  # other internal project besides dbt
-
-    # provides special keys method for MacroNamespace iterator
-    # returns keys from local_namespace, global_namespace, packages,
-    # global_project_namespace
-    def _keys(self) -> Set[str]:
-        keys: Set[str] = set()
-        for search in self._search_order():
-            keys.update(search)
-        return keys
-
-    # special iterator using special keys
+        self.index = index
+        self.search_package = search_package
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        self._members = index.members(search_package)
+        # [macro unique id] = MacroGenerator, so each macro is bound once
+        self._generators: Dict[str, MacroGenerator] = {}
+
+    def bind(self, macro: ParsedMacro) -> MacroGenerator:
+        # MacroGenerator is in clients/jinja.py
+        # a MacroGenerator object is a callable object that will
+        # execute the MacroGenerator.__call__ function
+        macro_func = self._generators.get(macro.unique_id)
+        if macro_func is None:
+            macro_func = MacroGenerator(macro, self.ctx, self.node, self.thread_ctx)
+            self._generators[macro.unique_id] = macro_func
+        return macro_func
+
+    def context_members(self) -> Dict[str, Any]:
+        return self.index.context_members(self.search_package)
+
     def __iter__(self) -> Iterator[str]:
-        for key in self._keys():
-            yield key
+        return iter(self._members)
 
     def __len__(self):
-        return len(self._keys())
+        return len(self._members)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._members
 
     def __getitem__(self, key: str) -> NamespaceMember:
-        for dct in self._search_order():
-            if key in dct:
-                return dct[key]
-        raise KeyError(key)
+        member = self._members[key]
+        if isinstance(member, str):
+            return PackageNamespace(self, self.index.package_macros(member) or {})
+        return self.bind(member)
 
     def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroGenerator]:
-        pkg: FlatNamespace
         if package_name is None:
-            return self.get(name)
-        elif package_name == GLOBAL_PROJECT_NAME:
-            return self.global_project_namespace.get(name)
-        elif package_name in self.packages:
-            return self.packages[package_name].get(name)
-        else:
+            return self.get(name)  # type: ignore[return-value]
+        macros = self.index.package_macros(package_name)
+        if macros is None:
             raise_compiler_error(f"Could not find package '{package_name}'")
+        macro = macros.get(name)
+        if macro is None:
+            return None
+        return self.bind(macro)
 
 
-# This class builds the MacroNamespace by adding macros to
-# internal_packages or packages, and locals/globals.
-# Call 'build_namespace' to return a MacroNamespace.
+# This class builds the MacroNamespace by adding macros to a MacroIndex.
+# Call 'build_namespace' to return a MacroNamespace, or
+# 'build_manifest_namespace' for one from the manifest's cached MacroIndex.
 # This is used by ManifestContext (and subclasses)
 class MacroNamespaceBuilder:
     def __init__(
@@ -93,80 +263,27 @@ class MacroNamespaceBuilder:
     ) -> None:
         self.root_package = root_package
         self.search_package = search_package
-        # internal packages comes from get_adapter_package_names
-        self.internal_package_names = set(internal_packages)
-        self.internal_package_names_order = internal_packages
-        # macro_func is added here if in root package, since
-        # the root package acts as a "global" namespace, overriding
-        # everything else except local external package macro calls
-        self.globals: FlatNamespace = {}
-        # macro_func is added here if it's the package for this node
-        self.locals: FlatNamespace = {}
-        # Create a dictionary of [package name][macro name] =
-        #     MacroGenerator object which acts like a function
-        self.internal_packages: Dict[str, FlatNamespace] = {}
-        self.packages: Dict[str, FlatNamespace] = {}
+        self.internal_packages = internal_packages
+        self.index = MacroIndex(root_package, internal_packages)
         self.thread_ctx = thread_ctx
         self.node = node
 
-    def _add_macro_to(
-        self,
-        hierarchy: Dict[str, FlatNamespace],
-        macro: ParsedMacro,
-        macro_func: MacroGenerator,
-    ):
-        if macro.package_name in hierarchy:
-            namespace = hierarchy[macro.package_name]
-        else:
-            namespace = {}
-            hierarchy[macro.package_name] = namespace
-
-        if macro.name in namespace:
-            raise_duplicate_macro_name(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
-
+    # the macros are bound to the ctx that's passed to build_namespace
     def add_macro(self, macro: ParsedMacro, ctx: Dict[str, Any]):
-        macro_name: str = macro.name
-
-        # MacroGenerator is in clients/jinja.py
-        # a MacroGenerator object is a callable object that will
-        # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
-
-        # internal macros (from plugins) will be processed separately from
-        # project macros, so store them in a different place
-        if macro.package_name in self.internal_package_names:
-            self._add_macro_to(self.internal_packages, macro, macro_func)
-        else:
-            # if it's not an internal package
-            self._add_macro_to(self.packages, macro, macro_func)
-            # add to locals if it's the package this node is in
-            if macro.package_name == self.search_package:
-                self.locals[macro_name] = macro_func
-            # add to globals if it's in the root package
-            elif macro.package_name == self.root_package:
-                self.globals[macro_name] = macro_func
+        self.index.add_macro(macro)
 
     def add_macros(self, macros: Iterable[ParsedMacro], ctx: Dict[str, Any]):
-        for macro in macros:
-            self.add_macro(macro, ctx)
+        self.index.add_macros(macros)
+
+    def _namespace(self, index: MacroIndex, ctx: Dict[str, Any]) -> MacroNamespace:
+        return MacroNamespace(index, self.search_package, ctx, self.node, self.thread_ctx)
 
     def build_namespace(
         self, macros: Iterable[ParsedMacro], ctx: Dict[str, Any]
     ) -> MacroNamespace:
         self.add_macros(macros, ctx)
+        return self._namespace(self.index, ctx)
 
-        # Iterate in reverse-order and overwrite: the packages that are first
-        # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
-        for pkg in reversed(self.internal_package_names_order):
-            if pkg in self.internal_packages:
-                # add the macros pointed to by this package name
-                global_project_namespace.update(self.internal_packages[pkg])
-
-        return MacroNamespace(
-            global_namespace=self.globals,  # root package macros
-            local_namespace=self.locals,  # packages for *this* node
-            global_project_namespace=global_project_namespace,  # internal packages
-            packages=self.packages,  # non internal_packages
-        )
+    def build_manifest_namespace(self, manifest: Any, ctx: Dict[str, Any]) -> MacroNamespace:
+        index = get_macro_index(manifest, self.root_package, self.internal_packages)
+        return self._namespace(index, ctx)
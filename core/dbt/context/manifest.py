@@ -7,7 +7,7 @@ from dbt.context.macro_resolver import TestMacroNamespace
 
 
 from .configured import ConfiguredContext
-from .macros import MacroNamespaceBuilder
+from .macros import MACRO_NAMESPACE_KEY, MacroNamespaceBuilder
 
 
 class ManifestContext(ConfiguredContext):
@@ -36,10 +36,10 @@ class ManifestContext(ConfiguredContext):
         self.namespace = self._build_namespace()
 
     def _build_namespace(self):
-        # this takes all the macros in the manifest and adds them
-        # to the MacroNamespaceBuilder stored in self.namespace
+        # this resolves the macros in the manifest through the MacroIndex
+        # the manifest keeps for the MacroNamespaceBuilder's packages
         builder = self._get_namespace_builder()
-        return builder.build_namespace(self.manifest.macros.values(), self._ctx)
+        return builder.build_manifest_namespace(self.manifest, self._ctx)
 
     def _get_namespace_builder(self) -> MacroNamespaceBuilder:
         # avoid an import loop
@@ -63,7 +63,10 @@ class ManifestContext(ConfiguredContext):
             dct.update(self.namespace.local_namespace)
             dct.update(self.namespace.project_namespace)
         else:
-            dct.update(self.namespace)
+            # the macros are MacroProxy objects that call the macro through
+            # the namespace, which binds it to this context
+            dct.update(self.namespace.context_members())
+            dct[MACRO_NAMESPACE_KEY] = self.namespace
         return dct
 
 
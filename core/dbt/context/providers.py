@@ -1,9 +1,12 @@
 import abc
+import copy
 import os
+from types import MappingProxyType
 from typing import (
     Callable,
     Any,
     Dict,
+    Hashable,
     Optional,
     Union,
     List,
@@ -19,14 +22,16 @@ from dbt.adapters.factory import get_adapter, get_adapter_package_names, get_ada
 from dbt.clients import agate_helper
 from dbt.clients.jinja import get_rendered, MacroGenerator, MacroStack
 from dbt.config import RuntimeConfig, Project
-from .base import contextmember, contextproperty, Var
+from .base import contextmember, contextproperty, get_context_layers, Var
 from .configured import FQNLookup
 from .context_config import ContextConfig
 from dbt.logger import SECRET_ENV_PREFIX
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from .macros import MacroNamespaceBuilder, MacroNamespace
 from .manifest import ManifestContext
+from .target import ParseTarget
 from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.files import SourceFile
 from dbt.contracts.graph.manifest import Manifest, Disabled
 from dbt.contracts.graph.compiled import (
     CompiledResource,
@@ -516,10 +521,11 @@ class ModelConfiguredVar(Var):
         context: Dict[str, Any],
         config: RuntimeConfig,
         node: CompiledResource,
+        on_read: Optional[Callable[[str], None]] = None,
     ) -> None:
         self._node: CompiledResource
         self._config: RuntimeConfig = config
-        super().__init__(context, config.cli_vars, node=node)
+        super().__init__(context, config.cli_vars, node=node, on_read=on_read)
 
     def packages_for_node(self) -> Iterable[Project]:
         dependencies = self._config.load_dependencies()
@@ -533,6 +539,15 @@ class ModelConfiguredVar(Var):
         yield self._config
 
     def _generate_merged(self) -> Mapping[str, Any]:
+        # The vars only depend on the package of the node, so they're merged
+        # once for each package, for all the contexts built for the config
+        layers = get_context_layers(self._config)
+        key = ("vars", type(self), self._node.package_name)
+        if key not in layers:
+            layers[key] = self._merge_vars()
+        return layers[key]
+
+    def _merge_vars(self) -> Mapping[str, Any]:
         search_node: IsFQNResource
         if isinstance(self._node, IsFQNResource):
             search_node = self._node
@@ -626,6 +641,10 @@ class ProviderContext(ManifestContext):
         # The macro namespace is used in creating the DatabaseWrapper
         self.db_wrapper = self.provider.DatabaseWrapper(self.adapter, self.namespace)
 
+    def _shared_layer_key(self) -> Hashable:
+        # the shared members depend on the provider and the adapter
+        return (type(self), type(self.provider), self.adapter)
+
     # This overrides the method in ManifestContext, and provides
     # a model, which the ManifestContext builder does not
     def _get_namespace_builder(self):
@@ -644,7 +663,10 @@ class ProviderContext(ManifestContext):
 
     @contextmember
     def load_result(self, name: str) -> Optional[AttrDict]:
-        return self.sql_results.get(name)
+        result = self.sql_results.get(name)
+        if result is not None and "data" not in result:
+            result["data"] = agate_helper.as_matrix(result["table"])
+        return result
 
     @contextmember
     def store_result(
@@ -653,10 +675,11 @@ class ProviderContext(ManifestContext):
         if agate_table is None:
             agate_table = agate_helper.empty_table()
 
+        # the "data" matrix is added by load_result, so the agate rows of a
+        # result that is never loaded are never built
         self.sql_results[name] = AttrDict(
             {
                 "response": response,
-                "data": agate_helper.as_matrix(agate_table),
                 "table": agate_table,
             }
         )
@@ -674,7 +697,7 @@ class ProviderContext(ManifestContext):
         response = AdapterResponse(_message=message, code=code, rows_affected=rows_affected)
         return self.store_result(name, response, agate_table)
 
-    @contextproperty
+    @contextproperty(shared=True)
     def validation(self):
         def validate_any(*args) -> Callable[[T], None]:
             def inner(value: T) -> None:
@@ -689,7 +712,8 @@ class ProviderContext(ManifestContext):
 
             return inner
 
-        return AttrDict(
+        # every context for the same config shares it, so it's read-only
+        return MappingProxyType(
             {
                 "any": validate_any,
             }
@@ -717,7 +741,7 @@ class ProviderContext(ManifestContext):
             raise_compiler_error(message_if_exception, self.model)
 
     @contextmember
-    def load_agate_table(self) -> agate.Table:
+    def load_agate_table(self, row_limit: Optional[int] = None) -> agate.Table:
         if not isinstance(self.model, (ParsedSeedNode, CompiledSeedNode)):
             raise_compiler_error(
                 "can only load_agate_table for seeds (got a {})".format(self.model.resource_type)
@@ -725,7 +749,7 @@ class ProviderContext(ManifestContext):
         path = os.path.join(self.model.root_path, self.model.original_file_path)
         column_types = self.model.config.column_types
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types)
+            table = agate_helper.from_csv(path, text_columns=column_types, row_limit=row_limit)
         except ValueError as e:
             raise_compiler_error(str(e))
         table.original_abspath = os.path.abspath(path)
@@ -833,7 +857,7 @@ class ProviderContext(ManifestContext):
         """  # noqa
         return self.provider.Config(self.model, self.context_config)
 
-    @contextproperty
+    @contextproperty(shared=True)
     def execute(self) -> bool:
         """`execute` is a Jinja variable that returns True when dbt is in
         "execute" mode.
@@ -932,11 +956,11 @@ class ProviderContext(ManifestContext):
         """  # noqa
         return wrapped_exports(self.model)
 
-    @contextproperty
+    @contextproperty(shared=True)
     def database(self) -> str:
         return self.config.credentials.database
 
-    @contextproperty
+    @contextproperty(shared=True)
     def schema(self) -> str:
         return self.config.credentials.schema
 
@@ -946,8 +970,40 @@ class ProviderContext(ManifestContext):
             context=self._ctx,
             config=self.config,
             node=self.model,
+            on_read=None if self.provider.execute else self.record_var,
         )
 
+    @contextproperty
+    def target(self) -> Dict[str, Any]:
+        # The docs for 'target' are on TargetContext.target
+        # see SchemaYamlContext.target
+        target = self.shared_value("target", self.config.to_target_dict)
+        if self.provider.execute:
+            return copy.copy(target)
+        return ParseTarget(target, self.record_target_key)
+
+    def _parsing_source_file(self) -> Optional[SourceFile]:
+        # Reads of vars and of the target while parsing are saved in the
+        # source_file, so partial parsing can reparse the file when they
+        # change. Schema files record them in the TestContext.
+        if self.provider.execute or not self.model:
+            return None
+        # hooks come from dbt_project.yml which doesn't have a real file_id
+        source_file = self.manifest.files.get(self.model.file_id)
+        if not isinstance(source_file, SourceFile):
+            return None
+        return source_file
+
+    def record_var(self, var_name: str) -> None:
+        source_file = self._parsing_source_file()
+        if source_file is not None and var_name not in source_file.vars:
+            source_file.vars.append(var_name)
+
+    def record_target_key(self, key: str) -> None:
+        source_file = self._parsing_source_file()
+        if source_file is not None and key not in source_file.target_keys:
+            source_file.target_keys.append(key)
+
     @contextproperty("adapter")
     def ctx_adapter(self) -> BaseDatabaseWrapper:
         """`adapter` is a wrapper around the internal database adapter used by
@@ -957,14 +1013,17 @@ class ProviderContext(ManifestContext):
         """
         return self.db_wrapper
 
-    @contextproperty
-    def api(self) -> Dict[str, Any]:
-        return {
-            "Relation": self.db_wrapper.Relation,
-            "Column": self.adapter.Column,
-        }
+    @contextproperty(shared=True)
+    def api(self) -> Mapping[str, Any]:
+        # every context for the same config shares it, so it's read-only
+        return MappingProxyType(
+            {
+                "Relation": self.db_wrapper.Relation,
+                "Column": self.adapter.Column,
+            }
+        )
 
-    @contextproperty
+    @contextproperty(shared=True)
     def column(self) -> Type[Column]:
         return self.adapter.Column
 
@@ -1095,7 +1154,7 @@ class ProviderContext(ManifestContext):
     def sql(self) -> Optional[str]:
         return None
 
-    @contextproperty
+    @contextproperty(shared=True)
     def sql_now(self) -> str:
         return self.adapter.date_function()
 
@@ -1415,6 +1474,27 @@ class TestContext(ProviderContext):
         )
         self.namespace = macro_namespace
 
+    def _test_file_key_name(self):
+        # the "model" should only be test nodes, but just in case, check
+        # TODO CT-211
+        if self.model.resource_type == NodeType.Test and self.model.file_key_name:  # type: ignore[union-attr] # noqa
+            # TODO CT-211
+            (yaml_key, name) = self.model.file_key_name.split(".")  # type: ignore[union-attr] # noqa
+            return self.manifest.files[self.model.file_id], yaml_key, name
+        return None
+
+    def record_var(self, var_name: str) -> None:
+        file_key_name = self._test_file_key_name()
+        if file_key_name is not None:
+            (source_file, yaml_key, name) = file_key_name
+            source_file.add_var(var_name, yaml_key, name)  # type: ignore[union-attr]
+
+    def record_target_key(self, key: str) -> None:
+        file_key_name = self._test_file_key_name()
+        if file_key_name is not None:
+            (source_file, yaml_key, name) = file_key_name
+            source_file.add_target_key(key, yaml_key, name)  # type: ignore[union-attr]
+
     @contextmember
     def env_var(self, var: str, default: Optional[str] = None) -> str:
         return_value = None
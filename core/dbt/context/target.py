@@ -1,10 +1,66 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from dbt.contracts.connection import HasCredentials
 
 from dbt.context.base import BaseContext, contextproperty
 
 
+class ParseTarget(dict):
+    """The 'target' dictionary used while parsing. It calls on_read with
+    every key that's looked up, so partial parsing knows which parts of the
+    target each file depends on. Anything that reads the whole dictionary
+    reads every key.
+    """
+
+    def __init__(self, target: Dict[str, Any], on_read: Callable[[str], None]) -> None:
+        super().__init__(target)
+        self._on_read = on_read
+
+    def _read_all(self) -> None:
+        for key in dict.keys(self):
+            self._on_read(key)
+
+    def __getitem__(self, key):
+        self._on_read(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._on_read(key)
+        return super().get(key, default)
+
+    def __contains__(self, key) -> bool:
+        self._on_read(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._read_all()
+        return super().__iter__()
+
+    def keys(self):
+        self._read_all()
+        return super().keys()
+
+    def values(self):
+        self._read_all()
+        return super().values()
+
+    def items(self):
+        self._read_all()
+        return super().items()
+
+    def copy(self) -> Dict[str, Any]:
+        self._read_all()
+        return dict(dict.items(self))
+
+    def __repr__(self) -> str:
+        self._read_all()
+        return super().__repr__()
+
+    def __reduce__(self):
+        # the callback can't be pickled, and isn't needed outside of parsing
+        return (dict, (list(dict.items(self)),))
+
+
 class TargetContext(BaseContext):
     # subclass is ConfiguredContext
     def __init__(self, config: HasCredentials, cli_vars: Dict[str, Any]):
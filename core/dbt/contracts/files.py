@@ -40,12 +40,22 @@ parse_file_type_to_parser = {
 }
 
 
+@dataclass
+class FileStat(dbtClassMixin):
+    size: int
+    mtime_ns: int
+    inode: int
+
+
 @dataclass
 class FilePath(dbtClassMixin):
     searched_path: str
     relative_path: str
     modification_time: float
     project_root: str
+    # When the stat of a file matches the one saved for partial parsing, the
+    # file hasn't changed and isn't read again
+    stat: Optional[FileStat] = None
 
     @property
     def search_key(self) -> str:
@@ -69,6 +79,8 @@ class FilePath(dbtClassMixin):
 
     def seed_too_large(self) -> bool:
         """Return whether the file this represents is over the seed size limit"""
+        if self.stat is not None:
+            return self.stat.size > MAXIMUM_SEED_SIZE
         return os.stat(self.full_path).st_size > MAXIMUM_SEED_SIZE
 
 
@@ -187,6 +199,9 @@ class SourceFile(BaseSourceFile):
     docs: List[str] = field(default_factory=list)
     macros: List[str] = field(default_factory=list)
     env_vars: List[str] = field(default_factory=list)
+    # the cli vars and target keys read while parsing this file
+    vars: List[str] = field(default_factory=list)
+    target_keys: List[str] = field(default_factory=list)
 
     @classmethod
     def big_seed(cls, path: FilePath) -> "SourceFile":
@@ -229,6 +244,8 @@ class SchemaSourceFile(BaseSourceFile):
     # created too, but those are in 'sources'
     sop: List[SourceKey] = field(default_factory=list)
     env_vars: Dict[str, Any] = field(default_factory=dict)
+    vars: Dict[str, Any] = field(default_factory=dict)
+    target_keys: Dict[str, Any] = field(default_factory=dict)
     pp_dict: Optional[Dict[str, Any]] = None
     pp_test_index: Optional[Dict[str, Any]] = None
 
@@ -299,20 +316,33 @@ class SchemaSourceFile(BaseSourceFile):
         return test_ids
 
     def add_env_var(self, var, yaml_key, name):
-        if yaml_key not in self.env_vars:
-            self.env_vars[yaml_key] = {}
-        if name not in self.env_vars[yaml_key]:
-            self.env_vars[yaml_key][name] = []
-        if var not in self.env_vars[yaml_key][name]:
-            self.env_vars[yaml_key][name].append(var)
+        _add_parse_dependency(self.env_vars, var, yaml_key, name)
+
+    def add_var(self, var, yaml_key, name):
+        _add_parse_dependency(self.vars, var, yaml_key, name)
+
+    def add_target_key(self, key, yaml_key, name):
+        _add_parse_dependency(self.target_keys, key, yaml_key, name)
 
     def delete_from_env_vars(self, yaml_key, name):
-        # We delete all vars for this yaml_key/name because the
-        # entry has been scheduled for reparsing.
-        if yaml_key in self.env_vars and name in self.env_vars[yaml_key]:
-            del self.env_vars[yaml_key][name]
-            if not self.env_vars[yaml_key]:
-                del self.env_vars[yaml_key]
+        # We delete all env_vars, vars and target keys for this yaml_key/name
+        # because the entry has been scheduled for reparsing.
+        for dependencies in (self.env_vars, self.vars, self.target_keys):
+            if yaml_key in dependencies and name in dependencies[yaml_key]:
+                del dependencies[yaml_key][name]
+                if not dependencies[yaml_key]:
+                    del dependencies[yaml_key]
+
+
+# Schema file dependencies are stored by yaml_key and then by the name of the
+# entry whose rendering used them
+def _add_parse_dependency(dependencies, value, yaml_key, name):
+    if yaml_key not in dependencies:
+        dependencies[yaml_key] = {}
+    if name not in dependencies[yaml_key]:
+        dependencies[yaml_key][name] = []
+    if value not in dependencies[yaml_key][name]:
+        dependencies[yaml_key][name].append(value)
 
 
 AnySourceFile = Union[SchemaSourceFile, SourceFile]
@@ -0,0 +1,107 @@
+import threading
+from typing import Any, Callable, Dict, Iterator, MutableMapping, NamedTuple, Optional, TypeVar
+
+import msgpack
+
+V = TypeVar("V")
+
+
+def pack(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+class _Packed(NamedTuple):
+    data: bytes
+
+
+class LazyRecords(MutableMapping[str, V]):
+    """A mapping whose values can be added in their msgpack-packed,
+    serialized form. A packed value is only unpacked and decoded when it's
+    first accessed, so records that are never looked at are never built.
+
+    Each packed value can come with a summary of its contents, which is
+    available until the value is decoded. After that the decoded object may
+    change, so the summary is dropped.
+
+    Iterating over the keys and checking membership never decodes values.
+    """
+
+    def __init__(self, decode: Optional[Callable[[Any], V]] = None) -> None:
+        # without a decode function, values are returned as unpacked dicts
+        self._decode = decode
+        self._values: Dict[str, Any] = {}
+        self._summaries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def add_packed(self, key: str, data: bytes, summary: Any = None) -> None:
+        self._values[key] = _Packed(data)
+        if summary is None:
+            self._summaries.pop(key, None)
+        else:
+            self._summaries[key] = summary
+
+    def packed(self, key: str) -> Optional[bytes]:
+        """Return the packed value for the key, or None if it's been decoded."""
+        value = self._values[key]
+        if isinstance(value, _Packed):
+            return value.data
+        return None
+
+    def summary(self, key: str) -> Optional[Any]:
+        """Return the summary for the key, or None if it's been decoded."""
+        return self._summaries.get(key)
+
+    def __getitem__(self, key: str) -> V:
+        value = self._values[key]
+        if isinstance(value, _Packed):
+            # several threads can look up the same record, and they must all
+            # get the same object back
+            with self._lock:
+                value = self._values[key]
+                if isinstance(value, _Packed):
+                    value = unpack(value.data)
+                    if self._decode is not None:
+                        value = self._decode(value)
+                    self._values[key] = value
+                    self._summaries.pop(key, None)
+        return value
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._values[key] = value
+        self._summaries.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        del self._values[key]
+        self._summaries.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def copy(self) -> "LazyRecords[V]":
+        """Return a shallow copy. Values that are still packed stay packed."""
+        copied: LazyRecords[V] = LazyRecords(self._decode)
+        copied._values = self._values.copy()
+        copied._summaries = self._summaries.copy()
+        return copied
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} records)"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
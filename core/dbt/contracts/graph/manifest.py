@@ -16,6 +16,8 @@ from typing import (
     TypeVar,
     Callable,
     Generic,
+    Iterator,
+    NamedTuple,
     cast,
     AbstractSet,
     ClassVar,
@@ -23,6 +25,7 @@ from typing import (
 from typing_extensions import Protocol
 from uuid import UUID
 
+from dbt.contracts.graph.lazy import LazyRecords
 from dbt.contracts.graph.compiled import (
     CompileResultNode,
     ManifestNode,
@@ -42,6 +45,7 @@ from dbt.contracts.graph.parsed import (
 from dbt.contracts.graph.unparsed import SourcePatch
 from dbt.contracts.files import SourceFile, SchemaSourceFile, FileHash, AnySourceFile
 from dbt.contracts.util import BaseArtifactMetadata, SourceKey, ArtifactMixin, schema_version
+from dbt.clients.system import write_json
 from dbt.dataclass_schema import dbtClassMixin
 from dbt.exceptions import (
     CompilationException,
@@ -290,19 +294,19 @@ def _sort_values(dct):
     return {k: sorted(v) for k, v in dct.items()}
 
 
-def build_node_edges(nodes: List[ManifestNode]):
-    """Build the forward and backward edges on the given list of ParsedNodes
-    and return them as two separate dictionaries, each mapping unique IDs to
-    lists of edges.
+def build_node_edges(depends_on: Mapping[str, List[str]]):
+    """Build the forward and backward edges from the given mapping of unique
+    IDs to the unique IDs of the nodes they depend on, and return them as two
+    separate dictionaries, each mapping unique IDs to lists of edges.
     """
     backward_edges: Dict[str, List[str]] = {}
     # pre-populate the forward edge dict for simplicity
-    forward_edges: Dict[str, List[str]] = {n.unique_id: [] for n in nodes}
-    for node in nodes:
-        backward_edges[node.unique_id] = node.depends_on_nodes[:]
-        for unique_id in node.depends_on_nodes:
-            if unique_id in forward_edges.keys():
-                forward_edges[unique_id].append(node.unique_id)
+    forward_edges: Dict[str, List[str]] = {unique_id: [] for unique_id in depends_on}
+    for unique_id, depends_on_nodes in depends_on.items():
+        backward_edges[unique_id] = depends_on_nodes[:]
+        for parent_id in depends_on_nodes:
+            if parent_id in forward_edges.keys():
+                forward_edges[parent_id].append(unique_id)
     return _sort_values(forward_edges), _sort_values(backward_edges)
 
 
@@ -322,6 +326,62 @@ def _deepcopy(value):
     return value.from_dict(value.to_dict(omit_none=True))
 
 
+class GraphMemberSummary(NamedTuple):
+    """The attributes of a node, source, exposure or metric that are needed
+    to build the graph and choose its members. Records loaded lazily from the
+    partial parse store keep their summary until they are first accessed.
+    """
+
+    resource_type: NodeType
+    fqn: List[str]
+    depends_on_nodes: List[str]
+    enabled: bool
+    empty: bool
+
+    @classmethod
+    def from_member(cls, member: GraphMemberNode) -> "GraphMemberSummary":
+        config = getattr(member, "config", None)
+        return cls(
+            resource_type=member.resource_type,
+            fqn=member.fqn,
+            depends_on_nodes=member.depends_on_nodes,
+            enabled=config.enabled if config is not None else True,
+            empty=getattr(member, "empty", False),
+        )
+
+
+def summarize_member(records: Mapping[str, GraphMemberNode], unique_id: str) -> GraphMemberSummary:
+    summary = None
+    if isinstance(records, LazyRecords):
+        summary = records.summary(unique_id)
+    if summary is None:
+        summary = GraphMemberSummary.from_member(records[unique_id])
+    return summary
+
+
+def _serialize_record(value):
+    if isinstance(value, list):
+        return [item.to_dict(omit_none=False) for item in value]
+    return value.to_dict(omit_none=False)
+
+
+def _serialize_records(records: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Serialize the values in records. Records that were never loaded from
+    the partial parse store are left packed and are only unpacked if the
+    returned mapping is accessed.
+    """
+    if not isinstance(records, LazyRecords):
+        return {k: _serialize_record(v) for k, v in records.items()}
+    serialized: LazyRecords[Any] = LazyRecords()
+    for key in records:
+        data = records.packed(key)
+        if data is None:
+            serialized[key] = _serialize_record(records[key])
+        else:
+            serialized.add_packed(key, data)
+    return serialized
+
+
 class Locality(enum.IntEnum):
     Core = 1
     Imported = 2
@@ -562,6 +622,17 @@ class ManifestStateCheck(dbtClassMixin):
     profile_env_vars_hash: FileHash = field(default_factory=FileHash.empty)
     profile_hash: FileHash = field(default_factory=FileHash.empty)
     project_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    # Hashes of each cli var and of each key in the target. Only the hashes
+    # are saved, so secrets in the values are never written to disk.
+    var_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    target_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+
+    @staticmethod
+    def changed_keys(old: Mapping[str, FileHash], new: Mapping[str, FileHash]) -> Set[str]:
+        """Return the keys that were added, removed or changed between the
+        two mappings of hashes.
+        """
+        return {key for key in set(old) | set(new) if old.get(key) != new.get(key)}
 
 
 @dataclass
@@ -609,6 +680,11 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=flags.MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    # the MacroIndex objects of dbt.context.macros, by root package and
+    # internal packages
+    _macro_indexes: Optional[Dict[Any, Any]] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -658,10 +734,10 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         manifest!
         """
         self.flat_graph = {
-            "exposures": {k: v.to_dict(omit_none=False) for k, v in self.exposures.items()},
-            "metrics": {k: v.to_dict(omit_none=False) for k, v in self.metrics.items()},
-            "nodes": {k: v.to_dict(omit_none=False) for k, v in self.nodes.items()},
-            "sources": {k: v.to_dict(omit_none=False) for k, v in self.sources.items()},
+            "exposures": _serialize_records(self.exposures),
+            "metrics": _serialize_records(self.metrics),
+            "nodes": _serialize_records(self.nodes),
+            "sources": _serialize_records(self.sources),
         }
 
     def build_disabled_by_file_id(self):
@@ -708,19 +784,29 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         )
         return candidates.last()
 
+    def _graph_member_records(self) -> Tuple[Mapping[str, GraphMemberNode], ...]:
+        return (self.nodes, self.sources, self.exposures, self.metrics)
+
+    def graph_member_summaries(self) -> Iterator[Tuple[str, GraphMemberSummary]]:
+        for records in self._graph_member_records():
+            for unique_id in records:
+                yield unique_id, summarize_member(records, unique_id)
+
+    def graph_member_summary(self, unique_id: str) -> GraphMemberSummary:
+        for records in self._graph_member_records():
+            if unique_id in records:
+                return summarize_member(records, unique_id)
+        raise dbt.exceptions.InternalException(
+            "Expected node {} not found in manifest".format(unique_id)
+        )
+
     def get_resource_fqns(self) -> Mapping[str, PathSet]:
         resource_fqns: Dict[str, Set[Tuple[str, ...]]] = {}
-        all_resources = chain(
-            self.exposures.values(),
-            self.nodes.values(),
-            self.sources.values(),
-            self.metrics.values(),
-        )
-        for resource in all_resources:
-            resource_type_plural = resource.resource_type.pluralize()
+        for _, summary in self.graph_member_summaries():
+            resource_type_plural = summary.resource_type.pluralize()
             if resource_type_plural not in resource_fqns:
                 resource_fqns[resource_type_plural] = set()
-            resource_fqns[resource_type_plural].add(tuple(resource.fqn))
+            resource_fqns[resource_type_plural].add(tuple(summary.fqn))
         return resource_fqns
 
     def get_used_schemas(self, resource_types=None):
@@ -751,15 +837,11 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         )
 
     def build_parent_and_child_maps(self):
-        edge_members = list(
-            chain(
-                self.nodes.values(),
-                self.sources.values(),
-                self.exposures.values(),
-                self.metrics.values(),
-            )
-        )
-        forward_edges, backward_edges = build_node_edges(edge_members)
+        depends_on = {
+            unique_id: summary.depends_on_nodes
+            for unique_id, summary in self.graph_member_summaries()
+        }
+        forward_edges, backward_edges = build_node_edges(depends_on)
         self.child_map = forward_edges
         self.parent_map = backward_edges
 
@@ -790,7 +872,18 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         )
 
     def write(self, path):
-        self.writable_manifest().write(path)
+        writable = self.writable_manifest()
+        # Records that were never loaded from the partial parse store are
+        # written from their serialized form, without loading them.
+        serialized = {}
+        for name in ("nodes", "sources", "macros", "docs", "exposures", "metrics", "disabled"):
+            records = getattr(writable, name)
+            if isinstance(records, LazyRecords):
+                serialized[name] = dict(_serialize_records(records))
+                setattr(writable, name, {})
+        dct = writable.to_dict(omit_none=False)
+        dct.update(serialized)
+        write_json(path, dct)
 
     # Called in dbt.compilation.Linker.write_graph and
     # dbt.graph.queue.get and ._include_in_cost
@@ -984,6 +1077,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             raise_compiler_error(msg)
 
         self.macros[macro.unique_id] = macro
+        self._macro_indexes = None
         source_file.macros.append(macro.unique_id)
 
     def has_file(self, source_file: SourceFile) -> bool:
@@ -1085,6 +1179,7 @@ class MacroManifest(MacroMethods):
         # This is returned by the 'graph' context property
         # in the ProviderContext class.
         self.flat_graph = {}
+        self._macro_indexes = None
 
 
 AnyManifest = Union[Manifest, MacroManifest]
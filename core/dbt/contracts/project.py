@@ -253,6 +253,13 @@ class UserConfig(ExtensibleDbtClassMixin, Replaceable, UserConfigContract):
     use_experimental_parser: Optional[bool] = None
     static_parser: Optional[bool] = None
     indirect_selection: Optional[str] = None
+    parse_processes: Optional[int] = None
+    binary_event_log: Optional[bool] = None
+    relation_cache_ttl: Optional[int] = None
+    critical_path_scheduling: Optional[bool] = None
+    jinja_bytecode_cache: Optional[bool] = None
+    event_history_retain_level: Optional[str] = None
+    event_history_retain_types: Optional[str] = None
 
 
 @dataclass
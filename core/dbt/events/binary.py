@@ -0,0 +1,107 @@
+"""A compact binary log of events.
+
+With `--binary-event-log`, every event that goes to the log file is also
+written to `dbt.events.msgpack` in the log path, as a 4 byte big-endian
+length followed by a msgpack-packed record. Writing a record is much cheaper
+than formatting a json log line, and the file isn't rotated.
+
+Run `python -m dbt.events.binary logs/dbt.events.msgpack` to convert the
+file to the json log lines that `--log-format json` writes.
+"""
+import json
+import struct
+import sys
+from typing import Any, BinaryIO, Dict, IO, Iterator, List, Optional
+
+import msgpack
+
+BINARY_EVENT_LOG_FILE_NAME = "dbt.events.msgpack"
+
+# The fields of a json log line, besides 'type' and 'log_version', in the
+# order they're stored in a record
+RECORD_FIELDS = ("ts", "pid", "msg", "level", "data", "invocation_id", "thread_name", "code")
+
+_LENGTH = struct.Struct(">I")
+
+
+def _scrub(value: Any, secrets: List[str]) -> Any:
+    if isinstance(value, str):
+        for secret in secrets:
+            value = value.replace(secret, "*****")
+        return value
+    if isinstance(value, dict):
+        return {key: _scrub(item, secrets) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_scrub(item, secrets) for item in value]
+    return value
+
+
+def encode_record(values: Dict[str, Any], secrets: Optional[List[str]] = None) -> bytes:
+    """Return the framed record for the values of a json log line, with the
+    secrets scrubbed from every string in it.
+    """
+    record = [values[field] for field in RECORD_FIELDS]
+    if secrets:
+        record = _scrub(record, secrets)
+    data = msgpack.packb(record, use_bin_type=True)
+    return _LENGTH.pack(len(data)) + data
+
+
+def read_records(stream: BinaryIO, log_version: int) -> Iterator[Dict[str, Any]]:
+    """Yield the values of the json log line for each record in the stream.
+    A record that was cut short, because dbt was killed while writing it,
+    ends the stream.
+    """
+    while True:
+        header = stream.read(_LENGTH.size)
+        if len(header) < _LENGTH.size:
+            return
+        (length,) = _LENGTH.unpack(header)
+        data = stream.read(length)
+        if len(data) < length:
+            return
+        values = dict(zip(RECORD_FIELDS, msgpack.unpackb(data, raw=False)))
+        values["type"] = "log_line"
+        values["log_version"] = log_version
+        yield values
+
+
+class BinaryEventLog:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: BinaryIO = open(path, "ab")
+
+    def write(self, values: Dict[str, Any], secrets: Optional[List[str]] = None) -> None:
+        self._file.write(encode_record(values, secrets))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def write_json_lines(path: str, out: IO[str]) -> None:
+    """Write the records in the binary event log at 'path' to 'out' as json
+    log lines.
+    """
+    # dbt.events.functions imports this module
+    from dbt.events.functions import LOG_VERSION
+
+    with open(path, "rb") as stream:
+        for values in read_records(stream, LOG_VERSION):
+            out.write(json.dumps(values, sort_keys=True))
+            out.write("\n")
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    if args is None:
+        args = sys.argv[1:]
+    if len(args) != 1:
+        sys.stderr.write("usage: python -m dbt.events.binary PATH\n")
+        sys.exit(2)
+    write_json_lines(args[0], sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,34 +2,72 @@ import colorama
 from colorama import Style
 import dbt.events.functions as this  # don't worry I hate it too.
 from dbt.events.base_types import NoStdOut, Event, NoFile, ShowException, Cache
+from dbt.events import types as event_types
+from dbt.events.binary import BINARY_EVENT_LOG_FILE_NAME, BinaryEventLog
+from dbt.events.history import EventHistory
 from dbt.events.types import EventBufferFull, T_Event, MainReportVersion, EmptyLine
 import dbt.flags as flags
 
 # TODO this will need to move eventually
 from dbt.logger import SECRET_ENV_PREFIX, make_log_dir_if_missing, GLOBAL_LOGGER
 from datetime import datetime
+import atexit
 import json
 import io
 from io import StringIO, TextIOWrapper
 import logbook
 import logging
 from logging import Logger
+import queue
 import sys
 from logging.handlers import RotatingFileHandler
 import os
 import uuid
 import threading
-from typing import Any, Dict, List, Optional, Union
-from collections import deque
+import traceback
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union
 
 global LOG_VERSION
 LOG_VERSION = 2
 
+
+def _event_types_named(names: str) -> Set[Type[Event]]:
+    """The event types in a comma-separated list of event type names. The
+    names are matched ignoring case, since values from environment variables
+    are lowercased.
+    """
+    known = {
+        name.lower(): cls
+        for name, cls in vars(event_types).items()
+        if isinstance(cls, type) and issubclass(cls, Event)
+    }
+    retained: Set[Type[Event]] = set()
+    for name in names.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        if name.lower() not in known:
+            raise ValueError(f"Unknown event type in EVENT_HISTORY_RETAIN_TYPES: {name}")
+        retained.add(known[name.lower()])
+    return retained
+
+
+def new_event_history() -> EventHistory:
+    # Events at or above the retain level are kept in the event history as
+    # they were fired, along with events of the retained types. Other events
+    # are only kept as a summary, which doesn't hold on to their data.
+    return EventHistory(
+        maxlen=flags.EVENT_BUFFER_SIZE,
+        retain_level=flags.EVENT_HISTORY_RETAIN_LEVEL,
+        retain_types=_event_types_named(flags.EVENT_HISTORY_RETAIN_TYPES),
+    )
+
+
 # create the global event history buffer with the default max size (10k)
 # python 3.7 doesn't support type hints on globals, but mypy requires them. hence the ignore.
 # TODO the flags module has not yet been resolved when this is created
 global EVENT_HISTORY
-EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+EVENT_HISTORY = new_event_history()  # type: ignore
 
 # create the global file logger with no configuration
 global FILE_LOG
@@ -60,9 +98,11 @@ if sys.platform == "win32":
 
 
 def setup_event_logger(log_path, level_override=None):
+    # lines already queued for the file log go to the old file, in the old format
+    flush_file_log()
     # flags have been resolved, and log_path is known
     global EVENT_HISTORY
-    EVENT_HISTORY = deque(maxlen=flags.EVENT_BUFFER_SIZE)  # type: ignore
+    EVENT_HISTORY = new_event_history()  # type: ignore
 
     make_log_dir_if_missing(log_path)
     this.format_json = flags.LOG_FORMAT == "json"
@@ -105,6 +145,11 @@ def setup_event_logger(log_path, level_override=None):
     this.FILE_LOG.handlers.clear()
     this.FILE_LOG.addHandler(file_handler)
 
+    binary_log = None
+    if flags.BINARY_EVENT_LOG:
+        binary_log = BinaryEventLog(os.path.join(log_path, BINARY_EVENT_LOG_FILE_NAME))
+    FILE_LOG_WRITER.set_binary_log(binary_log)
+
 
 # used for integration tests
 def capture_stdout_logs() -> StringIO:
@@ -137,11 +182,33 @@ def scrub_secrets(msg: str, secrets: List[str]) -> str:
     return scrubbed
 
 
+class EventSnapshot(NamedTuple):
+    """The parts of a log line that have to be taken when an event is fired.
+    The rest of the line can be formatted later, on another thread.
+    """
+
+    msg: str
+    ts: datetime
+    thread_name: str
+    invocation_id: str
+
+
+def take_snapshot(e: T_Event) -> EventSnapshot:
+    return EventSnapshot(
+        msg=e.message(),
+        ts=get_ts(),
+        thread_name=e.get_thread_name(),
+        invocation_id=e.get_invocation_id(),
+    )
+
+
 # returns a dictionary representation of the event fields.
 # the message may contain secrets which must be scrubbed at the usage site.
 def event_to_serializable_dict(
-    e: T_Event,
+    e: T_Event, snapshot: Optional[EventSnapshot] = None
 ) -> Dict[str, Any]:
+    if snapshot is None:
+        snapshot = take_snapshot(e)
 
     log_line = dict()
     code: str
@@ -160,13 +227,13 @@ def event_to_serializable_dict(
     event_dict = {
         "type": "log_line",
         "log_version": LOG_VERSION,
-        "ts": get_ts_rfc3339(),
+        "ts": get_ts_rfc3339(snapshot.ts),
         "pid": e.get_pid(),
-        "msg": e.message(),
+        "msg": snapshot.msg,
         "level": e.level_tag(),
         "data": log_line,
-        "invocation_id": e.get_invocation_id(),
-        "thread_name": e.get_thread_name(),
+        "invocation_id": snapshot.invocation_id,
+        "thread_name": snapshot.thread_name,
         "code": e.code,
     }
 
@@ -175,27 +242,31 @@ def event_to_serializable_dict(
 
 # translates an Event to a completely formatted text-based log line
 # type hinting everything as strings so we don't get any unintentional string conversions via str()
-def create_info_text_log_line(e: T_Event) -> str:
+def create_info_text_log_line(e: T_Event, snapshot: Optional[EventSnapshot] = None) -> str:
+    if snapshot is None:
+        snapshot = take_snapshot(e)
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S")
-    scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
+    ts: str = snapshot.ts.strftime("%H:%M:%S")
+    scrubbed_msg: str = scrub_secrets(snapshot.msg, env_secrets())
     log_line: str = f"{color_tag}{ts}  {scrubbed_msg}"
     return log_line
 
 
-def create_debug_text_log_line(e: T_Event) -> str:
+def create_debug_text_log_line(e: T_Event, snapshot: Optional[EventSnapshot] = None) -> str:
+    if snapshot is None:
+        snapshot = take_snapshot(e)
     log_line: str = ""
     # Create a separator if this is the beginning of an invocation
     if type(e) == MainReportVersion:
         separator = 30 * "="
-        log_line = f"\n\n{separator} {get_ts()} | {get_invocation_id()} {separator}\n"
+        log_line = f"\n\n{separator} {snapshot.ts} | {snapshot.invocation_id} {separator}\n"
     color_tag: str = "" if this.format_color else Style.RESET_ALL
-    ts: str = get_ts().strftime("%H:%M:%S.%f")
-    scrubbed_msg: str = scrub_secrets(e.message(), env_secrets())
+    ts: str = snapshot.ts.strftime("%H:%M:%S.%f")
+    scrubbed_msg: str = scrub_secrets(snapshot.msg, env_secrets())
     level: str = e.level_tag() if len(e.level_tag()) == 5 else f"{e.level_tag()} "
     thread = ""
-    if threading.current_thread().getName():
-        thread_name = threading.current_thread().getName()
+    if snapshot.thread_name:
+        thread_name = snapshot.thread_name
         thread_name = thread_name[:10]
         thread_name = thread_name.ljust(10, " ")
         thread = f" [{thread_name}]:"
@@ -204,23 +275,25 @@ def create_debug_text_log_line(e: T_Event) -> str:
 
 
 # translates an Event to a completely formatted json log line
-def create_json_log_line(e: T_Event) -> Optional[str]:
+def create_json_log_line(e: T_Event, snapshot: Optional[EventSnapshot] = None) -> Optional[str]:
     if type(e) == EmptyLine:
         return None  # will not be sent to logger
     # using preformatted ts string instead of formatting it here to be extra careful about timezone
-    values = event_to_serializable_dict(e)
+    values = event_to_serializable_dict(e, snapshot)
     raw_log_line = json.dumps(values, sort_keys=True)
     return scrub_secrets(raw_log_line, env_secrets())
 
 
 # calls create_stdout_text_log_line() or create_json_log_line() according to logger config
-def create_log_line(e: T_Event, file_output=False) -> Optional[str]:
+def create_log_line(
+    e: T_Event, file_output=False, snapshot: Optional[EventSnapshot] = None
+) -> Optional[str]:
     if this.format_json:
-        return create_json_log_line(e)  # json output, both console and file
+        return create_json_log_line(e, snapshot)  # json output, both console and file
     elif file_output is True or flags.DEBUG:
-        return create_debug_text_log_line(e)  # default file output
+        return create_debug_text_log_line(e, snapshot)  # default file output
     else:
-        return create_info_text_log_line(e)  # console output
+        return create_info_text_log_line(e, snapshot)  # console output
 
 
 # allows for resuse of this obnoxious if else tree.
@@ -265,6 +338,101 @@ def send_exc_to_logger(
         )
 
 
+class FileLogWriter:
+    """Format events for the file log and write them from a background
+    thread, so threads firing events don't format debug lines or wait on
+    each other for the file handler's lock.
+
+    The queue is bounded. When the file can't keep up, firing an event
+    blocks until there's room again. Queued events are written before the
+    file logger is set up again, when a dbt command finishes, and at exit.
+    """
+
+    # the most events held in the queue
+    max_queued = 10000
+    # the most events written at a time, between reads from the queue
+    batch_size = 500
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.binary_log: Optional[BinaryEventLog] = None
+
+    def set_binary_log(self, binary_log: Optional[BinaryEventLog]) -> None:
+        # the queue has been flushed, so nothing is writing to the old one
+        if self.binary_log is not None:
+            self.binary_log.close()
+        self.binary_log = binary_log
+
+    def _get_queue(self) -> queue.Queue:
+        with self._lock:
+            # a forked process doesn't have the writer thread, so it starts its own
+            if self._queue is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.max_queued)
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._queue,), name="dbt-file-log", daemon=True
+                )
+                self._thread.start()
+            return self._queue
+
+    def put(self, e: Event, snapshot: EventSnapshot) -> None:
+        if threading.current_thread() is self._thread:
+            # an event fired while writing to the log can't wait for the writer
+            self.write(e, snapshot)
+        else:
+            self._get_queue().put((e, snapshot))
+
+    def write(self, e: Event, snapshot: EventSnapshot) -> None:
+        log_line = create_log_line(e, file_output=True, snapshot=snapshot)
+        # doesn't send exceptions to exception logger
+        if log_line:
+            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
+        if self.binary_log is not None and type(e) != EmptyLine:
+            self.binary_log.write(event_to_serializable_dict(e, snapshot), env_secrets())
+
+    def _run(self, events: queue.Queue) -> None:
+        while True:
+            batch: List[Tuple[Event, EventSnapshot]] = [events.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(events.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for e, snapshot in batch:
+                    try:
+                        self.write(e, snapshot)
+                    except Exception:
+                        traceback.print_exc()
+                if self.binary_log is not None:
+                    self.binary_log.flush()
+            except Exception:
+                traceback.print_exc()
+            finally:
+                # flush() returns once the batch is on disk
+                for _ in batch:
+                    events.task_done()
+
+    def flush(self) -> None:
+        """Wait until every queued event has been written."""
+        events = self._queue
+        if events is not None and self._pid == os.getpid():
+            events.join()
+
+
+FILE_LOG_WRITER = FileLogWriter()
+
+
+def flush_file_log() -> None:
+    FILE_LOG_WRITER.flush()
+
+
+atexit.register(flush_file_log)
+
+
 # top-level method for accessing the new eventing system
 # this is where all the side effects happen branched by event type
 # (i.e. - mutating the event history, printing to stdout, logging
@@ -292,12 +460,12 @@ def fire_event(e: Event) -> None:
             send_to_logger(GLOBAL_LOGGER, e.level_tag(), log_line)
         return  # exit the function to avoid using the current logger as well
 
+    # the file and stdout lines share the message and time stamp
+    snapshot = take_snapshot(e)
+
     # always logs debug level regardless of user input
     if not isinstance(e, NoFile):
-        log_line = create_log_line(e, file_output=True)
-        # doesn't send exceptions to exception logger
-        if log_line:
-            send_to_logger(FILE_LOG, level_tag=e.level_tag(), log_line=log_line)
+        FILE_LOG_WRITER.put(e, snapshot)
 
     if not isinstance(e, NoStdOut):
         # explicitly checking the debug flag here so that potentially expensive-to-construct
@@ -307,7 +475,7 @@ def fire_event(e: Event) -> None:
         if e.level_tag() != "error" and flags.QUIET:
             return  # eat all non-exception messages in quiet mode
 
-        log_line = create_log_line(e)
+        log_line = create_log_line(e, snapshot=snapshot)
         if log_line:
             if not isinstance(e, ShowException):
                 send_to_logger(STDOUT_LOG, level_tag=e.level_tag(), log_line=log_line)
@@ -343,7 +511,8 @@ def get_ts() -> datetime:
 
 
 # preformatted time stamp
-def get_ts_rfc3339() -> str:
-    ts = get_ts()
+def get_ts_rfc3339(ts: Optional[datetime] = None) -> str:
+    if ts is None:
+        ts = get_ts()
     ts_rfc3339 = ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     return ts_rfc3339
@@ -0,0 +1,79 @@
+from collections import deque
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple, Type, Union, cast
+
+from dbt.events.base_types import Event
+
+# The levels from least to most important
+LEVEL_ORDER = ("test", "debug", "info", "warn", "error")
+
+
+class EventSummary(NamedTuple):
+    """Stands in for an event in the history without holding on to its
+    data. Every event of the same type shares one summary.
+    """
+
+    code: str
+    level: str
+    name: str
+
+    def level_tag(self) -> str:
+        return self.level
+
+
+HistoryEntry = Union[Event, EventSummary]
+
+
+class EventHistory(deque):
+    """The most recent events, oldest first.
+
+    Events at or above retain_level, and events whose type is in
+    retain_types, are kept as they were fired. Other events are kept as an
+    EventSummary. Debug events carry most of the data fired during a run,
+    like SQL text, so by default they're only summarized, and the history
+    takes about a pointer per event on top of the info and higher events.
+
+    level_counts has the number of events fired at each level, including
+    the ones that have since been dropped from the history.
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[HistoryEntry] = (),
+        maxlen: Optional[int] = None,
+        retain_level: str = "info",
+        retain_types: Optional[Set[Type[Event]]] = None,
+    ) -> None:
+        if retain_level not in LEVEL_ORDER:
+            raise ValueError(f"Unknown event level to retain: {retain_level}")
+        super().__init__(iterable, maxlen)
+        self.retain_level = retain_level
+        self.retain_types: Set[Type[Event]] = set(retain_types or ())
+        self.level_counts: Dict[str, int] = {level: 0 for level in LEVEL_ORDER}
+        self._summaries: Dict[Tuple[Type[Event], str], EventSummary] = {}
+
+    def retains(self, e: Event) -> bool:
+        if type(e) in self.retain_types:
+            return True
+        level = e.level_tag()
+        return level not in LEVEL_ORDER or (
+            LEVEL_ORDER.index(level) >= LEVEL_ORDER.index(self.retain_level)
+        )
+
+    def summarize(self, e: Event) -> EventSummary:
+        # code is declared as an abstract property on Event, but subclasses
+        # set it to a plain string
+        code = cast(str, e.code)
+        key = (type(e), code)
+        summary = self._summaries.get(key)
+        if summary is None:
+            summary = EventSummary(code=code, level=e.level_tag(), name=type(e).__name__)
+            self._summaries[key] = summary
+        return summary
+
+    def append(self, e: Any) -> None:
+        if isinstance(e, Event):
+            level = e.level_tag()
+            self.level_counts[level] = self.level_counts.get(level, 0) + 1
+            if not self.retains(e):
+                e = self.summarize(e)
+        super().append(e)
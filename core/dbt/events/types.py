@@ -502,6 +502,26 @@ class ListRelations(DebugLevel):
         return f"with database={self.database}, schema={self.schema}, relations={self.relations}"
 
 
+@dataclass
+class RelationCacheSnapshotUsed(DebugLevel):
+    path: str
+    relations: int
+    code: str = "E045"
+
+    def message(self) -> str:
+        return f"Using the {self.relations} cached relations saved in {self.path}"
+
+
+@dataclass
+class RelationCacheSnapshotSkipped(DebugLevel):
+    path: str
+    reason: str
+    code: str = "E046"
+
+    def message(self) -> str:
+        return f"Not using the cached relations saved in {self.path}: {self.reason}"
+
+
 @dataclass
 class ConnectionUsed(DebugLevel):
     conn_type: str
@@ -833,22 +853,6 @@ class PartialParsingMacroChangeStartFullParse(InfoLevel):
         return "Change detected to override macro used during parsing. Starting full parse."
 
 
-@dataclass
-class PartialParsingProjectEnvVarsChanged(InfoLevel):
-    code: str = "I019"
-
-    def message(self) -> str:
-        return "Unable to do partial parsing because env vars used in dbt_project.yml have changed"
-
-
-@dataclass
-class PartialParsingProfileEnvVarsChanged(InfoLevel):
-    code: str = "I020"
-
-    def message(self) -> str:
-        return "Unable to do partial parsing because env vars used in profiles.yml have changed"
-
-
 @dataclass
 class PartialParsingDeletedMetric(DebugLevel):
     id: str
@@ -945,6 +949,19 @@ class PartialParseSaveFileNotFound(InfoLevel):
         return "Partial parse save file not found. Starting full parse."
 
 
+@dataclass
+class PartialParsingWroteRecords(DebugLevel):
+    written: int
+    deleted: int
+    code: str = "I052"
+
+    def message(self) -> str:
+        return (
+            f"Partial parse save file updated: {self.written} records written, "
+            f"{self.deleted} records deleted"
+        )
+
+
 @dataclass
 class StaticParserCausedJinjaRendering(DebugLevel):
     path: str
@@ -1486,6 +1503,27 @@ class BuildingCatalog(InfoLevel):
         return "Building catalog"
 
 
+@dataclass
+class CatalogStateUsed(InfoLevel):
+    path: str
+    reused: int
+    schemas: int
+    code: str = "E047"
+
+    def message(self) -> str:
+        return f"Reused the catalog of {self.reused} of {self.schemas} schemas from {self.path}"
+
+
+@dataclass
+class CatalogStateSkipped(InfoLevel):
+    path: str
+    reason: str
+    code: str = "E048"
+
+    def message(self) -> str:
+        return f"Not using the catalog state in {self.path}: {self.reason}"
+
+
 @dataclass
 class CompileComplete(InfoLevel):
     code: str = "Q002"
@@ -1529,6 +1567,37 @@ class ServingDocsExitInfo(InfoLevel):
         return "Press Ctrl+C to exit."
 
 
+@dataclass
+class DaemonListening(InfoLevel):
+    path: str
+    code: str = "Z049"
+
+    def message(self) -> str:
+        return f"dbt daemon listening on {self.path}. Press Ctrl+C to exit."
+
+
+@dataclass
+class DaemonFilesChanged(DebugLevel):
+    changed: int
+    reload_config: bool
+    code: str = "Z050"
+
+    def message(self) -> str:
+        action = "reloading the project" if self.reload_config else "updating the manifest"
+        return f"{self.changed} project files changed, {action}"
+
+
+@dataclass
+class DaemonRefreshFailed(WarnLevel):
+    exc: str
+    code: str = "Z051"
+
+    def message(self) -> str:
+        return (
+            f"Could not update the manifest, it will be reloaded on the next request: {self.exc}"
+        )
+
+
 @dataclass
 class SeedHeader(InfoLevel):
     header: str
@@ -2431,6 +2500,8 @@ if 1 == 0:
     Rollback(conn_name="")
     CacheMiss(conn_name="", database="", schema="")
     ListRelations(database="", schema="", relations=[])
+    RelationCacheSnapshotUsed(path="", relations=0)
+    RelationCacheSnapshotSkipped(path="", reason="")
     ConnectionUsed(conn_type="", conn_name="")
     SQLQuery(conn_name="", sql="")
     SQLQueryStatus(status="", elapsed=0.1)
@@ -2493,6 +2564,7 @@ if 1 == 0:
     PartialParsingDeletedMetric(id="")
     ParsedFileLoadFailed(path="", exc=Exception(""))
     PartialParseSaveFileNotFound()
+    PartialParsingWroteRecords(written=0, deleted=0)
     StaticParserCausedJinjaRendering(path="")
     UsingExperimentalParser(path="")
     SampleFullJinjaRendering(path="")
@@ -2547,11 +2619,16 @@ if 1 == 0:
     CatalogWritten(path="")
     CannotGenerateDocs()
     BuildingCatalog()
+    CatalogStateUsed(path="", reused=0, schemas=0)
+    CatalogStateSkipped(path="", reason="")
     CompileComplete()
     FreshnessCheckComplete()
     ServingDocsPort(address="", port=0)
     ServingDocsAccessInfo(port="")
     ServingDocsExitInfo()
+    DaemonListening(path="")
+    DaemonFilesChanged(changed=0, reload_config=False)
+    DaemonRefreshFailed(exc="")
     SeedHeader(header="")
     SeedHeaderSeparator(len_header=0)
     RunResultWarning(resource_type="", node_name="", path="")
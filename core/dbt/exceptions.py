@@ -1,6 +1,6 @@
 import builtins
 import functools
-from typing import NoReturn, Optional, Mapping, Any
+from typing import NoReturn, Optional, Mapping, Any, Dict, Iterator
 
 from dbt.events.functions import fire_event, scrub_secrets, env_secrets
 from dbt.events.types import GeneralWarningMsg, GeneralWarningException
@@ -1070,6 +1070,27 @@ def wrapper(model):
     return wrap
 
 
+class WrappedExports(Mapping):
+    """The CONTEXT_EXPORTS, wrapped so the exceptions they raise have the
+    model. A context is built for every node, and most never raise, so each
+    export is only wrapped the first time it's looked up.
+    """
+
+    def __init__(self, model) -> None:
+        self._wrap = wrapper(model)
+        self._wrapped: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._wrapped:
+            self._wrapped[name] = self._wrap(CONTEXT_EXPORTS[name])
+        return self._wrapped[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CONTEXT_EXPORTS)
+
+    def __len__(self) -> int:
+        return len(CONTEXT_EXPORTS)
+
+
 def wrapped_exports(model):
-    wrap = wrapper(model)
-    return {name: wrap(export) for name, export in CONTEXT_EXPORTS.items()}
+    return WrappedExports(model)
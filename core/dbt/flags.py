@@ -34,7 +34,14 @@ WHICH = None
 INDIRECT_SELECTION = None
 LOG_CACHE_EVENTS = None
 EVENT_BUFFER_SIZE = 100000
+EVENT_HISTORY_RETAIN_LEVEL = "info"
+EVENT_HISTORY_RETAIN_TYPES = ""
 QUIET = None
+PARSE_PROCESSES = 1
+BINARY_EVENT_LOG = None
+RELATION_CACHE_TTL = 0
+CRITICAL_PATH_SCHEDULING = None
+JINJA_BYTECODE_CACHE = None
 
 # Global CLI defaults. These flags are set from three places:
 # CLI args, environment variables, and user_config (profiles.yml).
@@ -56,7 +63,14 @@ flag_defaults = {
     "INDIRECT_SELECTION": "eager",
     "LOG_CACHE_EVENTS": False,
     "EVENT_BUFFER_SIZE": 100000,
+    "EVENT_HISTORY_RETAIN_LEVEL": "info",
+    "EVENT_HISTORY_RETAIN_TYPES": "",
     "QUIET": False,
+    "PARSE_PROCESSES": 1,
+    "BINARY_EVENT_LOG": False,
+    "RELATION_CACHE_TTL": 0,
+    "CRITICAL_PATH_SCHEDULING": False,
+    "JINJA_BYTECODE_CACHE": False,
 }
 
 
@@ -106,7 +120,9 @@ def set_from_args(args, user_config):
     global STRICT_MODE, FULL_REFRESH, WARN_ERROR, USE_EXPERIMENTAL_PARSER, STATIC_PARSER
     global WRITE_JSON, PARTIAL_PARSE, USE_COLORS, STORE_FAILURES, PROFILES_DIR, DEBUG, LOG_FORMAT
     global INDIRECT_SELECTION, VERSION_CHECK, FAIL_FAST, SEND_ANONYMOUS_USAGE_STATS
-    global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET
+    global PRINTER_WIDTH, WHICH, LOG_CACHE_EVENTS, EVENT_BUFFER_SIZE, QUIET, PARSE_PROCESSES
+    global BINARY_EVENT_LOG, RELATION_CACHE_TTL, CRITICAL_PATH_SCHEDULING
+    global EVENT_HISTORY_RETAIN_LEVEL, EVENT_HISTORY_RETAIN_TYPES, JINJA_BYTECODE_CACHE
 
     STRICT_MODE = False  # backwards compatibility
     # cli args without user_config or env var option
@@ -131,7 +147,14 @@ def set_from_args(args, user_config):
     INDIRECT_SELECTION = get_flag_value("INDIRECT_SELECTION", args, user_config)
     LOG_CACHE_EVENTS = get_flag_value("LOG_CACHE_EVENTS", args, user_config)
     EVENT_BUFFER_SIZE = get_flag_value("EVENT_BUFFER_SIZE", args, user_config)
+    EVENT_HISTORY_RETAIN_LEVEL = get_flag_value("EVENT_HISTORY_RETAIN_LEVEL", args, user_config)
+    EVENT_HISTORY_RETAIN_TYPES = get_flag_value("EVENT_HISTORY_RETAIN_TYPES", args, user_config)
     QUIET = get_flag_value("QUIET", args, user_config)
+    PARSE_PROCESSES = get_flag_value("PARSE_PROCESSES", args, user_config)
+    BINARY_EVENT_LOG = get_flag_value("BINARY_EVENT_LOG", args, user_config)
+    RELATION_CACHE_TTL = get_flag_value("RELATION_CACHE_TTL", args, user_config)
+    CRITICAL_PATH_SCHEDULING = get_flag_value("CRITICAL_PATH_SCHEDULING", args, user_config)
+    JINJA_BYTECODE_CACHE = get_flag_value("JINJA_BYTECODE_CACHE", args, user_config)
 
 
 def get_flag_value(flag, args, user_config):
@@ -150,6 +173,10 @@ def get_flag_value(flag, args, user_config):
                 "PROFILES_DIR",
                 "INDIRECT_SELECTION",
                 "EVENT_BUFFER_SIZE",
+                "EVENT_HISTORY_RETAIN_LEVEL",
+                "EVENT_HISTORY_RETAIN_TYPES",
+                "PARSE_PROCESSES",
+                "RELATION_CACHE_TTL",
             ]:
                 flag_value = env_value
             else:
@@ -158,7 +185,8 @@ def get_flag_value(flag, args, user_config):
             flag_value = getattr(user_config, lc_flag)
         else:
             flag_value = flag_defaults[flag]
-    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE"]:  # must be ints
+    # must be ints
+    if flag in ["PRINTER_WIDTH", "EVENT_BUFFER_SIZE", "PARSE_PROCESSES", "RELATION_CACHE_TTL"]:
         flag_value = int(flag_value)
     if flag == "PROFILES_DIR":
         flag_value = os.path.abspath(flag_value)
@@ -184,5 +212,12 @@ def get_flag_dict():
         "indirect_selection": INDIRECT_SELECTION,
         "log_cache_events": LOG_CACHE_EVENTS,
         "event_buffer_size": EVENT_BUFFER_SIZE,
+        "event_history_retain_level": EVENT_HISTORY_RETAIN_LEVEL,
+        "event_history_retain_types": EVENT_HISTORY_RETAIN_TYPES,
         "quiet": QUIET,
+        "parse_processes": PARSE_PROCESSES,
+        "binary_event_log": BINARY_EVENT_LOG,
+        "relation_cache_ttl": RELATION_CACHE_TTL,
+        "critical_path_scheduling": CRITICAL_PATH_SCHEDULING,
+        "jinja_bytecode_cache": JINJA_BYTECODE_CACHE,
     }
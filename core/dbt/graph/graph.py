@@ -1,5 +1,5 @@
-from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
+from array import array
+from typing import Dict, List, Set, Iterable, Iterator, Optional, NewType, Tuple
 import networkx as nx  # type: ignore
 
 from dbt.exceptions import InternalException
@@ -7,13 +7,99 @@ from dbt.exceptions import InternalException
 UniqueId = NewType("UniqueId", str)
 
 
+def _build_adjacency(
+    ids: List[UniqueId], index: Dict[UniqueId, int], neighbors
+) -> Tuple[array, array]:
+    """Return the offsets and targets arrays of a compressed sparse row
+    adjacency. The neighbors of node i are targets[offsets[i]:offsets[i + 1]].
+    """
+    offsets = array("i", [0])
+    targets = array("i")
+    for unique_id in ids:
+        targets.extend(index[neighbor] for neighbor in neighbors(unique_id))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+class CompactGraph:
+    """A read-only copy of a graph's edges, as int32 arrays indexed by the
+    position of each node.
+
+    Walking the graph this way doesn't build the dicts and views that
+    networkx traversals do, so searches over many nodes are much faster.
+    The copy isn't updated if the graph changes.
+    """
+
+    def __init__(self, graph: nx.DiGraph) -> None:
+        self.ids: List[UniqueId] = list(graph)
+        self.index: Dict[UniqueId, int] = {
+            unique_id: position for position, unique_id in enumerate(self.ids)
+        }
+        self._children = _build_adjacency(self.ids, self.index, graph.successors)
+        self._parents = _build_adjacency(self.ids, self.index, graph.predecessors)
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self.index
+
+    def reachable(
+        self,
+        sources: Iterable[UniqueId],
+        parents: bool = False,
+        max_depth: Optional[int] = None,
+    ) -> Set[UniqueId]:
+        """Return the nodes that can be reached from any of the sources in
+        at most max_depth steps, following edges backwards if 'parents' is
+        set.
+
+        In an acyclic graph, this is the union of the descendants (or
+        ancestors) of each source: a source is only included if it can be
+        reached from another source.
+        """
+        offsets, targets = self._parents if parents else self._children
+        seen = bytearray(len(self.ids))
+        is_source = bytearray(len(self.ids))
+        frontier = [self.index[unique_id] for unique_id in sources]
+        for position in frontier:
+            seen[position] = 1
+            is_source[position] = 1
+
+        reached: List[int] = []
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for position in frontier:
+                for neighbor in targets[offsets[position] : offsets[position + 1]]:
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        next_frontier.append(neighbor)
+                        reached.append(neighbor)
+                    elif is_source[neighbor] == 1:
+                        # mark sources reached from another source only once
+                        is_source[neighbor] = 2
+                        reached.append(neighbor)
+            frontier = next_frontier
+        return {self.ids[position] for position in reached}
+
+
 class Graph:
     """A wrapper around the networkx graph that understands SelectionCriteria
     and how they interact with the graph.
+
+    Ancestors and descendants are found with a CompactGraph, built the first
+    time one is needed. Don't change the networkx graph after selecting from
+    it.
     """
 
     def __init__(self, graph):
         self.graph = graph
+        self._compact: Optional[CompactGraph] = None
+
+    @property
+    def compact(self) -> CompactGraph:
+        if self._compact is None:
+            self._compact = CompactGraph(self.graph)
+        return self._compact
 
     def nodes(self) -> Set[UniqueId]:
         return set(self.graph.nodes())
@@ -24,24 +110,22 @@ class Graph:
     def __iter__(self) -> Iterator[UniqueId]:
         return iter(self.graph.nodes())
 
+    def _check_nodes(self, nodes: Iterable[UniqueId]) -> List[UniqueId]:
+        nodes = list(nodes)
+        for node in nodes:
+            if node not in self.compact:
+                raise InternalException(f"Node {node} not found in the graph!")
+        return nodes
+
     def ancestors(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes having a path to `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise InternalException(f"Node {node} not found in the graph!")
-        # This used to use nx.utils.reversed(self.graph), but that is deprecated,
-        # so changing to use self.graph.reverse(copy=False) as recommeneded
-        G = self.graph.reverse(copy=False) if self.graph.is_directed() else self.graph
-        anc = nx.single_source_shortest_path_length(G=G, source=node, cutoff=max_depth).keys()
-        return anc - {node}
+        nodes = self._check_nodes([node])
+        return self.compact.reachable(nodes, parents=True, max_depth=max_depth)
 
     def descendants(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes reachable from `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise InternalException(f"Node {node} not found in the graph!")
-        des = nx.single_source_shortest_path_length(
-            G=self.graph, source=node, cutoff=max_depth
-        ).keys()
-        return des - {node}
+        nodes = self._check_nodes([node])
+        return self.compact.reachable(nodes, max_depth=max_depth)
 
     def select_childrens_parents(self, selected: Set[UniqueId]) -> Set[UniqueId]:
         ancestors_for = self.select_children(selected) | selected
@@ -50,57 +134,128 @@ class Graph:
     def select_children(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        descendants: Set[UniqueId] = set()
-        for node in selected:
-            descendants.update(self.descendants(node, max_depth))
-        return descendants
+        nodes = self._check_nodes(selected)
+        return self.compact.reachable(nodes, max_depth=max_depth)
 
     def select_parents(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        ancestors: Set[UniqueId] = set()
-        for node in selected:
-            ancestors.update(self.ancestors(node, max_depth))
-        return ancestors
+        nodes = self._check_nodes(selected)
+        return self.compact.reachable(nodes, parents=True, max_depth=max_depth)
 
     def select_successors(self, selected: Set[UniqueId]) -> Set[UniqueId]:
-        successors: Set[UniqueId] = set()
-        for node in selected:
-            successors.update(self.graph.successors(node))
-        return successors
+        nodes = self._check_nodes(selected)
+        return self.compact.reachable(nodes, max_depth=1)
+
+    def _reached_through_removed(
+        self, node: UniqueId, include_nodes: Set[UniqueId]
+    ) -> Set[UniqueId]:
+        """Return the included nodes that can be reached from a removed node
+        by only going through other removed nodes.
+        """
+        reached: Set[UniqueId] = set()
+        seen = {node}
+        to_visit = [node]
+        while to_visit:
+            for child in self.graph.successors(to_visit.pop()):
+                if child in include_nodes:
+                    reached.add(child)
+                elif child not in seen:
+                    seen.add(child)
+                    to_visit.append(child)
+        return reached
+
+    def _reached_from_removed(
+        self, starts: Iterable[UniqueId], include_nodes: Set[UniqueId]
+    ) -> Dict[UniqueId, Set[UniqueId]]:
+        """For each removed node that can be reached from 'starts', find the
+        included nodes it reaches by only going through other removed nodes.
+
+        A removed node reaches what its children reach, so each removed node
+        is visited once, children first. If the removed nodes form a cycle,
+        each one is searched separately instead.
+        """
+        reached: Dict[UniqueId, Set[UniqueId]] = {}
+        for start in starts:
+            if start in reached:
+                continue
+            visiting = {start}
+            stack = [(start, iter(self.graph.successors(start)))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child in include_nodes or child in reached:
+                        continue
+                    if child in visiting:
+                        return {
+                            node: self._reached_through_removed(node, include_nodes)
+                            for node in self.graph
+                            if node not in include_nodes
+                        }
+                    visiting.add(child)
+                    stack.append((child, iter(self.graph.successors(child))))
+                    break
+                else:
+                    stack.pop()
+                    visiting.remove(node)
+                    node_reached: Set[UniqueId] = set()
+                    for child in self.graph.successors(node):
+                        if child in include_nodes:
+                            node_reached.add(child)
+                        else:
+                            node_reached.update(reached[child])
+                    reached[node] = node_reached
+        return reached
 
     def get_subset_graph(self, selected: Iterable[UniqueId]) -> "Graph":
         """Create and return a new graph that is a shallow copy of the graph,
         but with only the nodes in include_nodes. Transitive edges across
         removed nodes are preserved as explicit new edges.
-        """
 
-        new_graph = self.graph.copy()
+        Only the removed nodes that can be reached from an included node are
+        looked at, so selecting a few nodes from a large graph is fast.
+        """
         include_nodes = set(selected)
 
-        for node in self:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target) for source, target in new_edges if source != target
-                ]  # removes cyclic refs
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is " "it disabled?".format(node)
                 )
 
+        new_graph = self.graph.__class__()
+        new_graph.graph.update(self.graph.graph)
+        new_graph.add_nodes_from(
+            (node, data.copy())
+            for node, data in self.graph.nodes(data=True)
+            if node in include_nodes
+        )
+
+        removed_children = {
+            child
+            for node in new_graph
+            for child in self.graph.successors(node)
+            if child not in include_nodes
+        }
+        reached = self._reached_from_removed(removed_children, include_nodes)
+
+        for source in list(new_graph):
+            children = self.graph.adj[source]
+            new_graph.add_edges_from(
+                (source, target, data.copy())
+                for target, data in children.items()
+                if target in include_nodes
+            )
+            for child in children:
+                if child not in include_nodes:
+                    new_graph.add_edges_from(
+                        (source, target) for target in reached[child] if target != source
+                    )
+
         return Graph(new_graph)
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
         return Graph(self.graph.subgraph(nodes))
 
     def get_dependent_nodes(self, node: UniqueId):
-        return nx.descendants(self.graph, node)
+        return self.descendants(node)
@@ -2,7 +2,7 @@ import networkx as nx  # type: ignore
 import threading
 
 from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from typing import Dict, Set, List, Generator, Iterable, Mapping, Optional
 
 from .graph import UniqueId
 from dbt.contracts.graph.parsed import ParsedSourceDefinition, ParsedExposure, ParsedMetric
@@ -20,7 +20,13 @@ class GraphQueue:
     the same time, as there is an unlocked race!
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]):
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        durations: Optional[Mapping[UniqueId, float]] = None,
+    ):
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
@@ -33,10 +39,13 @@ class GraphQueue:
         self.queued: Set[UniqueId] = set()
         # this lock controls most things
         self.lock = threading.Lock()
+        # the number of unfinished parents of each node. A node is queued
+        # once all of its parents are done.
+        self._in_degree: Dict[UniqueId, int] = dict(self.graph.in_degree())
         # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        self._scores = self._get_scores(self.graph, durations)
         # populate the initial queue
-        self._find_new_additions()
+        self._find_new_additions(self._in_degree)
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -82,29 +91,44 @@ class GraphQueue:
                         new_zero_indegree.append(child)
             zero_indegree = new_zero_indegree
 
-    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
+    def _get_scores(
+        self, graph: nx.DiGraph, durations: Optional[Mapping[UniqueId, float]] = None
+    ) -> Dict[str, float]:
         """Scoring nodes for processing order.
 
-        Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
+        Without durations, scores are calculated by the graph depth level.
+        With the durations of a previous run, the score is the length of the
+        longest chain of nodes still to run from each node on, so the nodes
+        that hold up the most work start first. Nodes that didn't run before
+        count as taking the average duration. Lowest score should be
+        processed first.
 
         Args:
             graph: The graph to be scored.
+            durations: The execution time in seconds of each node in a previous run.
 
         Returns:
             A dictionary consisting of `node name`:`score` pairs.
         """
-        # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
-
-        # score all nodes in all subgraphs
-        scores = {}
-        for subgraph in subgraphs:
-            grouped_nodes = self._grouped_topological_sort(subgraph)
-            for level, group in enumerate(grouped_nodes):
-                for node in group:
-                    scores[node] = level
-
-        return scores
+        levels = list(self._grouped_topological_sort(graph))
+        level_scores: Dict[str, float] = {
+            node: level for level, group in enumerate(levels) for node in group
+        }
+        if not durations:
+            return level_scores
+        known = [durations[node] for node in graph if node in durations]
+        if not known:
+            return level_scores
+
+        default_duration = sum(known) / len(known)
+        remaining: Dict[str, float] = {}
+        for group in reversed(levels):
+            for node in group:
+                longest_child = max(
+                    (remaining[child] for child in graph.successors(node)), default=0.0
+                )
+                remaining[node] = durations.get(UniqueId(node), default_duration) + longest_child
+        return {node: -length for node, length in remaining.items()}
 
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
@@ -152,26 +176,35 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
-    def _find_new_additions(self) -> None:
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+    def _find_new_additions(self, candidates: Iterable[UniqueId]) -> None:
+        """Add the candidate nodes that have no unfinished parents left to
+        the internal queue.
+
+        Callers must hold the lock.
         """
-        for node, in_degree in self.graph.in_degree():
-            if not self._already_known(node) and in_degree == 0:
+        for node in candidates:
+            if self._in_degree[node] == 0 and not self._already_known(node):
                 self.inner.put((self._scores[node], node))
                 self.queued.add(node)
 
     def mark_done(self, node_id: UniqueId) -> None:
         """Given a node's unique ID, mark it as done.
 
+        Only the node's children can become ready, so they're the only
+        nodes checked.
+
         This method takes the lock.
 
         :param str node_id: The node ID to mark as complete.
         """
         with self.lock:
             self.in_progress.remove(node_id)
+            children = list(self.graph.successors(node_id))
+            for child in children:
+                self._in_degree[child] -= 1
+            del self._in_degree[node_id]
             self.graph.remove_node(node_id)
-            self._find_new_additions()
+            self._find_new_additions(children)
             self.inner.task_done()
             self.some_task_done.notify_all()
 
@@ -1,4 +1,4 @@
-from typing import Set, List, Optional, Tuple
+from typing import Any, Dict, Set, List, Mapping, Optional, Tuple
 
 from .graph import Graph, UniqueId
 from .queue import GraphQueue
@@ -14,7 +14,7 @@ from dbt.exceptions import (
     warn_or_error,
 )
 from dbt.contracts.graph.compiled import GraphMemberNode
-from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.manifest import Manifest, summarize_member
 from dbt.contracts.state import PreviousState
 
 
@@ -57,6 +57,9 @@ class NodeSelector(MethodManager):
             unique_id for unique_id in self.full_graph.nodes() if self._is_graph_member(unique_id)
         }
         self.graph = self.full_graph.subgraph(graph_members)
+        # the direct and indirect nodes selected by each criteria, which can
+        # be repeated across a selector's definitions and in yaml selectors
+        self._criteria_cache: Dict[Tuple[Any, ...], Tuple[Set[UniqueId], Set[UniqueId]]] = {}
 
     def select_included(
         self,
@@ -118,13 +121,41 @@ class NodeSelector(MethodManager):
             additional.update(self.graph.select_children(selected, depth))
         return additional
 
+    def get_cached_nodes_from_criteria(
+        self, spec: SelectionCriteria
+    ) -> Tuple[Set[UniqueId], Set[UniqueId]]:
+        """Like get_nodes_from_criteria, but criteria that were already
+        resolved by this selector aren't searched for again.
+        """
+        key = (
+            spec.method,
+            tuple(spec.method_arguments),
+            spec.value,
+            spec.childrens_parents,
+            spec.parents,
+            spec.parents_depth,
+            spec.children,
+            spec.children_depth,
+            spec.indirect_selection,
+        )
+        try:
+            cached = self._criteria_cache.get(key)
+        except TypeError:
+            # values from yaml selectors can be unhashable
+            return self.get_nodes_from_criteria(spec)
+        if cached is None:
+            cached = self._criteria_cache[key] = self.get_nodes_from_criteria(spec)
+        direct_nodes, indirect_nodes = cached
+        # callers are free to change the sets they get back
+        return set(direct_nodes), set(indirect_nodes)
+
     def select_nodes_recursively(self, spec: SelectionSpec) -> Tuple[Set[UniqueId], Set[UniqueId]]:
         """If the spec is a composite spec (a union, difference, or intersection),
         recurse into its selections and combine them. If the spec is a concrete
         selection criteria, resolve that using the given graph.
         """
         if isinstance(spec, SelectionCriteria):
-            direct_nodes, indirect_nodes = self.get_nodes_from_criteria(spec)
+            direct_nodes, indirect_nodes = self.get_cached_nodes_from_criteria(spec)
         else:
             bundles = [self.select_nodes_recursively(component) for component in spec]
 
@@ -158,14 +189,13 @@ class NodeSelector(MethodManager):
 
     def _is_graph_member(self, unique_id: UniqueId) -> bool:
         if unique_id in self.manifest.sources:
-            source = self.manifest.sources[unique_id]
-            return source.config.enabled
+            return summarize_member(self.manifest.sources, unique_id).enabled
         elif unique_id in self.manifest.exposures:
             return True
         elif unique_id in self.manifest.metrics:
             return True
-        node = self.manifest.nodes[unique_id]
-        return not node.empty and node.config.enabled
+        summary = summarize_member(self.manifest.nodes, unique_id)
+        return not summary.empty and summary.enabled
 
     def node_is_match(self, node: GraphMemberNode) -> bool:
         """Determine if a node is a match for the selector. Non-match nodes
@@ -264,14 +294,17 @@ class NodeSelector(MethodManager):
 
         return filtered_nodes
 
-    def get_graph_queue(self, spec: SelectionSpec) -> GraphQueue:
+    def get_graph_queue(
+        self, spec: SelectionSpec, durations: Optional[Mapping[UniqueId, float]] = None
+    ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. If the durations of a previous run are given, nodes on
+        the longest chains are started first.
         """
         selected_nodes = self.get_selected(spec)
         new_graph = self.full_graph.get_subset_graph(selected_nodes)
         # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes)
+        return GraphQueue(new_graph.graph, self.manifest, selected_nodes, durations)
 
 
 class ResourceTypeSelector(NodeSelector):
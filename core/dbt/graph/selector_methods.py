@@ -1,7 +1,7 @@
 import abc
 from itertools import chain
 from pathlib import Path
-from typing import Set, List, Dict, Iterator, Tuple, Any, Union, Type, Optional, Callable
+from typing import Set, List, Dict, Iterator, Mapping, Tuple, Any, Union, Type, Optional, Callable
 
 from dbt.dataclass_schema import StrEnum
 
@@ -13,7 +13,7 @@ from dbt.contracts.graph.compiled import (
     CompileResultNode,
     ManifestNode,
 )
-from dbt.contracts.graph.manifest import Manifest, WritableManifest
+from dbt.contracts.graph.manifest import Manifest, WritableManifest, summarize_member
 from dbt.contracts.graph.parsed import (
     HasTestMetadata,
     ParsedSingularTestNode,
@@ -77,13 +77,150 @@ def is_selected_node(fqn: List[str], node_selector: str):
 SelectorTarget = Union[ParsedSourceDefinition, ManifestNode, ParsedExposure, ParsedMetric]
 
 
+def _flat_fqn(fqn: List[str]) -> Tuple[str, ...]:
+    # Dots in model names act as namespace separators
+    return tuple(item for segment in fqn for item in segment.split("."))
+
+
+class SelectorIndex:
+    """Indexes of the manifest used by the selector methods, so a selector
+    finds its nodes without looking at every node in the manifest.
+
+    Each index is built the first time it's used, and is shared by every
+    method created by the same MethodManager. The indexes aren't updated if
+    the manifest changes.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self._tags: Optional[Dict[str, Set[UniqueId]]] = None
+        self._packages: Optional[Dict[str, Set[UniqueId]]] = None
+        self._fqn_leaves: Optional[Dict[str, Set[UniqueId]]] = None
+        self._fqn_prefixes: Optional[Dict[Tuple[str, ...], Dict[UniqueId, int]]] = None
+        self._paths: Optional[Dict[Tuple[Path, Path], Set[UniqueId]]] = None
+        self._configs: Dict[Tuple[str, ...], List[Tuple[Any, Set[UniqueId]]]] = {}
+
+    def _all_nodes(self) -> Iterator[Tuple[UniqueId, SelectorTarget]]:
+        all_records: Tuple[Mapping[str, SelectorTarget], ...] = (
+            self.manifest.nodes,
+            self.manifest.sources,
+            self.manifest.exposures,
+            self.manifest.metrics,
+        )
+        for records in all_records:
+            for key, node in records.items():
+                yield UniqueId(key), node
+
+    def tag(self, tag: str) -> Set[UniqueId]:
+        if self._tags is None:
+            self._tags = {}
+            for unique_id, node in self._all_nodes():
+                for node_tag in node.tags:
+                    self._tags.setdefault(node_tag, set()).add(unique_id)
+        return self._tags.get(tag, set())
+
+    def package(self, package_name: str) -> Set[UniqueId]:
+        if self._packages is None:
+            self._packages = {}
+            for unique_id, node in self._all_nodes():
+                self._packages.setdefault(node.package_name, set()).add(unique_id)
+        return self._packages.get(package_name, set())
+
+    def _build_fqn_index(self) -> None:
+        self._fqn_leaves = {}
+        self._fqn_prefixes = {}
+        for key in self.manifest.nodes:
+            unique_id = UniqueId(key)
+            fqn = summarize_member(self.manifest.nodes, unique_id).fqn
+            self._fqn_leaves.setdefault(fqn[-1], set()).add(unique_id)
+            # Every prefix of the flattened fqn, with and without the
+            # package name, is a key. Each node keeps the length of its
+            # flattened fqn, which has to be at least the length of the
+            # selector.
+            for names in (_flat_fqn(fqn), _flat_fqn(fqn[1:])):
+                for end in range(len(names) + 1):
+                    prefix = self._fqn_prefixes.setdefault(names[:end], {})
+                    prefix[unique_id] = max(prefix.get(unique_id, 0), len(names))
+
+    def fqn(self, qualified_name: str) -> Set[UniqueId]:
+        """The nodes selected by a qualified name, matching nodes the same
+        way as is_selected_node does for the fqn with and without the
+        package name.
+        """
+        if self._fqn_leaves is None or self._fqn_prefixes is None:
+            self._build_fqn_index()
+        assert self._fqn_leaves is not None and self._fqn_prefixes is not None
+        parts = qualified_name.split(".")
+        prefix = tuple(parts)
+        if SELECTOR_GLOB in parts:
+            prefix = prefix[: parts.index(SELECTOR_GLOB)]
+        matches = {
+            unique_id
+            for unique_id, length in self._fqn_prefixes.get(prefix, {}).items()
+            if length >= len(parts)
+        }
+        return matches | self._fqn_leaves.get(qualified_name, set())
+
+    def path(self, root: Path, paths: Set[Path]) -> Set[UniqueId]:
+        """The nodes under root whose original file path, or one of its
+        parent directories, is in paths.
+        """
+        if self._paths is None:
+            self._paths = {}
+            for unique_id, node in self._all_nodes():
+                node_root = Path(node.root_path)
+                ofp = Path(node.original_file_path)
+                for path in (ofp, *ofp.parents):
+                    self._paths.setdefault((node_root, path), set()).add(unique_id)
+        matches: Set[UniqueId] = set()
+        for path in paths:
+            matches.update(self._paths.get((root, path), set()))
+        return matches
+
+    def config(self, attrs: List[str]) -> List[Tuple[Any, Set[UniqueId]]]:
+        """The distinct values of a config attribute, with the nodes and
+        sources that have each one.
+        """
+        key = tuple(attrs)
+        if key not in self._configs:
+            values: List[Tuple[Any, Set[UniqueId]]] = []
+            by_value: Dict[Any, Set[UniqueId]] = {}
+            configured: Tuple[Mapping[str, Union[ManifestNode, ParsedSourceDefinition]], ...] = (
+                self.manifest.nodes,
+                self.manifest.sources,
+            )
+            for records in configured:
+                for unique_id, node in records.items():
+                    try:
+                        value = _getattr_descend(node.config, attrs)
+                    except AttributeError:
+                        continue
+                    try:
+                        matches = by_value.get(value)
+                    except TypeError:
+                        # unhashable values can't be grouped
+                        values.append((value, {UniqueId(unique_id)}))
+                        continue
+                    if matches is None:
+                        matches = by_value[value] = set()
+                        values.append((value, matches))
+                    matches.add(UniqueId(unique_id))
+            self._configs[key] = values
+        return self._configs[key]
+
+
 class SelectorMethod(metaclass=abc.ABCMeta):
     def __init__(
-        self, manifest: Manifest, previous_state: Optional[PreviousState], arguments: List[str]
+        self,
+        manifest: Manifest,
+        previous_state: Optional[PreviousState],
+        arguments: List[str],
+        index: Optional[SelectorIndex] = None,
     ):
         self.manifest: Manifest = manifest
         self.previous_state = previous_state
         self.arguments: List[str] = arguments
+        self.index: SelectorIndex = index if index is not None else SelectorIndex(manifest)
 
     def parsed_nodes(
         self, included_nodes: Set[UniqueId]
@@ -182,18 +319,13 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
-        parsed_nodes = list(self.parsed_nodes(included_nodes))
-        for node, real_node in parsed_nodes:
-            if self.node_is_match(selector, real_node.fqn):
-                yield node
+        yield from self.index.fqn(selector) & included_nodes
 
 
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for node, real_node in self.all_nodes(included_nodes):
-            if selector in real_node.tags:
-                yield node
+        yield from self.index.tag(selector) & included_nodes
 
 
 class SourceSelectorMethod(SelectorMethod):
@@ -283,22 +415,13 @@ class PathSelectorMethod(SelectorMethod):
         # use '.' and not 'root' for easy comparison
         root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
-        for node, real_node in self.all_nodes(included_nodes):
-            if Path(real_node.root_path) != root:
-                continue
-            ofp = Path(real_node.original_file_path)
-            if ofp in paths:
-                yield node
-            elif any(parent in paths for parent in ofp.parents):
-                yield node
+        yield from self.index.path(root, paths) & included_nodes
 
 
 class PackageSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that have the specified package"""
-        for node, real_node in self.all_nodes(included_nodes):
-            if real_node.package_name == selector:
-                yield node
+        yield from self.index.package(selector) & included_nodes
 
 
 def _getattr_descend(obj: Any, attrs: List[str]) -> Any:
@@ -340,14 +463,9 @@ class ConfigSelectorMethod(SelectorMethod):
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
         # add more someday, so search them anyway.
-        for node, real_node in self.configurable_nodes(included_nodes):
-            try:
-                value = _getattr_descend(real_node.config, parts)
-            except AttributeError:
-                continue
-            else:
-                if selector == value:
-                    yield node
+        for value, nodes in self.index.config(parts):
+            if selector == value:
+                yield from nodes & included_nodes
 
 
 class ResourceTypeSelectorMethod(SelectorMethod):
@@ -550,6 +668,7 @@ class MethodManager:
     ):
         self.manifest = manifest
         self.previous_state = previous_state
+        self.index = SelectorIndex(manifest)
 
     def get_method(self, method: MethodName, method_arguments: List[str]) -> SelectorMethod:
 
@@ -559,4 +678,4 @@ class MethodManager:
                 f"method name, but it is not handled"
             )
         cls: Type[SelectorMethod] = self.SELECTOR_METHODS[method]
-        return cls(self.manifest, self.previous_state, method_arguments)
+        return cls(self.manifest, self.previous_state, method_arguments, self.index)
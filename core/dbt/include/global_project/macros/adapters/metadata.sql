@@ -63,3 +63,13 @@
   {{ exceptions.raise_not_implemented(
     'list_relations_without_caching macro not implemented for adapter '+adapter.type()) }}
 {% endmacro %}
+
+
+{% macro list_relations_in_schemas_without_caching(schema_relations) %}
+  {{ return(adapter.dispatch('list_relations_in_schemas_without_caching', 'dbt')(schema_relations)) }}
+{% endmacro %}
+
+{% macro default__list_relations_in_schemas_without_caching(schema_relations) %}
+  {{ exceptions.raise_not_implemented(
+    'list_relations_in_schemas_without_caching macro not implemented for adapter '+adapter.type()) }}
+{% endmacro %}
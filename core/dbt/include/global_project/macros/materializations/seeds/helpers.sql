@@ -62,6 +62,27 @@
 {% endmacro %}
 
 
+{% macro seed_bulk_load_enabled(model) -%}
+  {{ return(adapter.dispatch('seed_bulk_load_enabled', 'dbt')(model)) }}
+{%- endmacro %}
+
+{% macro default__seed_bulk_load_enabled(model) %}
+  {# adapters that implement load_csv_file can load seeds in bulk, when the
+     seed sets `bulk_load: true` in its config #}
+  {{ return(false) }}
+{% endmacro %}
+
+
+{% macro get_seed_sample_size() -%}
+  {{ return(adapter.dispatch('get_seed_sample_size', 'dbt')()) }}
+{%- endmacro %}
+
+{% macro default__get_seed_sample_size() %}
+  {# the number of rows the column types are inferred from when a seed is loaded in bulk #}
+  {{ return(10000) }}
+{% endmacro %}
+
+
 {% macro get_seed_column_quoted_csv(model, column_names) %}
   {%- set quote_seed_column = model['config'].get('quote_columns', None) -%}
     {% set quoted = [] %}
@@ -115,3 +136,15 @@
   {# Return SQL so we can render it out into the compiled files #}
   {{ return(statements[0]) }}
 {% endmacro %}
+
+
+{% macro load_csv_file(model, agate_table) -%}
+  {{ return(adapter.dispatch('load_csv_file', 'dbt')(model, agate_table)) }}
+{%- endmacro %}
+
+{% macro default__load_csv_file(model, agate_table) %}
+  {#- load every row of the seed's csv file, not just the ones in agate_table.
+      Returns the sql to render into the compiled file, and the number of rows loaded -#}
+  {{ exceptions.raise_not_implemented(
+    'load_csv_file macro not implemented for adapter '+adapter.type()) }}
+{% endmacro %}
@@ -8,7 +8,13 @@
   {%- set exists_as_table = (old_relation is not none and old_relation.is_table) -%}
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
-  {%- set agate_table = load_agate_table() -%}
+  {%- set bulk_load = seed_bulk_load_enabled(model) -%}
+  {%- if bulk_load -%}
+    {#- the column types come from the first rows, load_csv_file reads the rest -#}
+    {%- set agate_table = load_agate_table(row_limit=get_seed_sample_size()) -%}
+  {%- else -%}
+    {%- set agate_table = load_agate_table() -%}
+  {%- endif -%}
   {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
 
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
@@ -27,8 +33,14 @@
   {% endif %}
 
   {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
-  {% set sql = load_csv_rows(model, agate_table) %}
+  {% if bulk_load %}
+    {% set loaded = load_csv_file(model, agate_table) %}
+    {% set rows_affected = loaded['rows_affected'] %}
+    {% set sql = loaded['sql'] %}
+  {% else %}
+    {% set rows_affected = (agate_table.rows | length) %}
+    {% set sql = load_csv_rows(model, agate_table) %}
+  {% endif %}
 
   {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
     {{ create_table_sql }};
@@ -9,7 +9,7 @@ from contextlib import contextmanager
 from pathlib import Path
 
 import dbt.version
-from dbt.events.functions import fire_event, setup_event_logger
+from dbt.events.functions import fire_event, flush_file_log, setup_event_logger
 from dbt.events.types import (
     MainEncounteredError,
     MainKeyboardInterrupt,
@@ -22,6 +22,7 @@ import dbt.flags as flags
 import dbt.task.build as build_task
 import dbt.task.clean as clean_task
 import dbt.task.compile as compile_task
+import dbt.task.daemon as daemon_task
 import dbt.task.debug as debug_task
 import dbt.task.deps as deps_task
 import dbt.task.freshness as freshness_task
@@ -37,6 +38,8 @@ import dbt.task.snapshot as snapshot_task
 import dbt.task.test as test_task
 from dbt.profiler import profiler
 from dbt.adapters.factory import reset_adapters, cleanup_connections
+from dbt.clients.jinja import bytecode_cache, JINJA_BYTECODE_CACHE_FILE_NAME
+from dbt.task.base import ConfiguredTask
 
 import dbt.tracking
 
@@ -182,12 +185,16 @@ def handle_and_check(args):
 
         with profiler(enable=profiler_enabled, outfile=parsed.record_timing_info):
 
-            with adapter_management():
+            try:
+                with adapter_management():
 
-                task, res = run_from_args(parsed)
-                success = task.interpret_results(res)
+                    task, res = run_from_args(parsed)
+                    success = task.interpret_results(res)
 
-            return res, success
+                return res, success
+            finally:
+                # the command's log file is complete when it returns
+                flush_file_log()
 
 
 @contextmanager
@@ -230,11 +237,26 @@ def run_from_args(parsed):
 
     results = None
 
-    with track_run(task):
+    with track_run(task), persisted_bytecode_cache(task):
         results = task.run()
     return task, results
 
 
+@contextmanager
+def persisted_bytecode_cache(task):
+    # with --jinja-bytecode-cache, tasks with a project keep the jinja they
+    # compile in its target path, so the next invocation doesn't compile the
+    # unchanged templates again
+    if not flags.JINJA_BYTECODE_CACHE or not isinstance(task, ConfiguredTask):
+        yield
+        return
+    bytecode_cache.open(os.path.join(task.config.target_path, JINJA_BYTECODE_CACHE_FILE_NAME))
+    try:
+        yield
+    finally:
+        bytecode_cache.close()
+
+
 def _build_base_subparser():
     base_subparser = argparse.ArgumentParser(add_help=False)
 
@@ -542,6 +564,38 @@ def _build_parse_subparser(subparsers, base_subparser):
     return sub
 
 
+def _build_daemon_subparser(subparsers, base_subparser):
+    sub = subparsers.add_parser(
+        "daemon",
+        parents=[base_subparser],
+        help="""
+        Keep the project parsed in memory, updating it as files change, and
+        run the parse, compile, ls and run commands sent by
+        `python -m dbt.clients.daemon`.
+        """,
+    )
+    sub.set_defaults(cls=daemon_task.DaemonTask, which="daemon", rpc_method=None)
+    sub.add_argument(
+        "--socket",
+        default=None,
+        type=str,
+        help="""
+        The unix socket to listen on. Defaults to dbt-daemon.sock in the
+        target path. Clients find it with the DBT_DAEMON_SOCKET environment
+        variable when it's somewhere else.
+        """,
+    )
+    sub.add_argument(
+        "--poll-interval",
+        default=0.5,
+        type=float,
+        help="""
+        How often, in seconds, to check the project for changed files.
+        """,
+    )
+    return sub
+
+
 def _build_docs_generate_subparser(subparsers, base_subparser):
     # it might look like docs_sub is the correct parents entry, but that
     # will cause weird errors about 'conflicting option strings'.
@@ -557,6 +611,14 @@ def _build_docs_generate_subparser(subparsers, base_subparser):
         Do not run "dbt compile" as part of docs generation
         """,
     )
+    generate_sub.add_argument(
+        "--catalog-state",
+        help="""
+        If set, reuse the catalog of the schemas that haven't changed since
+        the docs were generated with the catalog_state.json in the given
+        directory, and write a new catalog_state.json to the target path
+        """,
+    )
     return generate_sub
 
 
@@ -1073,6 +1135,78 @@ def parse_args(args, cls=DBTArgumentParser):
         """,
     )
 
+    p.add_argument(
+        "--event-history-retain-level",
+        dest="event_history_retain_level",
+        choices=["test", "debug", "info", "warn", "error"],
+        help="""
+        Keep events at or above this level in EVENT_HISTORY as they were
+        fired. Lower events are only kept as a summary. Default = info
+        """,
+    )
+
+    p.add_argument(
+        "--event-history-retain-types",
+        dest="event_history_retain_types",
+        help="""
+        A comma-separated list of event type names, like SQLQuery, to keep in
+        EVENT_HISTORY as they were fired whatever their level.
+        """,
+    )
+
+    p.add_argument(
+        "--parse-processes",
+        dest="parse_processes",
+        help="""
+        Sets the number of processes used to parse model, snapshot, analysis
+        and singular test files. Default = 1 (parse serially)
+        """,
+    )
+
+    p.add_argument(
+        "--binary-event-log",
+        action="store_true",
+        default=None,
+        help="""
+        If set, also write every logged event to dbt.events.msgpack in the
+        log path. Convert it to json log lines with
+        `python -m dbt.events.binary <path>`.
+        """,
+    )
+
+    p.add_argument(
+        "--relation-cache-ttl",
+        dest="relation_cache_ttl",
+        help="""
+        If set to a number of seconds, save the relations cache to the
+        target path at the end of a run, and use it instead of listing the
+        schemas again for that long. Default = 0 (always list the schemas)
+        """,
+    )
+
+    p.add_argument(
+        "--critical-path-scheduling",
+        action="store_true",
+        default=None,
+        help="""
+        If set, use the execution times in the run_results.json from --state
+        or the target path to start the nodes with the longest chains of
+        work after them first.
+        """,
+    )
+
+    p.add_argument(
+        "--jinja-bytecode-cache",
+        action="store_true",
+        default=None,
+        help="""
+        If set, save the python code jinja compiles templates to in the
+        target path, and load it in the next invocation that sets this flag
+        too. The saved code is executed, so only set it if nobody else can
+        write to the target path.
+        """,
+    )
+
     p.add_argument(
         "-q",
         "--quiet",
@@ -1105,6 +1239,7 @@ def parse_args(args, cls=DBTArgumentParser):
     run_sub = _build_run_subparser(subs, base_subparser)
     compile_sub = _build_compile_subparser(subs, base_subparser)
     parse_sub = _build_parse_subparser(subs, base_subparser)
+    _build_daemon_subparser(subs, base_subparser)
     generate_sub = _build_docs_generate_subparser(docs_subs, base_subparser)
     test_sub = _build_test_subparser(subs, base_subparser)
     seed_sub = _build_seed_subparser(subs, base_subparser)
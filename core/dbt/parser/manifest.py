@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
+import json
 import os
 import traceback
 from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple
@@ -27,7 +28,6 @@ from dbt.events.types import (
     PartialParsingMacroChangeStartFullParse,
     ManifestWrongMetadataVersion,
     PartialParsingVersionMismatch,
-    PartialParsingFailedBecauseConfigChange,
     PartialParsingFailedBecauseProfileChange,
     PartialParsingFailedBecauseNewProjectDependency,
     PartialParsingFailedBecauseHashChanged,
@@ -36,22 +36,20 @@ from dbt.events.types import (
     PartialParseSaveFileNotFound,
     InvalidDisabledSourceInTestNode,
     InvalidRefInTestNode,
-    PartialParsingProjectEnvVarsChanged,
-    PartialParsingProfileEnvVarsChanged,
 )
 from dbt.logger import DbtProcessState
 from dbt.node_types import NodeType
 from dbt.clients.jinja import get_rendered, MacroStack
 from dbt.clients.jinja_static import statically_extract_macro_calls
-from dbt.clients.system import make_directory
 from dbt.config import Project, RuntimeConfig
 from dbt.context.docs import generate_runtime_docs_context
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.configured import generate_macro_context
 from dbt.context.providers import ParseProvider
 from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
-from dbt.parser.read_files import read_files, load_source_file
+from dbt.parser.read_files import read_files, load_source_file, load_source_file_contents
 from dbt.parser.partial import PartialParsing, special_override_macros
+from dbt.parser.partial_store import PartialParseStore
 from dbt.contracts.graph.compiled import ManifestNode
 from dbt.contracts.graph.manifest import (
     Manifest,
@@ -84,6 +82,7 @@ from dbt.parser.docs import DocumentationParser
 from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
+from dbt.parser.parallel import ParallelParser
 from dbt.parser.schemas import SchemaParser
 from dbt.parser.search import FileBlock
 from dbt.parser.seeds import SeedParser
@@ -94,7 +93,11 @@ from dbt.version import __version__
 
 from dbt.dataclass_schema import StrEnum, dbtClassMixin
 
-PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+PARTIAL_PARSE_FILE_NAME = "partial_parse.db"
+# The parsers read these target keys directly, to pick the adapter's macros,
+# set flags and give every node its default database and schema. When one of
+# them changes, every file has to be parsed again.
+GLOBAL_TARGET_KEYS = ("type", "database", "schema", "config")
 PARSING_STATE = DbtProcessState("parsing")
 
 
@@ -160,6 +163,7 @@ class ManifestLoader:
         root_project: RuntimeConfig,
         all_projects: Mapping[str, Project],
         macro_hook: Optional[Callable[[Manifest], Any]] = None,
+        saved_manifest: Optional[Manifest] = None,
     ) -> None:
         self.root_project: RuntimeConfig = root_project
         self.all_projects: Mapping[str, Project] = all_projects
@@ -186,9 +190,14 @@ class ManifestLoader:
         # have been enabled, but not happening because of some issue.
         self.partially_parsing = False
         self.partial_parser = None
+        # Only set while parsing with more than one process
+        self.parallel_parser: Optional[ParallelParser] = None
 
-        # This is a saved manifest from a previous run that's used for partial parsing
-        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
+        # This is a saved manifest from a previous run that's used for partial parsing.
+        # A long-running process can pass in the manifest it already has in memory.
+        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse(
+            saved_manifest
+        )
 
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
@@ -198,6 +207,7 @@ class ManifestLoader:
         config: RuntimeConfig,
         *,
         reset: bool = False,
+        saved_manifest: Optional[Manifest] = None,
     ) -> Manifest:
 
         adapter = get_adapter(config)  # type: ignore
@@ -213,7 +223,7 @@ class ManifestLoader:
             start_load_all = time.perf_counter()
 
             projects = config.load_dependencies()
-            loader = cls(config, projects, macro_hook)
+            loader = cls(config, projects, macro_hook, saved_manifest)
 
             manifest = loader.load()
 
@@ -248,7 +258,12 @@ class ManifestLoader:
 
         skip_parsing = False
         if self.saved_manifest is not None:
-            self.partial_parser = PartialParsing(self.saved_manifest, self.manifest.files)
+            self.partial_parser = PartialParsing(
+                self.saved_manifest, self.manifest.files, self.manifest.state_check
+            )
+            # The files that depend on changed vars or target keys are being
+            # reparsed, so the saved manifest now matches the current state
+            self.saved_manifest.state_check = self.manifest.state_check
             skip_parsing = self.partial_parser.skip_parsing()
             if skip_parsing:
                 # nothing changed, so we don't need to generate project_parser_files
@@ -314,6 +329,7 @@ class ManifestLoader:
             # the other files are loaded.  Also need to parse tests, specifically
             # generic tests
             start_load_macros = time.perf_counter()
+            self.load_file_contents(project_parser_files)
             self.load_and_parse_macros(project_parser_files)
 
             # If we're partially parsing check that certain macros have not been changed
@@ -324,6 +340,7 @@ class ManifestLoader:
                 self.manifest = self.new_manifest  # contains newly read files
                 project_parser_files = orig_project_parser_files
                 self.partially_parsing = False
+                self.load_file_contents(project_parser_files)
                 self.load_and_parse_macros(project_parser_files)
 
             self._perf_info.load_macros_elapsed = time.perf_counter() - start_load_macros
@@ -342,12 +359,21 @@ class ManifestLoader:
                 DocumentationParser,
                 HookParser,
             ]
-            for project in self.all_projects.values():
-                if project.project_name not in project_parser_files:
-                    continue
-                self.parse_project(
-                    project, project_parser_files[project.project_name], parser_types
+            if flags.PARSE_PROCESSES > 1:
+                self.parallel_parser = ParallelParser(
+                    self.root_project, self.all_projects, self.manifest, flags.PARSE_PROCESSES
                 )
+            try:
+                for project in self.all_projects.values():
+                    if project.project_name not in project_parser_files:
+                        continue
+                    self.parse_project(
+                        project, project_parser_files[project.project_name], parser_types
+                    )
+            finally:
+                if self.parallel_parser is not None:
+                    self.parallel_parser.close()
+                    self.parallel_parser = None
 
             # Now that we've loaded most of the nodes (except for schema tests and sources)
             # load up the Lookup objects to resolve them by name, so the SourceFiles store
@@ -399,11 +425,24 @@ class ManifestLoader:
                 self.manifest._parsing_info.static_analysis_path_count
             )
 
+            # A manifest is only saved once it's been checked for duplicate
+            # resources, so a manifest that's loaded from the partial parse
+            # store without changes doesn't need to be checked again.
+            _check_resource_uniqueness(self.manifest, self.root_project)
+
             # write out the fully parsed manifest
             self.write_manifest_for_partial_parse()
 
         return self.manifest
 
+    # Files that haven't changed since the saved manifest was written aren't
+    # read by read_files. Read the ones that are going to be parsed.
+    def load_file_contents(self, project_parser_files):
+        for parser_files in project_parser_files.values():
+            for file_ids in parser_files.values():
+                for file_id in file_ids:
+                    load_source_file_contents(self.manifest.files[file_id])
+
     def load_and_parse_macros(self, project_parser_files):
         for project in self.all_projects.values():
             if project.project_name not in project_parser_files:
@@ -456,18 +495,24 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
-                block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
+            if self.parallel_parser and self.parallel_parser.can_parse(
+                parser, parser_files[parser_name]
+            ):
+                self.parallel_parser.parse_files(parser, parser_files[parser_name], self.manifest)
+                project_parsed_path_count = len(parser_files[parser_name])
+            else:
+                for file_id in parser_files[parser_name]:
+                    block = FileBlock(self.manifest.files[file_id])
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        if self.partially_parsing:
+                            dct = block.file.pp_dict
+                        else:
+                            dct = block.file.dict_from_yaml
+                        parser.parse_file(block, dct=dct)
                     else:
-                        dct = block.file.dict_from_yaml
-                    parser.parse_file(block, dct=dct)
-                else:
-                    parser.parse_file(block)
-                project_parsed_path_count += 1
+                        parser.parse_file(block)
+                    project_parsed_path_count += 1
 
             # Save timing info
             project_loader_info.parsers.append(
@@ -544,10 +589,7 @@ class ManifestLoader:
                     ManifestWrongMetadataVersion(version=self.manifest.metadata.dbt_version)
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack()
-            make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            PartialParseStore(path).write(self.manifest)
         except Exception:
             raise
 
@@ -567,30 +609,16 @@ class ManifestLoader:
             )
             # If the version is wrong, the other checks might not work
             return False, ReparseReason.version_mismatch
-        if self.manifest.state_check.vars_hash != manifest.state_check.vars_hash:
-            fire_event(PartialParsingFailedBecauseConfigChange())
-            valid = False
-            reparse_reason = ReparseReason.vars_changed
-        if self.manifest.state_check.profile_hash != manifest.state_check.profile_hash:
-            # Note: This should be made more granular. We shouldn't need to invalidate
-            # partial parsing if a non-used profile section has changed.
+        # Changing vars or the profile only reparses the files that read the
+        # vars and target keys that changed, see PartialParsing. Env vars in
+        # dbt_project.yml change the rendered project, checked below.
+        changed_target_keys = ManifestStateCheck.changed_keys(
+            manifest.state_check.target_hashes, self.manifest.state_check.target_hashes
+        )
+        if changed_target_keys.intersection(GLOBAL_TARGET_KEYS):
             fire_event(PartialParsingFailedBecauseProfileChange())
             valid = False
             reparse_reason = ReparseReason.profile_changed
-        if (
-            self.manifest.state_check.project_env_vars_hash
-            != manifest.state_check.project_env_vars_hash
-        ):
-            fire_event(PartialParsingProjectEnvVarsChanged())
-            valid = False
-            reparse_reason = ReparseReason.proj_env_vars_changed
-        if (
-            self.manifest.state_check.profile_env_vars_hash
-            != manifest.state_check.profile_env_vars_hash
-        ):
-            fire_event(PartialParsingProfileEnvVarsChanged())
-            valid = False
-            reparse_reason = ReparseReason.prof_env_vars_changed
 
         missing_keys = {
             k
@@ -628,7 +656,9 @@ class ManifestLoader:
                     return True
         return False
 
-    def read_manifest_for_partial_parse(self) -> Optional[Manifest]:
+    def read_manifest_for_partial_parse(
+        self, saved_manifest: Optional[Manifest] = None
+    ) -> Optional[Manifest]:
         if not flags.PARTIAL_PARSE:
             fire_event(PartialParsingNotEnabled())
             return None
@@ -636,11 +666,10 @@ class ManifestLoader:
 
         reparse_reason = None
 
-        if os.path.exists(path):
+        store = PartialParseStore(path)
+        if saved_manifest is not None or store.exists():
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp)  # type: ignore
+                manifest: Manifest = saved_manifest if saved_manifest is not None else store.read()
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
@@ -677,22 +706,14 @@ class ManifestLoader:
             mli._project_index[project.project_name] = project_info
         return mli
 
-    # TODO: this should be calculated per-file based on the vars() calls made in
-    # parsing, so changing one var doesn't invalidate everything. also there should
-    # be something like that for env_var - currently changing env_vars in way that
-    # impact graph selection or configs will result in weird test failures.
-    # finally, we should hash the actual profile used, not just root project +
-    # profiles.yml + relevant args. While sufficient, it is definitely overkill.
     def build_manifest_state_check(self):
         config = self.root_project
         all_projects = self.all_projects
-        # if any of these change, we need to reject the parser
+        # The project hashes and the global target keys decide whether the
+        # saved manifest can be used at all. The var and target hashes decide
+        # which of its files need to be parsed again.
 
         # Create a FileHash of vars string, profile name and target name
-        # This does not capture vars in dbt_project, just the command line
-        # arg vars, but since any changes to that file will cause state_check
-        # to not pass, it doesn't matter.  If we move to more granular checking
-        # of env_vars, that would need to change.
         vars_hash = FileHash.from_contents(
             "\x00".join(
                 [
@@ -725,12 +746,38 @@ class ManifestLoader:
         with open(profile_path) as fp:
             profile_hash = FileHash.from_contents(fp.read())
 
-        # Create a FileHashes for dbt_project for all dependencies
+        # Create FileHashes for dbt_project for all dependencies. The rendered
+        # project config is included, because vars, the target and env vars
+        # used in dbt_project.yml change it without changing the file.
         project_hashes = {}
         for name, project in all_projects.items():
             path = os.path.join(project.project_root, "dbt_project.yml")
             with open(path) as fp:
-                project_hashes[name] = FileHash.from_contents(fp.read())
+                contents = fp.read()
+            rendered = project.to_project_config(with_packages=True)
+            if name == config.project_name:
+                rendered["selectors"] = config.manifest_selectors
+            project_hashes[name] = FileHash.from_contents(
+                "\x00".join([contents, json.dumps(rendered, sort_keys=True, default=str)])
+            )
+
+        # Create FileHashes for each cli var and each key of the target. The
+        # target includes the active profile, and env vars used in it.
+        var_hashes = {
+            name: FileHash.from_contents(json.dumps(value, sort_keys=True, default=str))
+            for name, value in config.cli_vars.items()
+        }
+        target = config.to_target_dict()
+        target.update(
+            {
+                "database": config.credentials.database,
+                "schema": config.credentials.schema,
+            }
+        )
+        target_hashes = {
+            key: FileHash.from_contents(json.dumps(value, sort_keys=True, default=str))
+            for key, value in target.items()
+        }
 
         # Create the ManifestStateCheck object
         state_check = ManifestStateCheck(
@@ -739,6 +786,8 @@ class ManifestLoader:
             vars_hash=vars_hash,
             profile_hash=profile_hash,
             project_hashes=project_hashes,
+            var_hashes=var_hashes,
+            target_hashes=target_hashes,
         )
         return state_check
 
@@ -969,7 +1018,7 @@ def _warn_for_unused_resource_config_paths(manifest: Manifest, config: RuntimeCo
 
 
 def _check_manifest(manifest: Manifest, config: RuntimeConfig) -> None:
-    _check_resource_uniqueness(manifest, config)
+    # resource uniqueness is checked in ManifestLoader.load
     _warn_for_unused_resource_config_paths(manifest, config)
 
 
@@ -0,0 +1,236 @@
+import os
+from argparse import Namespace
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Type, cast
+
+import dbt.flags as flags
+from dbt.adapters.factory import load_plugin, register_adapter
+from dbt.clients.jinja import bytecode_cache, JINJA_BYTECODE_CACHE_FILE_NAME
+from dbt.config import Project, RuntimeConfig
+from dbt.contracts.files import SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ManifestNodes, ParsedMacro
+from dbt.parser.analysis import AnalysisParser
+from dbt.parser.base import Parser
+from dbt.parser.models import ModelParser
+from dbt.parser.search import FileBlock
+from dbt.parser.singular_test import SingularTestParser
+from dbt.parser.snapshots import SnapshotParser
+
+# These parsers only read macros from the manifest and only write the nodes
+# of the file being parsed, so their files can be parsed independently.
+PARALLEL_PARSERS: Dict[str, Type[Parser]] = {
+    "ModelParser": ModelParser,
+    "SnapshotParser": SnapshotParser,
+    "AnalysisParser": AnalysisParser,
+    "SingularTestParser": SingularTestParser,
+}
+
+# Below this number of files, starting the worker processes costs more than
+# parsing the files serially.
+MIN_PARALLEL_FILES = 500
+
+# Split each parser's files into several chunks per process, so one slow
+# chunk doesn't leave the other processes idle.
+CHUNKS_PER_PROCESS = 4
+
+
+@dataclass
+class ParsedFileResult:
+    file: SourceFile
+    nodes: List[ManifestNodes] = field(default_factory=list)
+    disabled: List[ManifestNodes] = field(default_factory=list)
+    env_vars: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ParsedChunk:
+    results: List[ParsedFileResult] = field(default_factory=list)
+    static_analysis_path_count: int = 0
+    static_analysis_parsed_path_count: int = 0
+    # the jinja bytecode cache entries the chunk added
+    compiled: List[Tuple[bytes, bytes]] = field(default_factory=list)
+
+
+ChunkTask = Tuple[str, str, List[SourceFile]]
+
+
+class _WorkerState:
+    def __init__(
+        self,
+        root_project: RuntimeConfig,
+        all_projects: Mapping[str, Project],
+        macros: MutableMapping[str, ParsedMacro],
+    ) -> None:
+        self.root_project = root_project
+        self.all_projects = all_projects
+        # A single manifest holding every macro is shared by all parsers in
+        # the worker. Its nodes are reset for every file that gets parsed.
+        self.manifest = Manifest(macros=macros)
+        self.manifest.metadata = root_project.get_metadata()
+        self.parsers: Dict[Tuple[str, str], Parser] = {}
+
+    def get_parser(self, project_name: str, parser_name: str) -> Parser:
+        key = (project_name, parser_name)
+        if key not in self.parsers:
+            parser_cls = PARALLEL_PARSERS[parser_name]
+            project = self.all_projects[project_name]
+            self.parsers[key] = parser_cls(project, self.manifest, self.root_project)
+        return self.parsers[key]
+
+
+_WORKER_STATE: Optional[_WorkerState] = None
+
+
+def _init_worker(
+    flag_dict: Dict[str, object],
+    root_project: RuntimeConfig,
+    all_projects: Mapping[str, Project],
+    macros: MutableMapping[str, ParsedMacro],
+) -> None:
+    global _WORKER_STATE
+    # Worker processes are spawned, so nothing set up by main() is inherited.
+    # An exception here would make the pool restart the worker forever, so
+    # leave the state unset instead and let the parent parse the chunks.
+    try:
+        flags.set_from_args(Namespace(**flag_dict), None)
+        load_plugin(root_project.credentials.type)
+        register_adapter(root_project)
+        if flags.JINJA_BYTECODE_CACHE:
+            # only the parent saves the cache, so workers send back what they add
+            path = os.path.join(root_project.target_path, JINJA_BYTECODE_CACHE_FILE_NAME)
+            bytecode_cache.load(path)
+            bytecode_cache.record_added()
+        _WORKER_STATE = _WorkerState(root_project, all_projects, macros)
+    except Exception:
+        _WORKER_STATE = None
+
+
+def _parse_chunk(task: ChunkTask) -> Optional[ParsedChunk]:
+    """Parse the files in a chunk, returning None if anything went wrong.
+    The parent process re-parses failed chunks itself, so any exception is
+    raised there exactly as it would be by a serial parse.
+    """
+    if _WORKER_STATE is None:
+        return None
+    project_name, parser_name, source_files = task
+    manifest = _WORKER_STATE.manifest
+    chunk = ParsedChunk()
+    try:
+        parser = _WORKER_STATE.get_parser(project_name, parser_name)
+        for source_file in source_files:
+            manifest.nodes = {}
+            manifest.disabled = {}
+            manifest.env_vars = {}
+            manifest.files = {source_file.file_id: source_file}
+            parser.parse_file(FileBlock(source_file))
+            # the parallel parsers only add parsed nodes
+            nodes = cast(List[ManifestNodes], list(manifest.nodes.values()))
+            disabled = cast(
+                List[ManifestNodes],
+                [node for file_nodes in manifest.disabled.values() for node in file_nodes],
+            )
+            chunk.results.append(
+                ParsedFileResult(
+                    file=source_file,
+                    nodes=nodes,
+                    disabled=disabled,
+                    env_vars=manifest.env_vars,
+                )
+            )
+    except Exception:
+        return None
+    finally:
+        parsing_info = manifest._parsing_info
+        chunk.static_analysis_path_count = parsing_info.static_analysis_path_count
+        chunk.static_analysis_parsed_path_count = parsing_info.static_analysis_parsed_path_count
+        parsing_info.static_analysis_path_count = 0
+        parsing_info.static_analysis_parsed_path_count = 0
+        chunk.compiled = bytecode_cache.take_added()
+    return chunk
+
+
+class ParallelParser:
+    """Parse files in a pool of worker processes.
+
+    The pool is only started once there are enough files to parse. Workers
+    receive a copy of the macros when they start, and the source files of a
+    chunk with each task. They send back the parsed nodes, which are added to
+    the manifest in the same order a serial parse would add them.
+    """
+
+    def __init__(
+        self,
+        root_project: RuntimeConfig,
+        all_projects: Mapping[str, Project],
+        manifest: Manifest,
+        processes: int,
+    ) -> None:
+        self.root_project = root_project
+        self.all_projects = all_projects
+        self.macros = manifest.macros
+        self.processes = processes
+        self._pool = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = flags.MP_CONTEXT.Pool(
+                processes=self.processes,
+                initializer=_init_worker,
+                initargs=(
+                    flags.get_flag_dict(),
+                    self.root_project,
+                    self.all_projects,
+                    self.macros,
+                ),
+            )
+        return self._pool
+
+    def __enter__(self) -> "ParallelParser":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    @staticmethod
+    def can_parse(parser: Parser, file_ids: List[str]) -> bool:
+        return type(parser).__name__ in PARALLEL_PARSERS and len(file_ids) >= MIN_PARALLEL_FILES
+
+    def _chunks(self, file_ids: List[str]) -> Iterator[List[str]]:
+        chunk_size = -(-len(file_ids) // (self.processes * CHUNKS_PER_PROCESS))
+        for start in range(0, len(file_ids), chunk_size):
+            yield file_ids[start : start + chunk_size]
+
+    def parse_files(self, parser: Parser, file_ids: List[str], manifest: Manifest) -> None:
+        project_name = parser.project.project_name
+        parser_name = type(parser).__name__
+        chunked_ids = list(self._chunks(file_ids))
+        tasks = [
+            (project_name, parser_name, [manifest.files[file_id] for file_id in chunk])
+            for chunk in chunked_ids
+        ]
+        # imap returns chunks in order, so results are merged deterministically
+        for chunk_ids, chunk in zip(chunked_ids, self.pool.imap(_parse_chunk, tasks)):
+            if chunk is None:
+                for file_id in chunk_ids:
+                    parser.parse_file(FileBlock(manifest.files[file_id]))
+                continue
+            for result in chunk.results:
+                manifest.files[result.file.file_id] = result.file
+                for node in result.nodes:
+                    manifest.add_node_nofile(node)
+                for node in result.disabled:
+                    manifest.add_disabled_nofile(node)
+                manifest.env_vars.update(result.env_vars)
+            bytecode_cache.update(chunk.compiled)
+            manifest._parsing_info.static_analysis_path_count += chunk.static_analysis_path_count
+            manifest._parsing_info.static_analysis_parsed_path_count += (
+                chunk.static_analysis_parsed_path_count
+            )
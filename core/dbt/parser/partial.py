@@ -1,7 +1,7 @@
 import os
 from copy import deepcopy
-from typing import MutableMapping, Dict, List
-from dbt.contracts.graph.manifest import Manifest
+from typing import MutableMapping, Dict, List, Optional
+from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
 from dbt.contracts.files import (
     AnySourceFile,
     ParseFileType,
@@ -74,9 +74,20 @@ special_override_macros = [
 # to preserve an unchanged file object in case we need to drop back to a
 # a full parse (such as for certain macro changes)
 class PartialParsing:
-    def __init__(self, saved_manifest: Manifest, new_files: MutableMapping[str, AnySourceFile]):
+    def __init__(
+        self,
+        saved_manifest: Manifest,
+        new_files: MutableMapping[str, AnySourceFile],
+        state_check: Optional[ManifestStateCheck] = None,
+    ):
         self.saved_manifest = saved_manifest
         self.new_files = new_files
+        # The state of the vars and the target in this run. Files that read
+        # a var or a target key that changed since the manifest was saved are
+        # parsed again.
+        if state_check is None:
+            state_check = saved_manifest.state_check
+        self.state_check = state_check
         self.project_parser_files: Dict = {}
         self.saved_files = self.saved_manifest.files
         self.project_parser_files = {}
@@ -942,7 +953,7 @@ class PartialParsing:
             self.add_to_pp_files(orig_file)
 
     # This builds a dictionary of files that need to be scheduled for parsing
-    # because the env var has changed.
+    # because an env var, cli var or target key that they read has changed.
     # source_files
     #   env_vars_changed_source_files: [file_id, file_id...]
     # schema_files
@@ -966,34 +977,46 @@ class PartialParsing:
         for env_var in delete_vars:
             del self.saved_manifest.env_vars[env_var]
 
+        # Only the hashes of cli vars and target keys are saved
+        saved_state = self.saved_manifest.state_check
+        changed = {
+            "env_vars": set(changed_vars),
+            "vars": ManifestStateCheck.changed_keys(
+                saved_state.var_hashes, self.state_check.var_hashes
+            ),
+            "target_keys": ManifestStateCheck.changed_keys(
+                saved_state.target_hashes, self.state_check.target_hashes
+            ),
+        }
+        changed = {attr: names for attr, names in changed.items() if names}
+
         env_vars_changed_source_files = []
         env_vars_changed_schema_files = {}
-        # The SourceFiles contain a list of env_vars that were used in the file.
-        # The SchemaSourceFiles contain a dictionary of yaml_key to schema entry names to
-        # a list of vars.
+        # The SourceFiles contain a list of env_vars, vars and target keys that
+        # were used in the file. The SchemaSourceFiles contain a dictionary of
+        # yaml_key to schema entry names to a list of them.
         # Create a list of file_ids for source_files that need to be reparsed, and
         # a dictionary of file_ids to yaml_keys to names.
         for source_file in self.saved_files.values():
             file_id = source_file.file_id
-            if not source_file.env_vars:
-                continue
-            if source_file.parse_file_type == ParseFileType.Schema:
-                for yaml_key in source_file.env_vars.keys():
-                    for name in source_file.env_vars[yaml_key].keys():
-                        for env_var in source_file.env_vars[yaml_key][name]:
-                            if env_var in changed_vars:
-                                if file_id not in env_vars_changed_schema_files:
-                                    env_vars_changed_schema_files[file_id] = {}
-                                if yaml_key not in env_vars_changed_schema_files[file_id]:
-                                    env_vars_changed_schema_files[file_id][yaml_key] = []
-                                if name not in env_vars_changed_schema_files[file_id][yaml_key]:
-                                    env_vars_changed_schema_files[file_id][yaml_key].append(name)
-                                break  # if one env_var is changed we can stop
-
-            else:
-                for env_var in source_file.env_vars:
-                    if env_var in changed_vars:
+            for attr, changed_names in changed.items():
+                dependencies = getattr(source_file, attr)
+                if not dependencies:
+                    continue
+                if source_file.parse_file_type == ParseFileType.Schema:
+                    for yaml_key in dependencies.keys():
+                        for name in dependencies[yaml_key].keys():
+                            if changed_names.isdisjoint(dependencies[yaml_key][name]):
+                                continue
+                            if file_id not in env_vars_changed_schema_files:
+                                env_vars_changed_schema_files[file_id] = {}
+                            if yaml_key not in env_vars_changed_schema_files[file_id]:
+                                env_vars_changed_schema_files[file_id][yaml_key] = []
+                            if name not in env_vars_changed_schema_files[file_id][yaml_key]:
+                                env_vars_changed_schema_files[file_id][yaml_key].append(name)
+
+                elif not changed_names.isdisjoint(dependencies):
+                    if file_id not in env_vars_changed_source_files:
                         env_vars_changed_source_files.append(file_id)
-                        break  # if one env_var is changed we can stop
 
         return (env_vars_changed_source_files, env_vars_changed_schema_files)
@@ -0,0 +1,251 @@
+import dataclasses
+import hashlib
+import os
+import sqlite3
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Type
+
+from mashumaro.serializer.msgpack import DEFAULT_DICT_PARAMS
+
+from dbt.clients.system import make_directory
+from dbt.contracts.graph.compiled import CompileResultNode, ManifestNode
+from dbt.contracts.graph.lazy import LazyRecords, pack, unpack
+from dbt.contracts.graph.manifest import GraphMemberSummary, Manifest
+from dbt.contracts.graph.parsed import (
+    ParsedDocumentation,
+    ParsedExposure,
+    ParsedMacro,
+    ParsedMetric,
+    ParsedSourceDefinition,
+)
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.events.functions import fire_event
+from dbt.events.types import PartialParsingWroteRecords
+from dbt.node_types import NodeType
+
+# Bump this when the layout of the records changes. Stores written with a
+# different format version can't be read.
+STORE_FORMAT_VERSION = 3
+
+# Each entry in these Manifest dictionaries is stored as its own record. All
+# the other attributes are small and are kept together in the header record.
+RECORD_SECTIONS = (
+    "files",
+    "nodes",
+    "sources",
+    "macros",
+    "docs",
+    "exposures",
+    "metrics",
+    "disabled",
+)
+
+# The header also holds a GraphMemberSummary of each record in these sections
+SUMMARY_SECTIONS = ("nodes", "sources", "exposures", "metrics")
+
+HEADER_SECTION = "header"
+HEADER_KEY = "manifest"
+
+RecordKey = Tuple[str, str]
+
+
+# Every file is needed to work out what changed since the manifest was saved,
+# so files are always decoded up front. The records in the other sections are
+# decoded on first access, using these classes to deserialize a single value
+# the same way Manifest.from_dict does.
+@dataclasses.dataclass
+class NodeRecord(dbtClassMixin):
+    value: ManifestNode
+
+
+@dataclasses.dataclass
+class SourceRecord(dbtClassMixin):
+    value: ParsedSourceDefinition
+
+
+@dataclasses.dataclass
+class MacroRecord(dbtClassMixin):
+    value: ParsedMacro
+
+
+@dataclasses.dataclass
+class DocRecord(dbtClassMixin):
+    value: ParsedDocumentation
+
+
+@dataclasses.dataclass
+class ExposureRecord(dbtClassMixin):
+    value: ParsedExposure
+
+
+@dataclasses.dataclass
+class MetricRecord(dbtClassMixin):
+    value: ParsedMetric
+
+
+@dataclasses.dataclass
+class DisabledRecord(dbtClassMixin):
+    value: List[CompileResultNode]
+
+
+LAZY_SECTIONS: Dict[str, Type[dbtClassMixin]] = {
+    "nodes": NodeRecord,
+    "sources": SourceRecord,
+    "macros": MacroRecord,
+    "docs": DocRecord,
+    "exposures": ExposureRecord,
+    "metrics": MetricRecord,
+    "disabled": DisabledRecord,
+}
+
+
+class RecordDecoder:
+    def __init__(self, record_cls: Type[dbtClassMixin]) -> None:
+        self.record_cls = record_cls
+
+    def __call__(self, dct: Dict[str, Any]) -> Any:
+        return self.record_cls.from_dict({"value": dct}, **DEFAULT_DICT_PARAMS).value
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, list):
+        return [item.to_dict(**DEFAULT_DICT_PARAMS) for item in value]
+    return value.to_dict(**DEFAULT_DICT_PARAMS)
+
+
+def _checksum(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _summary_record(records: Mapping[str, Any], key: str) -> List[Any]:
+    summary = None
+    if isinstance(records, LazyRecords):
+        summary = records.summary(key)
+    if summary is None:
+        summary = GraphMemberSummary.from_member(records[key])
+    return [str(summary.resource_type), *summary[1:]]
+
+
+def _summary_from_record(record: List[Any]) -> GraphMemberSummary:
+    resource_type, *rest = record
+    return GraphMemberSummary(NodeType(resource_type), *rest)
+
+
+class PartialParseStore:
+    """A sqlite database holding the manifest saved for partial parsing.
+
+    Every SourceFile and every node, macro, source, doc, exposure and metric
+    is stored as a separate record along with a checksum of its contents.
+    The header record holds the remaining manifest attributes and the order
+    of the keys in each section. Writing a manifest only rewrites the records
+    whose contents changed since the last write, and deletes the records of
+    objects that no longer exist.
+
+    Reading the store only decodes the files. Every other record is decoded
+    the first time it's accessed, and the summaries kept in the header let
+    the graph be built and selected from without decoding its members.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "create table if not exists records ("
+            "section text not null, "
+            "key text not null, "
+            "checksum text not null, "
+            "value blob not null, "
+            "primary key (section, key))"
+        )
+        return conn
+
+    def _records_from(self, manifest: Manifest) -> Iterator[Tuple[RecordKey, bytes]]:
+        order: Dict[str, List[str]] = {}
+        summaries: Dict[str, Dict[str, List[Any]]] = {}
+        for section in RECORD_SECTIONS:
+            records = getattr(manifest, section)
+            order[section] = list(records)
+            for key in records:
+                data = None
+                if isinstance(records, LazyRecords):
+                    # records that were never loaded are still packed
+                    data = records.packed(key)
+                if data is None:
+                    data = pack(_serialize(records[key]))
+                yield (section, key), data
+            if section in SUMMARY_SECTIONS:
+                summaries[section] = {key: _summary_record(records, key) for key in records}
+        # The flat graph is rebuilt after loading, so it isn't saved
+        rest = dataclasses.replace(
+            manifest, flat_graph={}, **{section: {} for section in RECORD_SECTIONS}
+        )
+        dct = rest.to_dict(**DEFAULT_DICT_PARAMS)
+        for section in RECORD_SECTIONS:
+            del dct[section]
+        header = {
+            "format_version": STORE_FORMAT_VERSION,
+            "order": order,
+            "summaries": summaries,
+            "manifest": dct,
+        }
+        yield (HEADER_SECTION, HEADER_KEY), pack(header)
+
+    def write(self, manifest: Manifest) -> None:
+        make_directory(os.path.dirname(self.path))
+        with self._connect() as conn:
+            saved: Dict[RecordKey, str] = {
+                (section, key): checksum
+                for section, key, checksum in conn.execute(
+                    "select section, key, checksum from records"
+                )
+            }
+            changed = []
+            for record_key, value in self._records_from(manifest):
+                checksum = _checksum(value)
+                if saved.pop(record_key, None) != checksum:
+                    changed.append((*record_key, checksum, value))
+            # whatever is left in 'saved' no longer exists in the manifest
+            conn.executemany("delete from records where section = ? and key = ?", list(saved))
+            conn.executemany(
+                "insert or replace into records (section, key, checksum, value) "
+                "values (?, ?, ?, ?)",
+                changed,
+            )
+        conn.close()
+        fire_event(PartialParsingWroteRecords(written=len(changed), deleted=len(saved)))
+
+    def read(self) -> Manifest:
+        conn = self._connect()
+        try:
+            records: Dict[str, Dict[str, bytes]] = {}
+            for section, key, value in conn.execute("select section, key, value from records"):
+                records.setdefault(section, {})[key] = value
+        finally:
+            conn.close()
+
+        header = unpack(records[HEADER_SECTION][HEADER_KEY])
+        if header["format_version"] != STORE_FORMAT_VERSION:
+            raise ValueError(
+                f"Partial parse store has format version {header['format_version']}, "
+                f"expected {STORE_FORMAT_VERSION}"
+            )
+        dct = header["manifest"]
+        file_records = records.get("files", {})
+        dct["files"] = {key: unpack(file_records[key]) for key in header["order"]["files"]}
+        manifest = Manifest.from_dict(dct, **DEFAULT_DICT_PARAMS)
+
+        for section, record_cls in LAZY_SECTIONS.items():
+            section_records = records.get(section, {})
+            section_summaries = header["summaries"].get(section, {})
+            lazy_records: LazyRecords[Any] = LazyRecords(RecordDecoder(record_cls))
+            for key in header["order"][section]:
+                summary = None
+                if key in section_summaries:
+                    summary = _summary_from_record(section_summaries[key])
+                lazy_records.add_packed(key, section_records[key], summary)
+            setattr(manifest, section, lazy_records)
+        return manifest
@@ -31,22 +31,16 @@ def load_source_file(
         project_name=project_name,
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
-        old_source_file = saved_files[source_file.file_id]
-        if (
-            source_file.path.modification_time != 0.0
-            and old_source_file.path.modification_time == source_file.path.modification_time
+    old_source_file = get_unchanged_saved_file(source_file.path, source_file.file_id, saved_files)
+    if old_source_file is not None:
+        # The contents are only read if the file needs to be parsed, see
+        # load_source_file_contents
+        source_file.checksum = old_source_file.checksum
+        if isinstance(source_file, SchemaSourceFile) and isinstance(
+            old_source_file, SchemaSourceFile
         ):
-            source_file.checksum = old_source_file.checksum
             source_file.dfy = old_source_file.dfy
-            skip_loading_schema_file = True
-
-    if not skip_loading_schema_file:
+    else:
         file_contents = load_file_contents(path.absolute_path, strip=False)
         source_file.checksum = FileHash.from_contents(file_contents)
         source_file.contents = file_contents.strip()
@@ -61,6 +55,25 @@ def load_source_file(
     return source_file
 
 
+# Return the saved file for this path if its stat matches the saved one. The
+# file hasn't changed since it was saved, so it doesn't need to be read.
+def get_unchanged_saved_file(path: FilePath, file_id: str, saved_files) -> Optional[AnySourceFile]:
+    if path.stat is None or not saved_files or file_id not in saved_files:
+        return None
+    old_source_file = saved_files[file_id]
+    if getattr(old_source_file.path, "stat", None) != path.stat:
+        return None
+    return old_source_file
+
+
+# Read the contents of a file that wasn't read by load_source_file because it
+# hadn't changed. Schema files are parsed from their saved yaml dictionary.
+def load_source_file_contents(source_file: AnySourceFile) -> None:
+    if source_file.contents is None and not isinstance(source_file, SchemaSourceFile):
+        file_contents = load_file_contents(source_file.path.absolute_path, strip=False)
+        source_file.contents = file_contents.strip()
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -91,8 +104,13 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
-    if match.seed_too_large():
+def load_seed_source_file(match: FilePath, project_name, saved_files=None) -> SourceFile:
+    file_id = f"{project_name}://{match.original_file_path}"
+    old_source_file = get_unchanged_saved_file(match, file_id, saved_files)
+    if old_source_file is not None:
+        source_file = SourceFile(path=match, checksum=old_source_file.checksum)
+        source_file.contents = ""
+    elif match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
@@ -114,7 +132,7 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files):
     fb_list = []
     for fp in fp_list:
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
+            fb_list.append(load_seed_source_file(fp, project.project_name, saved_files))
         # singular tests live in /tests but only generic tests live
         # in /tests/generic so we want to skip those
         else:
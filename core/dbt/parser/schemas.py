@@ -289,9 +289,9 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
                 package_name=target.package_name,
                 render_ctx=self.render_ctx,
             )
-            if self.schema_yaml_vars.env_vars:
-                self.store_env_vars(target, schema_file_id, self.schema_yaml_vars.env_vars)
-                self.schema_yaml_vars.env_vars = {}
+            if not self.schema_yaml_vars.is_empty():
+                self.store_schema_yaml_vars(target, schema_file_id, self.schema_yaml_vars)
+                self.schema_yaml_vars.clear()
 
         except ParsingException as exc:
             context = _trimmed(str(target))
@@ -343,8 +343,8 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
 
         return node
 
-    def store_env_vars(self, target, schema_file_id, env_vars):
-        self.manifest.env_vars.update(env_vars)
+    def store_schema_yaml_vars(self, target, schema_file_id, schema_yaml_vars):
+        self.manifest.env_vars.update(schema_yaml_vars.env_vars)
         if schema_file_id in self.manifest.files:
             schema_file = self.manifest.files[schema_file_id]
             if isinstance(target, UnpatchedSourceDefinition):
@@ -355,8 +355,12 @@ class SchemaParser(SimpleParser[GenericTestBlock, ParsedGenericTestNode]):
             else:
                 search_name = target.name
                 yaml_key = target.yaml_key
-            for var in env_vars.keys():
+            for var in schema_yaml_vars.env_vars.keys():
                 schema_file.add_env_var(var, yaml_key, search_name)
+            for var in sorted(schema_yaml_vars.vars):
+                schema_file.add_var(var, yaml_key, search_name)
+            for key in sorted(schema_yaml_vars.target_keys):
+                schema_file.add_target_key(key, yaml_key, search_name)
 
     # This does special shortcut processing for the two
     # most common internal macros, not_null and unique,
@@ -622,13 +626,17 @@ class YamlReader(metaclass=ABCMeta):
             # Render the data (except for tests and descriptions).
             # See the SchemaYamlRenderer
             entry = self.render_entry(entry)
-            if self.schema_yaml_vars.env_vars:
+            if not self.schema_yaml_vars.is_empty():
                 self.schema_parser.manifest.env_vars.update(self.schema_yaml_vars.env_vars)
                 schema_file = self.yaml.file
                 assert isinstance(schema_file, SchemaSourceFile)
                 for var in self.schema_yaml_vars.env_vars.keys():
                     schema_file.add_env_var(var, self.key, entry["name"])
-                self.schema_yaml_vars.env_vars = {}
+                for var in sorted(self.schema_yaml_vars.vars):
+                    schema_file.add_var(var, self.key, entry["name"])
+                for key in sorted(self.schema_yaml_vars.target_keys):
+                    schema_file.add_target_key(key, self.key, entry["name"])
+                self.schema_yaml_vars.clear()
 
             yield entry
 
@@ -5,7 +5,7 @@ from typing import List, Callable, Iterable, Set, Union, Iterator, TypeVar, Gene
 from dbt.clients.jinja import extract_toplevel_blocks, BlockTag
 from dbt.clients.system import find_matching
 from dbt.config import Project
-from dbt.contracts.files import FilePath, AnySourceFile
+from dbt.contracts.files import FilePath, FileStat, AnySourceFile
 from dbt.exceptions import ParsingException, InternalException
 
 
@@ -68,11 +68,17 @@ def filesystem_search(project: Project, relative_dirs: List[str], extension: str
     for result in find_matching(root, relative_dirs, ext):
         if "searched_path" not in result or "relative_path" not in result:
             raise InternalException("Invalid result from find_matching: {}".format(result))
+        stat = None
+        if result.get("inode") is not None:
+            stat = FileStat(
+                size=result["size"], mtime_ns=result["mtime_ns"], inode=result["inode"]
+            )
         file_match = FilePath(
             searched_path=result["searched_path"],
             relative_path=result["relative_path"],
             modification_time=result["modification_time"],
             project_root=root,
+            stat=stat,
         )
         file_path_list.append(file_match)
 
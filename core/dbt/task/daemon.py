@@ -0,0 +1,367 @@
+import dataclasses
+import io
+import json
+import os
+import socket
+import socketserver
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, cast
+
+import dbt.exceptions
+import dbt.flags as flags
+from dbt.adapters.factory import cleanup_connections, register_adapter, reset_adapters
+from dbt.clients.daemon import DAEMON_SOCKET_FILE_NAME, encode_message
+from dbt.clients.jinja import bytecode_cache
+from dbt.config import RuntimeConfig
+from dbt.config.profile import read_user_config
+from dbt.contracts.graph.lazy import LazyRecords
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.functions import fire_event, setup_event_logger
+from dbt.events.types import (
+    DaemonFilesChanged,
+    DaemonListening,
+    DaemonRefreshFailed,
+    MainEncounteredError,
+    MainReportArgs,
+    MainStackTrace,
+)
+from dbt.parser.manifest import ManifestLoader
+from dbt.task.base import ConfiguredTask
+from dbt.utils import ExitCodes, args_to_dict
+
+# The commands the daemon runs. Anything else has to be run with 'dbt'.
+DAEMON_COMMANDS = ("parse", "compile", "list", "run")
+
+# A change to one of these files means the project and profile are read again
+CONFIG_FILE_NAMES = ("dbt_project.yml", "packages.yml", "selectors.yml", "profiles.yml")
+
+# The daemon's project and profile are loaded once, so a request can't ask
+# for different ones. These are the default values of the arguments.
+FIXED_ARGS = {"profile": None, "target": None, "vars": "{}"}
+
+FileState = Tuple[int, int, int]
+
+
+class ProjectWatcher:
+    """Find the files that were added, changed or deleted under a set of
+    directories by comparing the size, modification time and inode of every
+    file with what they were when the directories were last polled.
+
+    Directories that start with '.', and the 'ignore' directories, aren't
+    watched.
+    """
+
+    def __init__(self, paths: List[str], ignore: List[str]) -> None:
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.ignore = {os.path.abspath(path) for path in ignore}
+        self.files: Dict[str, FileState] = self.scan()
+
+    def _scan_path(self, path: str, files: Dict[str, FileState]) -> None:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.path not in self.ignore:
+                        self._scan_path(entry.path, files)
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            files[entry.path] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def scan(self) -> Dict[str, FileState]:
+        files: Dict[str, FileState] = {}
+        for path in self.paths:
+            if os.path.isdir(path):
+                self._scan_path(path, files)
+            elif os.path.exists(path):
+                stat = os.stat(path)
+                files[path] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        return files
+
+    def poll(self) -> Set[str]:
+        """Return the paths of the files that changed since the last poll."""
+        files = self.scan()
+        changed = {
+            path
+            for path in files.keys() | self.files.keys()
+            if files.get(path) != self.files.get(path)
+        }
+        self.files = files
+        return changed
+
+
+def copy_for_task(manifest: Manifest) -> Manifest:
+    """Return a copy of the manifest for a task to use.
+
+    Tasks replace nodes with their compiled versions, but the daemon has to
+    keep the parsed manifest to partially parse it again. The objects in the
+    manifest are shared, only the mappings holding them are copied.
+    """
+    sections: Dict[str, Any] = {}
+    for name in ("nodes", "sources", "macros", "docs", "exposures", "metrics", "disabled"):
+        records = getattr(manifest, name)
+        if isinstance(records, LazyRecords):
+            sections[name] = records.copy()
+        else:
+            sections[name] = dict(records)
+    flat_graph = {name: dict(values) for name, values in manifest.flat_graph.items()}
+    return dataclasses.replace(manifest, flat_graph=flat_graph, **sections)
+
+
+class _OutputWriter(io.RawIOBase):
+    """Send everything written to it to the client as output messages.
+    Writes after the client went away are dropped, so the command can finish.
+    """
+
+    def __init__(self, wfile) -> None:
+        self.wfile = wfile
+        self.connected = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.connected:
+            try:
+                self.wfile.write(encode_message({"output": bytes(data).decode("utf-8")}))
+                self.wfile.flush()
+            except OSError:
+                self.connected = False
+        return len(data)
+
+    def send_exit_code(self, exit_code: int) -> None:
+        self.write(b"")
+        if self.connected:
+            try:
+                self.wfile.write(encode_message({"exit_code": exit_code}))
+            except OSError:
+                self.connected = False
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        writer = _OutputWriter(self.wfile)
+        # The event logger removes TextIOWrapper stream handlers when it's
+        # set up again, so the client's handler is dropped after the request.
+        # TextIOWrapper only needs the raw write methods of its buffer.
+        output = io.TextIOWrapper(cast(BinaryIO, writer), encoding="utf-8", write_through=True)
+        exit_code = self.server.task.handle_request(request["args"], output, request.get("cwd"))
+        writer.send_exit_code(exit_code)
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, task: "DaemonTask") -> None:
+        self.task = task
+        super().__init__(path, DaemonRequestHandler)
+
+    def service_actions(self) -> None:
+        # called between requests, and every poll interval while idle
+        self.task.poll_files()
+
+
+class DaemonTask(ConfiguredTask):
+    """Keep the project, profile, adapter and manifest loaded, and run
+    commands sent from `python -m dbt.clients.daemon` over a unix socket.
+
+    The project directory is polled for changed files, and the manifest is
+    updated with a partial parse of the manifest held in memory as soon as
+    anything changes. Commands then start from a parsed manifest without
+    reading the partial parse file. Changes to the project or profile files
+    reload the project before the manifest is updated.
+    """
+
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.manifest: Optional[Manifest] = None
+        self.user_config = read_user_config(flags.PROFILES_DIR)
+        self.watcher: Optional[ProjectWatcher] = None
+        self.config_changed = False
+
+    @property
+    def socket_path(self) -> str:
+        if self.args.socket is not None:
+            return os.path.abspath(self.args.socket)
+        return os.path.abspath(os.path.join(self.config.target_path, DAEMON_SOCKET_FILE_NAME))
+
+    def build_watcher(self) -> ProjectWatcher:
+        root = self.config.project_root
+        return ProjectWatcher(
+            paths=[root, os.path.join(flags.PROFILES_DIR, "profiles.yml")],
+            ignore=[
+                os.path.join(root, self.config.target_path),
+                os.path.join(root, self.config.log_path),
+            ],
+        )
+
+    def reload_config(self) -> None:
+        # Changed vars and targets are handled by partial parsing, but the
+        # packages the manifest was parsed from may have changed too
+        self.manifest = None
+        self.config = RuntimeConfig.from_args(self.args)
+        self.user_config = read_user_config(flags.PROFILES_DIR)
+        reset_adapters()
+        register_adapter(self.config)
+        self.config_changed = False
+
+    def refresh_manifest(self) -> Manifest:
+        """Update the manifest by partially parsing the one held in memory.
+        If that fails the manifest may be half updated, so it's dropped and
+        the next refresh starts from the partial parse file instead.
+        """
+        saved_manifest, self.manifest = self.manifest, None
+        self.manifest = ManifestLoader.get_full_manifest(
+            self.config, saved_manifest=saved_manifest
+        )
+        return self.manifest
+
+    def poll_files(self) -> None:
+        if self.watcher is None:
+            return
+        changed = self.watcher.poll()
+        if not changed:
+            return
+        if any(os.path.basename(path) in CONFIG_FILE_NAMES for path in changed):
+            self.config_changed = True
+        fire_event(DaemonFilesChanged(changed=len(changed), reload_config=self.config_changed))
+        try:
+            if self.config_changed:
+                self.reload_config()
+            self.refresh_manifest()
+        except Exception as exc:
+            # the next request reports the error to the client
+            fire_event(DaemonRefreshFailed(exc=str(exc)))
+        finally:
+            cleanup_connections()
+
+    def set_request_args(self, parsed, cwd: Optional[str] = None) -> None:
+        if parsed.which not in DAEMON_COMMANDS:
+            raise dbt.exceptions.RuntimeException(
+                f"dbt daemon can't run '{parsed.which}', use dbt to run it"
+            )
+        project_dir = getattr(parsed, "project_dir", None)
+        if project_dir is not None:
+            # a relative --project-dir is relative to the client's directory
+            project_dir = os.path.abspath(os.path.join(cwd or os.getcwd(), project_dir))
+            if project_dir != os.path.abspath(self.config.project_root):
+                raise dbt.exceptions.RuntimeException(
+                    f"dbt daemon is serving the project in {self.config.project_root}"
+                )
+        if parsed.profiles_dir != self.args.profiles_dir:
+            raise dbt.exceptions.RuntimeException(
+                f"dbt daemon was started with profiles from {self.args.profiles_dir}"
+            )
+        for name, default in FIXED_ARGS.items():
+            value = getattr(parsed, name)
+            if value == default:
+                setattr(parsed, name, getattr(self.args, name))
+            elif value != getattr(self.args, name):
+                raise dbt.exceptions.RuntimeException(
+                    f"dbt daemon was started with a different --{name}, restart it to change it"
+                )
+
+    @contextmanager
+    def request_logging(self, parsed, output) -> Iterator[None]:
+        # subcommand flags keep their value if the next command doesn't have them
+        flags.FULL_REFRESH = False
+        flags.STORE_FAILURES = False
+        flags.set_from_args(parsed, self.user_config)
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                parsed.cls.set_log_format()
+                level_override = parsed.cls.pre_init_hook(parsed)
+                setup_event_logger(self.config.log_path, level_override)
+                yield
+        finally:
+            output.flush()
+            flags.FULL_REFRESH = False
+            flags.STORE_FAILURES = False
+            flags.set_from_args(self.args, self.user_config)
+            setup_event_logger(self.config.log_path)
+
+    def run_request(self, parsed) -> int:
+        self.poll_files()
+        # if the last update failed, do it again to report the error
+        if self.config_changed:
+            self.reload_config()
+        if self.manifest is None:
+            self.refresh_manifest()
+        assert self.manifest is not None
+        task = parsed.cls(parsed, self.config)
+        task.manifest = copy_for_task(self.manifest)
+        fire_event(MainReportArgs(args=args_to_dict(parsed)))
+        results = task.run()
+        if task.interpret_results(results):
+            return ExitCodes.Success.value
+        return ExitCodes.ModelError.value
+
+    def handle_request(self, args: List[str], output, cwd: Optional[str] = None) -> int:
+        # dbt.main imports every task, including this one
+        from dbt.main import parse_args
+
+        parsed = None
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                parsed = parse_args(args)
+                self.set_request_args(parsed, cwd)
+        except SystemExit as exc:
+            # argparse has already written the error or help to the client
+            return exc.code or 0
+        except dbt.exceptions.RuntimeException as exc:
+            output.write(f"{exc}\n")
+            return ExitCodes.UnhandledError.value
+        finally:
+            flags.PROFILES_DIR = self.args.profiles_dir
+
+        with self.request_logging(parsed, output):
+            try:
+                return self.run_request(parsed)
+            except Exception as exc:
+                fire_event(MainEncounteredError(e=exc))
+                fire_event(MainStackTrace(stack_trace=traceback.format_exc()))
+                return ExitCodes.UnhandledError.value
+            finally:
+                cleanup_connections()
+                # the daemon's whole run is one invocation, keep what the
+                # request compiled in case it's stopped without saving
+                bytecode_cache.save()
+
+    def remove_stale_socket(self, path: str) -> None:
+        if not os.path.exists(path):
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+            except OSError:
+                os.remove(path)
+                return
+        raise dbt.exceptions.RuntimeException(f"A dbt daemon is already listening on {path}")
+
+    def run(self):
+        path = self.socket_path
+        self.remove_stale_socket(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            self.refresh_manifest()
+        except Exception as exc:
+            fire_event(DaemonRefreshFailed(exc=str(exc)))
+        finally:
+            cleanup_connections()
+        self.watcher = self.build_watcher()
+        with DaemonServer(path, self) as server:
+            fire_event(DaemonListening(path=path))
+            try:
+                server.serve_forever(poll_interval=self.args.poll_interval)
+            finally:
+                os.remove(path)
@@ -1,13 +1,15 @@
+import json
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable, Sequence
 
 from dbt.dataclass_schema import ValidationError
 
 from .compile import CompileTask
 
 from dbt.adapters.factory import get_adapter
+from dbt.clients.system import write_json
 from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.results import (
@@ -30,14 +32,22 @@ from dbt.events.types import (
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    CatalogStateUsed,
+    CatalogStateSkipped,
 )
 from dbt.parser.manifest import ManifestLoader
+from dbt.version import __version__
 import dbt.utils
 import dbt.compilation
 import dbt.exceptions
 
 
 CATALOG_FILENAME = "catalog.json"
+# The catalog of each schema and the value that tells whether it changed,
+# for --catalog-state
+CATALOG_STATE_FILENAME = "catalog_state.json"
+
+SchemaKey = Tuple[Optional[str], str]
 
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
@@ -102,6 +112,23 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         column = ColumnMetadata.from_dict(column_data)
         table.columns[column.name] = column
 
+    def add_rows(self, column_names: List[str], rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.add_column(dict(zip(column_names, map(dbt.utils._coerce_decimal, row))))
+
+    def add_tables(self, tables: Iterable[CatalogTable]) -> None:
+        for table in tables:
+            metadata = table.metadata
+            self[CatalogKey(metadata.database, metadata.schema, metadata.name)] = table
+
+    def tables_by_schema(self) -> Dict[SchemaKey, List[CatalogTable]]:
+        """Return the tables in each (database, schema) pair, lowercase."""
+        tables: Dict[SchemaKey, List[CatalogTable]] = {}
+        for table in self.values():
+            database, schema, _ = table.key()
+            tables.setdefault((database, schema), []).append(table)
+        return tables
+
     def make_unique_id_map(
         self, manifest: Manifest
     ) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
@@ -235,16 +262,40 @@ class GenerateTask(CompileTask):
             raise InternalException("self.manifest was None in run!")
 
         adapter = get_adapter(self.config)
+        previous = self.read_catalog_state(adapter.type())
+        catalog = Catalog([])
+        exceptions: List[Exception] = []
+        tokens: Dict[SchemaKey, str] = {}
+        reused = 0
         with adapter.connection_named("generate_catalog"):
             fire_event(BuildingCatalog())
-            catalog_table, exceptions = adapter.get_catalog(self.manifest)
-
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+            # the tokens are only worth computing if they're going to be
+            # compared, so they're only saved with --catalog-state too
+            previous_tokens: Optional[Dict[SchemaKey, str]] = None
+            if getattr(self.args, "catalog_state", None) is not None:
+                previous_tokens = {key: token for key, (token, _) in previous.items()}
+            # add each batch of schemas as soon as it's done, instead of
+            # merging the results of every query first
+            for batch in adapter.iter_catalog(self.manifest, previous_tokens):
+                if batch.exception is not None:
+                    exceptions.append(batch.exception)
+                    continue
+                catalog.add_rows(batch.column_names, batch.rows)
+                database = None
+                if batch.information_schema is not None:
+                    database = dbt.utils.lowercase(batch.information_schema.database)
+                for schema in batch.unchanged:
+                    catalog.add_tables(previous[(database, schema)][1])
+                for schema, token in batch.tokens.items():
+                    tokens[(database, schema)] = token
+                reused += len(batch.unchanged)
+
+        if previous:
+            fire_event(
+                CatalogStateUsed(path=self.catalog_state_path, reused=reused, schemas=len(tokens))
+            )
+        if tokens:
+            self.write_catalog_state(adapter.type(), catalog, tokens)
 
         errors: Optional[List[str]] = None
         if exceptions:
@@ -269,6 +320,62 @@ class GenerateTask(CompileTask):
         fire_event(CatalogWritten(path=os.path.abspath(path)))
         return results
 
+    @property
+    def catalog_state_path(self) -> str:
+        return os.path.join(self.args.catalog_state, CATALOG_STATE_FILENAME)
+
+    def read_catalog_state(
+        self, adapter_type: str
+    ) -> Dict[SchemaKey, Tuple[str, List[CatalogTable]]]:
+        """Read the token and tables of each schema saved by the run that
+        --catalog-state points to.
+        """
+        if getattr(self.args, "catalog_state", None) is None:
+            return {}
+        path = self.catalog_state_path
+        try:
+            with open(path) as fp:
+                saved = json.load(fp)
+            if saved["dbt_version"] != __version__ or saved["adapter_type"] != adapter_type:
+                reason = "it was saved by a different dbt version or adapter"
+                fire_event(CatalogStateSkipped(path=path, reason=reason))
+                return {}
+            return {
+                (schema["database"], schema["schema"]): (
+                    schema["token"],
+                    [CatalogTable.from_dict(table) for table in schema["tables"]],
+                )
+                for schema in saved["schemas"]
+            }
+        except FileNotFoundError:
+            fire_event(CatalogStateSkipped(path=path, reason="it doesn't exist"))
+        except Exception as exc:
+            fire_event(CatalogStateSkipped(path=path, reason=f"it can't be read: {exc}"))
+        return {}
+
+    def write_catalog_state(
+        self, adapter_type: str, catalog: Catalog, tokens: Dict[SchemaKey, str]
+    ) -> None:
+        tables = catalog.tables_by_schema()
+        saved = {
+            "dbt_version": __version__,
+            "adapter_type": adapter_type,
+            "schemas": [
+                {
+                    "database": database,
+                    "schema": schema,
+                    "token": token,
+                    "tables": [
+                        table.to_dict(omit_none=False)
+                        for table in tables.get((database, schema), [])
+                    ],
+                }
+                for (database, schema), token in tokens.items()
+            ],
+        }
+        path = os.path.join(self.config.target_path, CATALOG_STATE_FILENAME)
+        write_json(path, saved)
+
     def get_catalog_results(
         self,
         nodes: Dict[str, CatalogTable],
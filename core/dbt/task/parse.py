@@ -90,7 +90,9 @@ class ParseTask(ConfiguredTask):
 
     def run(self):
         fire_event(ParsingStart())
-        self.get_full_manifest()
+        # 'dbt daemon' hands its tasks a manifest that's already loaded
+        if self.manifest is None:
+            self.get_full_manifest()
         if self.args.compile:
             fire_event(ParsingCompiling())
             self.compile_manifest()
@@ -98,5 +100,6 @@ class ParseTask(ConfiguredTask):
             fire_event(ParsingWritingManifest())
             self.write_manifest()
 
-        self.write_perf_info()
+        if self.loader is not None:
+            self.write_perf_info()
         fire_event(ParsingDone())
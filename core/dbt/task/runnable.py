@@ -48,7 +48,14 @@ from dbt.exceptions import (
     warn_or_error,
 )
 
-from dbt.graph import GraphQueue, NodeSelector, SelectionSpec, parse_difference, Graph
+from dbt.graph import (
+    GraphQueue,
+    NodeSelector,
+    SelectionSpec,
+    parse_difference,
+    Graph,
+    UniqueId,
+)
 from dbt.parser.manifest import ManifestLoader
 
 import dbt.exceptions
@@ -76,7 +83,9 @@ class ManifestTask(ConfiguredTask):
             write_file(path, json.dumps(self.manifest.files, cls=dbt.utils.JSONEncoder, indent=4))
 
     def load_manifest(self):
-        self.manifest = ManifestLoader.get_full_manifest(self.config)
+        # 'dbt daemon' hands its tasks a manifest that's already loaded
+        if self.manifest is None:
+            self.manifest = ManifestLoader.get_full_manifest(self.config)
         self.write_manifest()
 
     def compile_manifest(self):
@@ -141,10 +150,40 @@ class GraphRunnableTask(ManifestTask):
     def get_node_selector(self) -> NodeSelector:
         raise NotImplementedException(f"get_node_selector not implemented for task {type(self)}")
 
+    def get_node_durations(self) -> Optional[Dict[UniqueId, float]]:
+        """Return how long each node took in a previous run, from the results
+        in --state or else the results of the last invocation in the target
+        path. The queue uses them to start the longest chains of nodes first.
+
+        This is only done with --critical-path-scheduling. Nodes that errored,
+        failed or were skipped did not run to completion, so their timings
+        are left out and the queue uses its default for them.
+        """
+        if not flags.CRITICAL_PATH_SCHEDULING:
+            return None
+        completed = (NodeStatus.Success, NodeStatus.Pass)
+        if self.previous_state is not None and self.previous_state.results is not None:
+            return {
+                UniqueId(result.unique_id): result.execution_time
+                for result in self.previous_state.results.results
+                if result.status in completed
+            }
+        # Only the timings are needed, so skip building the whole artifact
+        try:
+            with open(self.result_path()) as fp:
+                results = json.load(fp)["results"]
+            return {
+                UniqueId(result["unique_id"]): float(result["execution_time"])
+                for result in results
+                if result["status"] in completed
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, self.get_node_durations())
 
     def _runtime_initialize(self):
         super()._runtime_initialize()
@@ -393,6 +432,11 @@ class GraphRunnableTask(ManifestTask):
     def populate_adapter_cache(self, adapter):
         adapter.set_relations_cache(self.manifest)
 
+    def save_adapter_cache(self, adapter):
+        if flags.RELATION_CACHE_TTL:
+            with adapter.connection_named("master"):
+                adapter.save_relations_cache_snapshot()
+
     def before_hooks(self, adapter):
         pass
 
@@ -416,6 +460,7 @@ class GraphRunnableTask(ManifestTask):
             self.after_run(adapter, res)
             elapsed = time.time() - started
             self.after_hooks(adapter, res, elapsed)
+            self.save_adapter_cache(adapter)
 
         finally:
             adapter.cleanup_connections()
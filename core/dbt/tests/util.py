@@ -7,6 +7,7 @@ from typing import List
 from dbt.main import handle_and_check
 from dbt.logger import log_manager
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_store import PartialParseStore
 from dbt.events.functions import fire_event, capture_stdout_logs, stop_capture_stdout_logs
 from dbt.events.test_types import IntegrationTestDebug
 from dbt.context import providers
@@ -41,11 +42,9 @@ def run_dbt_and_capture(args: List[str] = None, expect_pass=True):
 
 # Used in test cases to get the manifest from the partial parsing file
 def get_manifest(project_root):
-    path = project_root.join("target", "partial_parse.msgpack")
-    if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+    store = PartialParseStore(str(project_root.join("target", "partial_parse.db")))
+    if store.exists():
+        manifest: Manifest = store.read()
         return manifest
     else:
         return None
@@ -21,17 +21,25 @@ from snowplow_tracker import Subject, Tracker, Emitter, logger as sp_logger
 from snowplow_tracker import SelfDescribingJson
 from datetime import datetime
 
+import atexit
 import logbook
 import pytz
 import platform
+import queue
+import threading
+import time
 import uuid
 import requests
 import os
 
 sp_logger.setLevel(100)
 
-COLLECTOR_URL = "fishtownanalytics.sinter-collect.com"
-COLLECTOR_PROTOCOL = "https"
+# Set these to send usage events to another collector, like a local stub in tests
+COLLECTOR_URL = os.getenv("DBT_TRACKING_COLLECTOR_URL", "fishtownanalytics.sinter-collect.com")
+COLLECTOR_PROTOCOL = os.getenv("DBT_TRACKING_COLLECTOR_PROTOCOL", "https")
+
+# The longest dbt waits at exit for usage events to be sent, in seconds
+EXIT_FLUSH_DEADLINE = 1.0
 
 INVOCATION_SPEC = "iglu:com.dbt/invocation/jsonschema/1-0-2"
 PLATFORM_SPEC = "iglu:com.dbt/platform/jsonschema/1-0-0"
@@ -48,16 +56,26 @@ DBT_INVOCATION_ENV = "DBT_INVOCATION_ENV"
 
 
 class TimeoutEmitter(Emitter):
-    def __init__(self):
+    """Send usage events from a background thread, so tracking never waits
+    on the collector. Flushing hands the buffered events to the thread. If
+    too many flushed batches are waiting to be sent, new ones are dropped.
+    """
+
+    # the most flushed batches waiting to be sent
+    max_pending = 10
+
+    def __init__(self, endpoint: str = COLLECTOR_URL, protocol: str = COLLECTOR_PROTOCOL):
         super().__init__(
-            COLLECTOR_URL,
-            protocol=COLLECTOR_PROTOCOL,
+            endpoint,
+            protocol=protocol,
             buffer_size=30,
             on_failure=self.handle_failure,
             method="post",
             # don't set this.
             byte_limit=None,
         )
+        self.pending: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self.sender: Optional[threading.Thread] = None
 
     @staticmethod
     def handle_failure(num_ok, unsent):
@@ -98,6 +116,44 @@ class TimeoutEmitter(Emitter):
         self._log_result("GET", r.status_code)
         return r
 
+    def flush(self):
+        with self.lock:
+            evts, self.buffer = self.buffer, []
+            if not evts:
+                return
+            if self.sender is None:
+                self.sender = threading.Thread(
+                    target=self._send_pending, name="dbt-tracking", daemon=True
+                )
+                self.sender.start()
+        try:
+            self.pending.put_nowait(evts)
+        except queue.Full:
+            fire_event(FlushEventsFailure())
+
+    def _send_pending(self):
+        while True:
+            evts = self.pending.get()
+            try:
+                self.send_events(evts)
+            except Exception:
+                fire_event(SendEventFailure())
+            finally:
+                self.pending.task_done()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to 'timeout' seconds for the flushed events to be sent.
+        Return whether they all were.
+        """
+        deadline = time.monotonic() + timeout
+        with self.pending.all_tasks_done:
+            while self.pending.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.pending.all_tasks_done.wait(remaining)
+        return True
+
 
 emitter = TimeoutEmitter()
 tracker = Tracker(
@@ -415,11 +471,18 @@ def track_partial_parser(options):
 def flush():
     fire_event(FlushEvents())
     try:
-        tracker.flush()
+        tracker.flush(asynchronous=True)
     except Exception:
         fire_event(FlushEventsFailure())
 
 
+def wait_for_flush():
+    emitter.wait(EXIT_FLUSH_DEADLINE)
+
+
+atexit.register(wait_for_flush)
+
+
 def disable_tracking():
     global active_user
     if active_user is not None:
@@ -1,3 +1,4 @@
+import time
 from contextlib import contextmanager
 
 import psycopg2
@@ -5,12 +6,14 @@ import psycopg2
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.connection import AdapterResponse, Connection
 from dbt.events import AdapterLogger
+from dbt.events.functions import fire_event
+from dbt.events.types import ConnectionUsed, SQLQuery, SQLQueryStatus
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
 
 logger = AdapterLogger("Postgres")
@@ -55,9 +58,73 @@ class PostgresCredentials(Credentials):
         )
 
 
+class CopyCsvStream:
+    """A file-like object that reads rows of values as the text of a csv
+    file for `copy ... from stdin with (format csv)`. Missing values are
+    unquoted empty fields, which copy reads as null.
+    """
+
+    def __init__(self, rows: Iterable[List[Any]]) -> None:
+        self._rows = iter(rows)
+        self._buffer = ""
+
+    @staticmethod
+    def format_value(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return '"{}"'.format(value.replace('"', '""'))
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return str(value)
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = ",".join(self.format_value(value) for value in row) + "\n"
+            parts.append(line)
+            length += len(line)
+        data = "".join(parts)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = "postgres"
 
+    def copy_from(self, sql: str, stream: Any) -> Tuple[Connection, Any]:
+        """Run a `copy ... from stdin` statement with the data read from the
+        stream, like add_query runs a query.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+        fire_event(ConnectionUsed(conn_type=self.TYPE, conn_name=connection.name))
+
+        with self.exception_handler(sql):
+            fire_event(SQLQuery(conn_name=connection.name, sql=sql))
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, stream)
+
+            fire_event(
+                SQLQueryStatus(
+                    status=str(self.get_response(cursor)), elapsed=round((time.time() - pre), 2)
+                )
+            )
+
+            return connection, cursor
+
     @contextmanager
     def exception_handler(self, sql):
         try:
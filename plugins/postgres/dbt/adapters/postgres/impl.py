@@ -1,12 +1,19 @@
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, Set, List, Any
+from typing import Optional, Set, List, Any, Dict
+
+import agate
+
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.impl import AdapterConfig
+from dbt.adapters.base.relation import BaseRelation, InformationSchema
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres import PostgresColumn
 from dbt.adapters.postgres import PostgresRelation
+from dbt.adapters.postgres.connections import CopyCsvStream
+from dbt.clients import agate_helper
+from dbt.contracts.graph.manifest import Manifest
 from dbt.dataclass_schema import dbtClassMixin, ValidationError
 import dbt.exceptions
 import dbt.utils
@@ -14,6 +21,8 @@ import dbt.utils
 
 # note that this isn't an adapter macro, so just a single underscore
 GET_RELATIONS_MACRO_NAME = "postgres_get_relations"
+GET_RELATION_CACHE_TOKEN_MACRO_NAME = "postgres_get_relation_cache_token"
+GET_CATALOG_TOKENS_MACRO_NAME = "postgres_get_catalog_tokens"
 
 
 @dataclass
@@ -63,6 +72,8 @@ class PostgresAdapter(SQLAdapter):
 
     AdapterSpecificConfigs = PostgresConfig
 
+    LIST_RELATIONS_IN_BULK = True
+
     @classmethod
     def date_function(cls):
         return "now()"
@@ -85,6 +96,17 @@ class PostgresAdapter(SQLAdapter):
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
 
+    @available
+    def copy_csv_file(self, sql: str, agate_table: agate.Table) -> int:
+        """Run a `copy ... from stdin with (format csv)` statement with the
+        rows of the csv file the agate table was loaded from, and return the
+        number of rows copied. The values are cast to the agate table's column
+        types first, so the table can come from just the start of the file.
+        """
+        rows = agate_helper.cast_csv_rows(agate_table.original_abspath, agate_table.column_types)
+        _, cursor = self.connections.copy_from(sql, CopyCsvStream(rows))
+        return cursor.rowcount
+
     def _link_cached_database_relations(self, schemas: Set[str]):
         """
         :param schemas: The set of schemas that should have links added.
@@ -130,5 +152,32 @@ class PostgresAdapter(SQLAdapter):
         super()._relations_cache_for_schemas(manifest)
         self._link_cached_relations(manifest)
 
+    def relation_cache_validation_token(
+        self, schema_relations: List[BaseRelation]
+    ) -> Optional[str]:
+        if not schema_relations:
+            return ""
+        table = self.execute_macro(
+            GET_RELATION_CACHE_TOKEN_MACRO_NAME, kwargs={"schema_relations": schema_relations}
+        )
+        return table[0][0]
+
+    def catalog_validation_tokens(
+        self,
+        information_schema: InformationSchema,
+        schemas: Set[str],
+        manifest: Manifest,
+    ) -> Dict[str, str]:
+        table = self.execute_macro(
+            GET_CATALOG_TOKENS_MACRO_NAME,
+            kwargs={"information_schema": information_schema, "schemas": schemas},
+            manifest=manifest,
+        )
+        # schemas without tables in them have no rows
+        tokens = {schema: "" for schema in schemas}
+        for schema, token in table:
+            tokens[schema.lower()] = token
+        return tokens
+
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         return f"{add_to} + interval '{number} {interval}'"
@@ -90,6 +90,34 @@
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
+{% macro postgres__list_relations_in_schemas_without_caching(schema_relations) %}
+  {#- the schemas are all in one database -#}
+  {%- set database = schema_relations[0].database -%}
+  {%- set schemas -%}
+    array[{%- for schema_relation in schema_relations -%}
+      '{{ schema_relation.schema }}'{% if not loop.last %}, {% endif %}
+    {%- endfor -%}]
+  {%- endset -%}
+  {% call statement('list_relations_in_schemas_without_caching', fetch_result=True) -%}
+    select
+      '{{ database }}' as database,
+      tablename as name,
+      schemaname as schema,
+      'table' as type
+    from pg_tables
+    where schemaname ilike any ({{ schemas }})
+    union all
+    select
+      '{{ database }}' as database,
+      viewname as name,
+      schemaname as schema,
+      'view' as type
+    from pg_views
+    where schemaname ilike any ({{ schemas }})
+  {% endcall %}
+  {{ return(load_result('list_relations_in_schemas_without_caching').table) }}
+{% endmacro %}
+
 {% macro postgres__information_schema_name(database) -%}
   {% if database_name -%}
     {{ adapter.verify_database(database_name) }}
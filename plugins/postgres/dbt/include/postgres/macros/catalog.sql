@@ -9,37 +9,7 @@
     {% set database = information_schema.database %}
     {{ adapter.verify_database(database) }}
 
-    select
-        '{{ database }}' as table_database,
-        sch.nspname as table_schema,
-        tbl.relname as table_name,
-        case tbl.relkind
-            when 'v' then 'VIEW'
-            else 'BASE TABLE'
-        end as table_type,
-        tbl_desc.description as table_comment,
-        col.attname as column_name,
-        col.attnum as column_index,
-        pg_catalog.format_type(col.atttypid, col.atttypmod) as column_type,
-        col_desc.description as column_comment,
-        pg_get_userbyid(tbl.relowner) as table_owner
-
-    from pg_catalog.pg_namespace sch
-    join pg_catalog.pg_class tbl on tbl.relnamespace = sch.oid
-    join pg_catalog.pg_attribute col on col.attrelid = tbl.oid
-    left outer join pg_catalog.pg_description tbl_desc on (tbl_desc.objoid = tbl.oid and tbl_desc.objsubid = 0)
-    left outer join pg_catalog.pg_description col_desc on (col_desc.objoid = tbl.oid and col_desc.objsubid = col.attnum)
-
-    where (
-        {%- for schema in schemas -%}
-          upper(sch.nspname) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
-        {%- endfor -%}
-      )
-      and not pg_is_other_temp_schema(sch.oid) -- not a temporary schema belonging to another session
-      and tbl.relpersistence in ('p', 'u') -- [p]ermanent table or [u]nlogged table. Exclude [t]emporary tables
-      and tbl.relkind in ('r', 'v', 'f', 'p') -- o[r]dinary table, [v]iew, [f]oreign table, [p]artitioned table. Other values are [i]ndex, [S]equence, [c]omposite type, [t]OAST table, [m]aterialized view
-      and col.attnum > 0 -- negative numbers are used for system columns such as oid
-      and not col.attisdropped -- column as not been dropped
+    {{ postgres_catalog_query(information_schema, schemas) }}
 
     order by
         sch.nspname,
@@ -51,3 +21,60 @@
   {{ return(load_result('catalog').table) }}
 
 {%- endmacro %}
+
+
+{% macro postgres_catalog_query(information_schema, schemas) -%}
+  select
+      '{{ information_schema.database }}' as table_database,
+      sch.nspname as table_schema,
+      tbl.relname as table_name,
+      case tbl.relkind
+          when 'v' then 'VIEW'
+          else 'BASE TABLE'
+      end as table_type,
+      tbl_desc.description as table_comment,
+      col.attname as column_name,
+      col.attnum as column_index,
+      pg_catalog.format_type(col.atttypid, col.atttypmod) as column_type,
+      col_desc.description as column_comment,
+      pg_get_userbyid(tbl.relowner) as table_owner
+
+  from pg_catalog.pg_namespace sch
+  join pg_catalog.pg_class tbl on tbl.relnamespace = sch.oid
+  join pg_catalog.pg_attribute col on col.attrelid = tbl.oid
+  left outer join pg_catalog.pg_description tbl_desc on (tbl_desc.objoid = tbl.oid and tbl_desc.objsubid = 0)
+  left outer join pg_catalog.pg_description col_desc on (col_desc.objoid = tbl.oid and col_desc.objsubid = col.attnum)
+
+  where (
+      {%- for schema in schemas -%}
+        upper(sch.nspname) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+    and not pg_is_other_temp_schema(sch.oid) -- not a temporary schema belonging to another session
+    and tbl.relpersistence in ('p', 'u') -- [p]ermanent table or [u]nlogged table. Exclude [t]emporary tables
+    and tbl.relkind in ('r', 'v', 'f', 'p') -- o[r]dinary table, [v]iew, [f]oreign table, [p]artitioned table. Other values are [i]ndex, [S]equence, [c]omposite type, [t]OAST table, [m]aterialized view
+    and col.attnum > 0 -- negative numbers are used for system columns such as oid
+    and not col.attisdropped -- column as not been dropped
+{%- endmacro %}
+
+
+{% macro postgres_get_catalog_tokens(information_schema, schemas) -%}
+  {#- one md5 per schema of the rows the catalog query returns for it -#}
+  {%- call statement('catalog_tokens', fetch_result=True) -%}
+    {{ adapter.verify_database(information_schema.database) }}
+
+    select
+        catalog_rows.table_schema,
+        md5(string_agg(
+          catalog_rows::text, ',' order by catalog_rows.table_name, catalog_rows.column_index
+        )) as token
+    from (
+      {{ postgres_catalog_query(information_schema, schemas) }}
+    ) as catalog_rows
+    group by catalog_rows.table_schema
+
+  {%- endcall -%}
+
+  {{ return(load_result('catalog_tokens').table) }}
+
+{%- endmacro %}
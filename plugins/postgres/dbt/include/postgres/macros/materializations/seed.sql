@@ -0,0 +1,18 @@
+{% macro postgres__seed_bulk_load_enabled(model) %}
+  {#- Opt in with `bulk_load: true` in a seed's config to stream the csv file
+      through `copy` instead of rendering insert statements. The column types
+      are then inferred from the first get_seed_sample_size() rows only: set
+      column_types for any column whose later values don't fit them. With
+      bulk_load, `dbt seed --show` also shows only those first rows. -#}
+  {{ return(model['config'].get('bulk_load', false)) }}
+{% endmacro %}
+
+
+{% macro postgres__load_csv_file(model, agate_table) %}
+  {%- set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) -%}
+  {%- set sql -%}
+    copy {{ this.render() }} ({{ cols_sql }}) from stdin with (format csv)
+  {%- endset -%}
+  {%- set rows_affected = adapter.copy_csv_file(sql, agate_table) -%}
+  {{ return({'sql': sql, 'rows_affected': rows_affected}) }}
+{% endmacro %}
@@ -74,3 +74,23 @@
 
   {{ return(load_result('relations').table) }}
 {% endmacro %}
+
+{% macro postgres_get_relation_cache_token(schema_relations) %}
+  {#- changes whenever a table or view is created, dropped or renamed in the schemas -#}
+  {%- set schemas -%}
+    array[{%- for schema_relation in schema_relations -%}
+      '{{ schema_relation.schema }}'{% if not loop.last %}, {% endif %}
+    {%- endfor -%}]
+  {%- endset -%}
+  {% call statement('get_relation_cache_token', fetch_result=True) -%}
+    select md5(coalesce(string_agg(
+      c.oid::text || ':' || n.nspname || '.' || c.relname || ':' || c.relkind::text,
+      ',' order by c.oid
+    ), ''))
+    from pg_class c
+    join pg_namespace n on n.oid = c.relnamespace
+    where n.nspname ilike any ({{ schemas }})
+      and c.relkind in ('r', 'p', 'v')
+  {%- endcall %}
+  {{ return(load_result('get_relation_cache_token').table) }}
+{% endmacro %}
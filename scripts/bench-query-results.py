@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Compare the time and memory it takes to turn a query result into a table
+with the columnar result dbt builds now, and with the agate table it used to
+build from a dict per row.
+
+The rows come from a fake cursor, so no database is needed:
+
+    python scripts/bench-query-results.py --rows 1000000
+"""
+import argparse
+import datetime
+import decimal
+import gc
+import time
+import tracemalloc
+
+from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.clients import agate_helper
+
+COLUMN_NAMES = ["id", "name", "amount", "created_at", "is_active"]
+
+
+class FakeCursor:
+    def __init__(self, num_rows: int) -> None:
+        self.description = [(name,) for name in COLUMN_NAMES]
+        start = datetime.datetime(2022, 1, 1)
+        self.rows = [
+            (
+                n,
+                f"customer_{n}",
+                decimal.Decimal(n) / 100,
+                start + datetime.timedelta(seconds=n),
+                n % 2 == 0,
+            )
+            for n in range(num_rows)
+        ]
+        self.position = 0
+
+    def fetchall(self):
+        rows, self.position = self.rows[self.position :], len(self.rows)
+        return rows
+
+    def fetchmany(self, size):
+        rows = self.rows[self.position : self.position + size]
+        self.position += len(rows)
+        return rows
+
+
+def dict_rows_to_agate(cursor):
+    # how get_result_from_cursor built its table before
+    column_names = [col[0] for col in cursor.description]
+    data = SQLConnectionManager.process_results(column_names, cursor.fetchall())
+    return agate_helper.table_from_data_flat(data, column_names)
+
+
+def columnar(cursor):
+    return SQLConnectionManager.get_result_from_cursor(cursor)
+
+
+def columnar_to_agate(cursor):
+    table = SQLConnectionManager.get_result_from_cursor(cursor)
+    table.rows
+    return table
+
+
+def measure(func, num_rows, trace_memory):
+    cursor = FakeCursor(num_rows)
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    table = func(cursor)
+    elapsed = time.perf_counter() - started
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    del table
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also report the peak memory allocated, which makes every run slower",
+    )
+    args = parser.parse_args()
+
+    for name, func in [
+        ("dict rows to agate", dict_rows_to_agate),
+        ("columnar", columnar),
+        ("columnar, then agate", columnar_to_agate),
+    ]:
+        elapsed, peak = measure(func, args.rows, args.memory)
+        line = f"{name:<24}{elapsed:>8.2f}s"
+        if args.memory:
+            line += f"{peak / 2 ** 20:>10.1f}MB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""Compare the time it takes to add the test edges `dbt build` needs to the
+graph of a generated project, with the single pass Compiler.add_test_edges
+does now and with the search upstream of every node it used to do, and check
+that both give the same graph.
+
+No project files are needed:
+
+    python scripts/bench-test-edges.py --models 6000 --tests 25000
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+import networkx as nx  # type: ignore
+
+from dbt.compilation import Compiler, Linker, _get_tests_for_node
+from dbt.contracts.graph.manifest import Manifest
+from dbt.node_types import NodeType
+
+
+def make_node(unique_id, resource_type, depends_on):
+    return SimpleNamespace(
+        unique_id=unique_id,
+        resource_type=resource_type,
+        fqn=unique_id.split("."),
+        depends_on_nodes=depends_on,
+        config=SimpleNamespace(enabled=True),
+        empty=False,
+    )
+
+
+def make_manifest(num_models, num_tests, num_layers, seed):
+    rng = random.Random(seed)
+    sources = {
+        f"source.bench.raw.table_{n}": make_node(
+            f"source.bench.raw.table_{n}", NodeType.Source, []
+        )
+        for n in range(max(num_models // 20, 1))
+    }
+    source_ids = list(sources)
+    model_ids = []
+    nodes = {}
+    # staging models select from sources, the models in each layer after
+    # that ref one to three models from the layer before it, and sometimes
+    # one from an earlier layer
+    layer_size = max(num_models // num_layers, 1)
+    layers = []
+    for n in range(num_models):
+        layer = min(n // layer_size, num_layers - 1)
+        if layer == len(layers):
+            layers.append([])
+        unique_id = f"model.bench.model_{layer}_{n}"
+        if layer == 0:
+            depends_on = [rng.choice(source_ids)]
+        else:
+            depends_on = rng.sample(layers[layer - 1], min(layer_size, rng.randint(1, 3)))
+            if layer > 1 and rng.random() < 0.3:
+                depends_on.append(rng.choice(layers[rng.randrange(layer - 1)]))
+        nodes[unique_id] = make_node(unique_id, NodeType.Model, depends_on)
+        layers[layer].append(unique_id)
+        model_ids.append(unique_id)
+    tested = model_ids + source_ids
+    for n in range(num_tests):
+        unique_id = f"test.bench.test_{n}"
+        depends_on = [rng.choice(tested)]
+        # some are relationships tests between two nodes
+        if rng.random() < 0.2:
+            depends_on.append(rng.choice(tested))
+        nodes[unique_id] = make_node(unique_id, NodeType.Test, sorted(set(depends_on)))
+    manifest = Manifest(nodes=nodes, sources=sources)
+    manifest.build_parent_and_child_maps()
+    return manifest
+
+
+def add_test_edges_per_node(linker, manifest):
+    # how Compiler.add_test_edges worked before
+    for node_id in linker.graph:
+        if node_id in manifest.nodes and manifest.nodes[node_id].resource_type != NodeType.Test:
+            all_upstream_nodes = nx.traversal.bfs_tree(linker.graph, node_id, reverse=True)
+            upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
+            upstream_tests = []
+            for upstream_node in upstream_nodes:
+                upstream_tests += _get_tests_for_node(manifest, upstream_node)
+            for upstream_test in upstream_tests:
+                test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
+                if test_depends_on.issubset(upstream_nodes):
+                    linker.graph.add_edge(upstream_test, node_id)
+
+
+def linked(manifest):
+    compiler = Compiler(config=None)
+    linker = Linker()
+    # the same graph link_graph builds
+    for source_id in manifest.sources:
+        linker.add_node(source_id)
+    for unique_id in manifest.nodes:
+        compiler.link_node(linker, unique_id, manifest)
+    return compiler, linker
+
+
+def measure(func, manifest):
+    compiler, linker = linked(manifest)
+    started = time.perf_counter()
+    func(compiler, linker, manifest)
+    return time.perf_counter() - started, linker.graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--tests", type=int, default=8000)
+    parser.add_argument("--layers", type=int, default=8, help="The depth of the model graph")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-old", action="store_true", help="Only time the single pass, without checking it"
+    )
+    args = parser.parse_args()
+
+    manifest = make_manifest(args.models, args.tests, args.layers, args.seed)
+    elapsed, graph = measure(
+        lambda compiler, linker, manifest: compiler.add_test_edges(linker, manifest), manifest
+    )
+    print(f"{'single pass':<24}{elapsed:>8.2f}s{graph.number_of_edges():>12} edges")
+    if args.skip_old:
+        return
+
+    old_elapsed, old_graph = measure(
+        lambda compiler, linker, manifest: add_test_edges_per_node(linker, manifest), manifest
+    )
+    print(f"{'search per node':<24}{old_elapsed:>8.2f}s{old_graph.number_of_edges():>12} edges")
+    if set(graph.nodes) != set(old_graph.nodes) or set(graph.edges) != set(old_graph.edges):
+        raise SystemExit("The graphs are different")
+    print("The graphs are the same")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,13 @@
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_store import PartialParseStore
 import os
 from test.integration.base import DBTIntegrationTest, use_profile
 
 
 def get_manifest():
-    path = './target/partial_parse.msgpack'
-    if os.path.exists(path):
-        with open(path, 'rb') as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+    store = PartialParseStore('./target/partial_parse.db')
+    if store.exists():
+        manifest: Manifest = store.read()
         return manifest
     else:
         return None
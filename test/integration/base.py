@@ -33,6 +33,7 @@ from dbt.events.test_types import (
     IntegrationTestException
 )
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_store import PartialParseStore
 
 
 INITIAL_ROOT = os.getcwd()
@@ -1148,11 +1149,9 @@ class AnyStringWith:
 
 
 def get_manifest():
-    path = './target/partial_parse.msgpack'
-    if os.path.exists(path):
-        with open(path, 'rb') as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+    store = PartialParseStore('./target/partial_parse.db')
+    if store.exists():
+        manifest: Manifest = store.read()
         return manifest
     else:
         return None
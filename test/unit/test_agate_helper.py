@@ -9,6 +9,7 @@ import os
 from shutil import rmtree
 from tempfile import mkdtemp
 from dbt.clients import agate_helper
+from dbt.exceptions import RuntimeException
 
 SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
 1,n,test,3.2,20180806T11:33:29.320Z,True,NULL
@@ -71,6 +72,33 @@ class TestAgateHelper(unittest.TestCase):
         for expected, row in zip(EXPECTED_STRINGS, tbl):
             self.assertEqual(list(row), expected)
 
+    def test_from_csv_row_limit(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        tbl = agate_helper.from_csv(path, (), row_limit=1)
+        self.assertEqual(len(tbl), 1)
+        self.assertEqual(list(tbl[0]), EXPECTED[0])
+
+    def test_cast_csv_rows(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        tbl = agate_helper.from_csv(path, ('b',), row_limit=2)
+        rows = list(agate_helper.cast_csv_rows(path, tbl.column_types))
+        self.assertEqual(rows, EXPECTED)
+
+        # the second row doesn't fit the types inferred from the first
+        with open(path, 'a') as fp:
+            fp.write('\n3,n,test,not a number,20180806T11:33:29.320Z,True,NULL')
+        with self.assertRaisesRegex(RuntimeException, 'Error at line 4 column d'):
+            list(agate_helper.cast_csv_rows(path, tbl.column_types))
+
+        with open(path, 'w') as fp:
+            fp.write('a,b,c,d,e,f,g\n1,n,test,3.2,20180806T11:33:29.320Z,True,NULL,extra')
+        with self.assertRaisesRegex(RuntimeException, 'Line 2 has 8 values'):
+            list(agate_helper.cast_csv_rows(path, tbl.column_types))
+
     def test_from_data(self):
         column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
         data = [
@@ -179,3 +207,36 @@ class TestAgateHelper(unittest.TestCase):
         for i, row in enumerate(tbl):
             self.assertEqual(list(row), expected[i])
 
+
+    def test_table_from_batches(self):
+        column_names = ['a', 'b', 'c', 'd', 'e']
+        rows = [
+            ('0006', 1, None, {'key': 'value'}, datetime(2022, 1, 1)),
+            ('null', 2.5, True, [1, 2], None),
+            ('', None, False, None, datetime(2022, 1, 2)),
+        ]
+        expected = agate_helper.table_from_data_flat(
+            data=[dict(zip(column_names, row)) for row in rows], column_names=column_names
+        )
+
+        tbl = agate_helper.table_from_batches(column_names, [rows[:2], rows[2:]])
+        self.assertEqual(len(tbl), 3)
+        self.assertEqual(tbl.column_names, ('a', 'b', 'c', 'd', 'e'))
+        self.assertEqual(tbl.column_values('b'), [1, 2.5, None])
+        self.assertEqual(tbl.column_values(3), ['{"key": "value"}', '[1, 2]', None])
+        self.assertEqual(list(tbl.raw_rows())[0][:2], ('0006', 1))
+        self.assertFalse(tbl.is_built)
+
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in expected.column_types]
+        )
+        self.assertTrue(tbl.is_built)
+        self.assertEqual([list(row) for row in tbl], [list(row) for row in expected])
+        self.assertEqual(tbl.columns['b'].values(), expected.columns['b'].values())
+        self.assertEqual(agate_helper.as_matrix(tbl), agate_helper.as_matrix(expected))
+
+    def test_table_from_no_batches(self):
+        tbl = agate_helper.table_from_batches(['a', 'b'], [])
+        self.assertEqual(len(tbl), 0)
+        self.assertEqual(tbl.column_names, ('a', 'b'))
+        self.assertEqual(list(tbl.rows), [])
@@ -222,6 +222,35 @@ class TestGetRelations(TestCache):
         relations = self.cache.get_relations('dbt', 'foo_2')
         self.assertEqual(len(relations), 0)
 
+    def test_get_named(self):
+        relations = self.cache.get_relations_named('DBT', 'Foo', 'BAR')
+        self.assertEqual(len(relations), 1)
+        self.assertIs(relations[0], self.relation)
+        self.assertEqual(self.cache.get_relations_named('dbt', 'foo', 'baz'), [])
+        self.assertEqual(self.cache.get_relations_named('dbt', 'foo_2', 'bar'), [])
+
+    def test_get_after_rename_to_other_schema(self):
+        renamed = make_relation('dbt', 'foo_2', 'baz')
+        self.cache.rename(self.relation, renamed)
+        self.assertEqual(self.cache.get_relations('dbt', 'foo'), [])
+        self.assertEqual(self.cache.get_relations_named('dbt', 'foo', 'bar'), [])
+        relations = self.cache.get_relations_named('dbt', 'foo_2', 'baz')
+        self.assertEqual([r.identifier for r in relations], ['baz'])
+
+    def test_get_while_adding(self):
+        # lookups only hold the lock of the schema they're in
+        def add(n):
+            self.cache.add(make_relation('dbt', f'schema_{n % 4}', f'table_{n}'))
+            return len(self.cache.get_relations_named('dbt', 'foo', 'bar'))
+
+        pool = ThreadPool(8)
+        found = pool.map(add, range(200))
+        pool.close()
+        pool.join()
+        self.assertEqual(found, [1] * 200)
+        for n in range(4):
+            self.assertEqual(len(self.cache.get_relations('dbt', f'schema_{n}')), 50)
+
 
 class TestAdd(TestCache):
     def setUp(self):
@@ -489,3 +518,25 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+    def test_snapshot_and_restore(self):
+        relations, links = self.cache.snapshot()
+        restored = RelationsCache()
+        changes = []
+        restored.on_change = lambda: changes.append(True)
+        restored.restore(relations, links)
+        self.assertEqual(restored.dump_graph(), self.cache.dump_graph())
+        self.assertEqual(changes, [])
+
+        # drops still cascade through the restored links
+        restored.drop(make_relation('dbt', 'foo', 'table1'))
+        self.assertEqual(len(restored.relations), 2)
+        self.assertEqual(changes, [True])
+
+    def test_snapshot_schemas(self):
+        relations, links = self.cache.snapshot({('dbt', 'foo')})
+        self.assertEqual(
+            sorted(r.identifier for r in relations), ['table1', 'table3', 'table4']
+        )
+        # only the links within the snapshot are kept
+        self.assertEqual(len(links), 2)
@@ -1,4 +1,5 @@
 import itertools
+import pickle
 import unittest
 import os
 from typing import Set, Dict, Any
@@ -9,12 +10,14 @@ import pytest
 from dbt.adapters import postgres
 from dbt.adapters import factory
 from dbt.adapters.base import AdapterConfig
-from dbt.clients.jinja import MacroStack
+from dbt.clients import agate_helper
+from dbt.clients.jinja import MacroStack, get_rendered
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn, ParsedMacro
 )
 from dbt.config.project import VarProvider
 from dbt.context import base, target, configured, providers, docs, manifest, macros
+from dbt.context import context_config
 from dbt.contracts.files import FileHash
 from dbt.node_types import NodeType
 import dbt.exceptions
@@ -101,6 +104,34 @@ class TestVar(unittest.TestCase):
         self.assertEqual(var('foo', 'bar'), 'bar')
         self.assertEqual(var('foo'), None)
 
+    def test_parser_var_records_reads(self):
+        self.config.cli_vars = {'foo': 'baz'}
+        read = []
+        var = providers.ParseVar(self.context, self.config, self.model, on_read=read.append)
+        var('foo')
+        var('bar', 'default')
+        self.assertEqual(read, ['foo', 'bar'])
+
+
+class TestParseTarget(unittest.TestCase):
+    def setUp(self):
+        self.read = set()
+        self.target = target.ParseTarget({'name': 'dev', 'schema': 'analytics'}, self.read.add)
+
+    def test_lookups_record_keys(self):
+        self.assertEqual(self.target['name'], 'dev')
+        self.assertIsNone(self.target.get('host'))
+        self.assertEqual(self.read, {'name', 'host'})
+
+    def test_whole_target_records_all_keys(self):
+        self.assertEqual(dict(self.target.items()), {'name': 'dev', 'schema': 'analytics'})
+        self.assertEqual(self.read, {'name', 'schema'})
+
+    def test_pickles_as_dict(self):
+        unpickled = pickle.loads(pickle.dumps(self.target))
+        self.assertIs(type(unpickled), dict)
+        self.assertEqual(unpickled, {'name': 'dev', 'schema': 'analytics'})
+
 
 class TestParseWrapper(unittest.TestCase):
     def setUp(self):
@@ -191,7 +222,7 @@ REQUIRED_BASE_KEYS = frozenset({
 
 REQUIRED_TARGET_KEYS = REQUIRED_BASE_KEYS | {'target'}
 REQUIRED_DOCS_KEYS = REQUIRED_TARGET_KEYS | {'project_name'} | {'doc'}
-MACROS = frozenset({'macro_a', 'macro_b', 'root', 'dbt'})
+MACROS = frozenset({'macro_a', 'macro_b', 'root', 'dbt', '_macro_namespace'})
 REQUIRED_QUERY_HEADER_KEYS = REQUIRED_TARGET_KEYS | {'project_name'} | MACROS
 REQUIRED_MACRO_KEYS = REQUIRED_QUERY_HEADER_KEYS | {
     '_sql_results',
@@ -414,6 +445,28 @@ def test_model_runtime_context(config_postgres, manifest_fx, get_adapter, get_in
     assert_has_keys(REQUIRED_MODEL_KEYS, MAYBE_KEYS, ctx)
 
 
+def test_load_result(config_postgres, manifest_fx, get_adapter, get_include_paths):
+    ctx = providers.generate_runtime_model_context(
+        model=mock_model(),
+        config=config_postgres,
+        manifest=manifest_fx,
+    )
+    table = agate_helper.table_from_batches(['a', 'b'], [[('x', 'y'), ('z', None)]])
+    ctx['store_result']('rows', response='OK', agate_table=table)
+    # the agate rows are only built when the result is loaded
+    assert not table.is_built
+
+    result = ctx['load_result']('rows')
+    assert result.response == 'OK'
+    assert result.table is table
+    assert isinstance(result['data'], list)
+    assert result.data is result['data']
+    assert result['data'] + [('w', 'v')] == [('x', 'y'), ('z', None), ('w', 'v')]
+    assert ctx['tojson'](result['data']) == '[["x", "y"], ["z", null]]'
+    assert ctx['load_result']('rows') is result
+    assert ctx['load_result']('missing') is None
+
+
 def test_docs_runtime_context(config_postgres):
     ctx = docs.generate_runtime_docs_context(config_postgres, mock_model(), [], 'root')
     assert_has_keys(REQUIRED_DOCS_KEYS, MAYBE_KEYS, ctx)
@@ -464,3 +517,163 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result['dbt']['some_macro'].macro is pg_macro
         assert result['root']['some_macro'].macro is package_macro
         assert result['some_macro'].macro is package_macro
+
+
+def mock_sql_macro(name, package_name, macro_sql):
+    macro = mock_macro(name, package_name)
+    macro.macro_sql = macro_sql
+    return macro
+
+
+def test_macro_namespace_binds_on_call():
+    macro_a = mock_sql_macro(
+        'macro_a', 'root', '{% macro macro_a() %}a:{{ macro_b() }}{% endmacro %}'
+    )
+    macro_b = mock_sql_macro('macro_b', 'root', '{% macro macro_b() %}b{% endmacro %}')
+    macro_c = mock_sql_macro('macro_c', 'root', '{% macro macro_c() %}c{% endmacro %}')
+    model = mock.MagicMock(depends_on=DependsOn())
+    mn = macros.MacroNamespaceBuilder('root', 'root', MacroStack(), ['dbt'], model)
+    ctx = {}
+    namespace = mn.build_namespace([macro_a, macro_b, macro_c], ctx)
+    ctx.update(namespace.context_members())
+    ctx[macros.MACRO_NAMESPACE_KEY] = namespace
+    assert namespace._generators == {}
+
+    assert get_rendered('{{ macro_a() }} {{ root.macro_b() }}', ctx) == 'a:b b'
+    assert set(namespace._generators) == {'macro.root.macro_a', 'macro.root.macro_b'}
+    # only the macros called at the top level are dependencies
+    assert model.depends_on.macros == ['macro.root.macro_a', 'macro.root.macro_b']
+    assert namespace['macro_b'] is namespace._generators['macro.root.macro_b']
+
+
+def test_macro_index_is_shared(config_postgres, manifest_fx):
+    first = manifest.generate_query_header_context(config_postgres, manifest_fx)
+    second = manifest.generate_query_header_context(config_postgres, manifest_fx)
+    assert first['macro_a'] is second['macro_a']
+    assert first['root'] is second['root']
+    assert first[macros.MACRO_NAMESPACE_KEY] is not second[macros.MACRO_NAMESPACE_KEY]
+    index = first[macros.MACRO_NAMESPACE_KEY].index
+    assert second[macros.MACRO_NAMESPACE_KEY].index is index
+
+    # the index is rebuilt once the macros change
+    macro_c = mock_macro('macro_c', 'root')
+    manifest_fx.macros[macro_c.unique_id] = macro_c
+    third = manifest.generate_query_header_context(config_postgres, manifest_fx)
+    assert third[macros.MACRO_NAMESPACE_KEY].index is not index
+    assert third['macro_c'].macro is macro_c
+
+
+def test_model_contexts_share_members(config_postgres, manifest_fx, get_adapter, get_include_paths):
+    first_model = mock_model()
+    second_model = mock_model()
+    second_model.schema = 'other_schema'
+    first = providers.generate_runtime_model_context(first_model, config_postgres, manifest_fx)
+    second = providers.generate_runtime_model_context(second_model, config_postgres, manifest_fx)
+
+    for key in ('modules', 'flags', 'api', 'validation', 'project_name', 'fromjson'):
+        assert first[key] is second[key]
+        assert first['builtins'][key] is first[key]
+    # so the shared mappings can't be changed
+    with pytest.raises(TypeError):
+        first['modules']['re'] = None
+    with pytest.raises(TypeError):
+        first['modules']['datetime']['date'] = None
+    with pytest.raises(TypeError):
+        first['api']['Column'] = None
+    rendered = get_rendered(
+        "{% do validation.any(1, 2)(2) %}"
+        "{{ modules.datetime.date(2022, 1, 2) }}",
+        first,
+    )
+    assert rendered == '2022-01-02'
+    assert first['execute'] is True
+    # members about the node are built for each context
+    assert first['schema'] == 'analytics'
+    assert second['schema'] == 'other_schema'
+    assert first['exceptions'] is not second['exceptions']
+    assert first['target'] == second['target']
+    assert first['target'] is not second['target']
+
+    # the parse contexts have their own shared members
+    parse_ctx = providers.generate_parser_model_context(
+        first_model, config_postgres, manifest_fx, mock.MagicMock()
+    )
+    other_parse_ctx = providers.generate_parser_model_context(
+        second_model, config_postgres, manifest_fx, mock.MagicMock()
+    )
+    assert parse_ctx['execute'] is False
+    assert parse_ctx['api'] is other_parse_ctx['api']
+    assert parse_ctx['api'] is not first['api']
+
+    # a new config gets new shared members
+    other_config = config_from_parts_or_dicts(PROJECT_DATA, POSTGRES_PROFILE_DATA)
+    other = providers.generate_runtime_model_context(first_model, other_config, manifest_fx)
+    assert other['api'] is not first['api']
+
+
+def test_shared_context_members():
+    assert {'modules', 'flags', 'dbt_version'} <= base.BaseContext._shared_context_members_
+    assert 'project_name' in configured.ConfiguredContext._shared_context_members_
+    assert 'schema' in providers.ProviderContext._shared_context_members_
+    # ModelContext overrides schema with the node's schema
+    assert 'schema' not in providers.ModelContext._shared_context_members_
+    assert 'schema' in providers.ModelContext._node_context_members_
+    assert 'var' not in providers.ModelContext._shared_context_members_
+
+
+def test_wrapped_exports_add_the_node():
+    model = mock_model()
+    exports = dbt.exceptions.wrapped_exports(model)
+    assert set(exports) == set(dbt.exceptions.CONTEXT_EXPORTS)
+    assert exports['raise_compiler_error'] is exports['raise_compiler_error']
+    with pytest.raises(dbt.exceptions.CompilationException) as exc:
+        exports['raise_compiler_error']('bad')
+    assert exc.value.node is model
+
+
+def test_context_config_merges_fqn_prefixes_once(postgres_adapter):
+    project = dict(PROJECT_DATA)
+    project['models'] = {
+        '+materialized': 'view',
+        'root': {
+            '+meta': {'owners': ['a']},
+            'staging': {'+materialized': 'table', '+tags': ['staging']},
+        },
+    }
+    config = config_from_parts_or_dicts(project, POSTGRES_PROFILE_DATA)
+
+    def build(fqn, rendered=True, **config_call):
+        ctx_config = context_config.ContextConfig(config, fqn, NodeType.Model, 'root')
+        ctx_config.add_config_call(config_call)
+        return ctx_config.build_config_dict(rendered=rendered)
+
+    generator = context_config.ContextConfigGenerator
+    with mock.patch.object(
+        generator, '_update_from_config', autospec=True,
+        side_effect=generator._update_from_config,
+    ) as update:
+        first = build(['root', 'staging', 'first'])
+        # the project config, then the root and staging levels, then the
+        # config call
+        assert update.call_count == 4
+        second = build(['root', 'staging', 'second'], tags=['second'])
+        assert update.call_count == 5
+
+    assert first['materialized'] == second['materialized'] == 'table'
+    assert first['tags'] == ['staging']
+    assert second['tags'] == ['staging', 'second']
+    assert build(['root', 'other'])['materialized'] == 'view'
+
+    # nested values aren't shared between the nodes under a prefix
+    first['meta']['owners'].append('x')
+    assert build(['root', 'staging', 'third'])['meta'] == {'owners': ['a']}
+    assert second['meta'] == {'owners': ['a']}
+
+    unrendered = build(['root', 'staging', 'third'], rendered=False)
+    assert unrendered == {'materialized': 'table', 'meta': {'owners': ['a']}, 'tags': ['staging']}
+    unrendered['meta']['owners'].append('b')
+    assert build(['root', 'staging', 'third'], rendered=False)['meta'] == {'owners': ['a']}
+
+    # a changed config tree isn't merged from the old layers
+    config.models = {'+materialized': 'ephemeral'}
+    assert build(['root', 'staging', 'first'])['materialized'] == 'ephemeral'
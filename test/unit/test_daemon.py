@@ -0,0 +1,109 @@
+import io
+import os
+import shutil
+import threading
+import unittest
+from tempfile import mkdtemp
+from types import SimpleNamespace
+
+import dbt.exceptions
+
+from dbt.clients.daemon import DAEMON_SOCKET_FILE_NAME, find_socket_path, send_request
+from dbt.contracts.graph.manifest import Manifest
+from dbt.task.daemon import DaemonServer, DaemonTask, ProjectWatcher, copy_for_task
+
+
+class FakeDaemonTask:
+    def __init__(self):
+        self.requests = []
+
+    def handle_request(self, args, output, cwd=None):
+        self.requests.append(args)
+        self.cwd = cwd
+        output.write('running {}\n'.format(' '.join(args)))
+        print('printed output', file=output)
+        return 1
+
+    def poll_files(self):
+        pass
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_file(self, *parts, contents='select 1'):
+        path = os.path.join(self.tmp_dir, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as fp:
+            fp.write(contents)
+        return path
+
+    def test_watcher_finds_changed_files(self):
+        changed = self.write_file('models', 'changed.sql')
+        deleted = self.write_file('models', 'deleted.sql')
+        self.write_file('models', 'unchanged.sql')
+        self.write_file('target', 'run', 'model.sql')
+        self.write_file('.git', 'HEAD')
+        watcher = ProjectWatcher([self.tmp_dir], ignore=[os.path.join(self.tmp_dir, 'target')])
+        self.assertEqual(watcher.poll(), set())
+
+        self.write_file('models', 'changed.sql', contents='select 2 as changed')
+        os.remove(deleted)
+        added = self.write_file('models', 'nested', 'added.sql')
+        self.write_file('target', 'run', 'model.sql', contents='changed')
+        self.write_file('.git', 'HEAD', contents='changed')
+        self.assertEqual(watcher.poll(), {changed, deleted, added})
+        self.assertEqual(watcher.poll(), set())
+
+    def test_find_socket_path(self):
+        self.write_file('dbt_project.yml', contents='name: test')
+        models = os.path.dirname(self.write_file('models', 'a', 'model.sql'))
+        expected = os.path.join(self.tmp_dir, 'target', DAEMON_SOCKET_FILE_NAME)
+        self.assertEqual(find_socket_path(models), expected)
+        self.assertEqual(find_socket_path(self.tmp_dir), expected)
+
+    def test_send_request(self):
+        task = FakeDaemonTask()
+        path = os.path.join(self.tmp_dir, DAEMON_SOCKET_FILE_NAME)
+        with DaemonServer(path, task) as server:
+            thread = threading.Thread(target=server.handle_request)
+            thread.start()
+            out = io.StringIO()
+            exit_code = send_request(path, ['ls', '--select', 'my_model'], out)
+            thread.join()
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(task.requests, [['ls', '--select', 'my_model']])
+        self.assertEqual(task.cwd, os.getcwd())
+        self.assertEqual(out.getvalue(), 'running ls --select my_model\nprinted output\n')
+
+    def test_request_project_dir(self):
+        project_root = os.path.join(self.tmp_dir, 'project')
+        task = DaemonTask.__new__(DaemonTask)
+        task.config = SimpleNamespace(project_root=project_root)
+        task.args = SimpleNamespace(profiles_dir='profiles', profile=None, target=None, vars='{}')
+
+        def request(project_dir, cwd):
+            parsed = SimpleNamespace(
+                which='run', project_dir=project_dir, profiles_dir='profiles',
+                profile=None, target=None, vars='{}',
+            )
+            task.set_request_args(parsed, cwd)
+
+        request(project_root, None)
+        request('.', project_root)
+        request('..', os.path.join(project_root, 'models'))
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            request('.', self.tmp_dir)
+
+    def test_copy_for_task(self):
+        manifest = Manifest(nodes={'model.test.a': 'parsed'})
+        manifest.flat_graph = {'nodes': {'model.test.a': {'compiled': False}}}
+        copied = copy_for_task(manifest)
+        copied.nodes['model.test.a'] = 'compiled'
+        copied.flat_graph['nodes']['model.test.a'] = {'compiled': True}
+        self.assertEqual(manifest.nodes, {'model.test.a': 'parsed'})
+        self.assertEqual(manifest.flat_graph['nodes'], {'model.test.a': {'compiled': False}})
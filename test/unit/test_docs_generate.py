@@ -1,6 +1,10 @@
+from argparse import Namespace
 from datetime import datetime
 from decimal import Decimal
+from tempfile import mkdtemp
 from unittest import mock
+import os
+import shutil
 import unittest
 
 import dbt.flags
@@ -352,3 +356,60 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+    def test__add_rows_in_batches(self):
+        column_names = ['table_database', 'table_schema', 'table_name', 'table_type',
+                        'column_name', 'column_index', 'column_type']
+        catalog = generate.Catalog([])
+        catalog.add_rows(column_names, [
+            ('test_database', 'Test_Schema', 'test_table', 'BASE TABLE', 'id', Decimal('1'), 'integer'),
+        ])
+        catalog.add_rows(column_names, [
+            ('test_database', 'Test_Schema', 'test_table', 'BASE TABLE', 'name', Decimal('2'), 'text'),
+            ('test_database', 'other_schema', 'test_table', 'VIEW', 'id', Decimal('1'), 'integer'),
+        ])
+        table = catalog[generate.CatalogKey('test_database', 'Test_Schema', 'test_table')]
+        self.assertEqual(list(table.columns), ['id', 'name'])
+        self.assertEqual(table.columns['name'].index, 2)
+
+        tables = catalog.tables_by_schema()
+        self.assertEqual(sorted(tables), [
+            ('test_database', 'other_schema'), ('test_database', 'test_schema'),
+        ])
+        other = generate.Catalog([])
+        other.add_tables(tables[('test_database', 'test_schema')])
+        self.assertEqual(dict(other), {
+            generate.CatalogKey('test_database', 'Test_Schema', 'test_table'): table,
+        })
+
+    def test__catalog_state(self):
+        tmp_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        task = generate.GenerateTask.__new__(generate.GenerateTask)
+        task.args = Namespace(catalog_state=tmp_dir)
+        task.config = mock.MagicMock(target_path=tmp_dir)
+        self.assertEqual(task.read_catalog_state('postgres'), {})
+
+        catalog = generate.Catalog([{
+            'table_database': 'test_database',
+            'table_schema': 'test_schema',
+            'table_name': 'test_table',
+            'table_type': 'BASE TABLE',
+            'column_name': 'id',
+            'column_index': Decimal('1'),
+            'column_type': 'integer',
+        }])
+        tokens = {
+            ('test_database', 'test_schema'): 'abc',
+            ('test_database', 'empty_schema'): '',
+        }
+        task.write_catalog_state('postgres', catalog, tokens)
+        self.assertTrue(os.path.exists(os.path.join(tmp_dir, generate.CATALOG_STATE_FILENAME)))
+
+        state = task.read_catalog_state('postgres')
+        self.assertEqual(state, {
+            ('test_database', 'test_schema'): ('abc', list(catalog.values())),
+            ('test_database', 'empty_schema'): ('', []),
+        })
+        # the state of another adapter isn't used
+        self.assertEqual(task.read_catalog_state('snowflake'), {})
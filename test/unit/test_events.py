@@ -1,7 +1,11 @@
 from dbt.adapters.reference_keys import _ReferenceKey
 from dbt.events.test_types import UnitTestInfo
 from dbt.events import AdapterLogger
+from dbt.events.binary import (
+    BINARY_EVENT_LOG_FILE_NAME, BinaryEventLog, read_records, write_json_lines
+)
 from dbt.events.functions import event_to_serializable_dict
+from dbt.events.history import EventHistory, EventSummary
 from dbt.events.base_types import NodeInfo
 from dbt.events.types import *
 from dbt.events.test_types import *
@@ -11,8 +15,17 @@ from importlib import reload
 import dbt.events.functions as event_funcs
 import dbt.flags as flags
 from dbt.helper_types import Lazy
+import gc
 import inspect
+import io
 import json
+import logging
+import os
+import shutil
+import threading
+import tracemalloc
+import weakref
+from tempfile import mkdtemp
 from unittest import TestCase
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn
@@ -201,6 +214,8 @@ sample_values = [
     Rollback(conn_name=""),
     CacheMiss(conn_name="", database="", schema=""),
     ListRelations(database="", schema="", relations=[]),
+    RelationCacheSnapshotUsed(path="", relations=0),
+    RelationCacheSnapshotSkipped(path="", reason=""),
     ConnectionUsed(conn_type="", conn_name=""),
     SQLQuery(conn_name="", sql=""),
     SQLQueryStatus(status="", elapsed=0.1),
@@ -264,6 +279,7 @@ sample_values = [
     PartialParsingDeletedMetric(id=''),
     ParsedFileLoadFailed(path='', exc=''),
     PartialParseSaveFileNotFound(),
+    PartialParsingWroteRecords(written=0, deleted=0),
     StaticParserCausedJinjaRendering(path=''),
     UsingExperimentalParser(path=''),
     SampleFullJinjaRendering(path=''),
@@ -318,11 +334,16 @@ sample_values = [
     CatalogWritten(path=''),
     CannotGenerateDocs(),
     BuildingCatalog(),
+    CatalogStateUsed(path="", reused=0, schemas=0),
+    CatalogStateSkipped(path="", reason=""),
     CompileComplete(),
     FreshnessCheckComplete(),
     ServingDocsPort(address='', port=0),
     ServingDocsAccessInfo(port=''),
     ServingDocsExitInfo(),
+    DaemonListening(path=""),
+    DaemonFilesChanged(changed=0, reload_config=False),
+    DaemonRefreshFailed(exc=""),
     SeedHeader(header=''),
     SeedHeaderSeparator(len_header=0),
     RunResultWarning(resource_type='', node_name='', path=''),
@@ -394,7 +415,6 @@ sample_values = [
     RetryExternalCall(attempt=0, max=0),
     GeneralWarningMsg(msg='', log_fmt=''),
     GeneralWarningException(exc=Exception(''), log_fmt=''),
-    PartialParsingProfileEnvVarsChanged(),
     AdapterEventDebug(name='', base_msg='', args=()),
     AdapterEventInfo(name='', base_msg='', args=()),
     AdapterEventWarning(name='', base_msg='', args=()),
@@ -406,7 +426,6 @@ sample_values = [
     PartialParsingNotEnabled(),
     SQlRunnerException(exc=Exception('')),
     DropRelation(dropped=_ReferenceKey(database="", schema="", identifier="")),
-    PartialParsingProjectEnvVarsChanged(),
     RegistryProgressGETResponse(url='', resp_code=1),
     IntegrationTestDebug(msg=''),
     IntegrationTestInfo(msg=''),
@@ -418,6 +437,166 @@ sample_values = [
 ]
 
 
+class TestEventHistory(TestCase):
+
+    def test_debug_events_are_summarized(self):
+        history = EventHistory(maxlen=10)
+        event = SQLQuery(conn_name='master', sql='select 1')
+        event_ref = weakref.ref(event)
+        history.append(event)
+        history.append(SQLQuery(conn_name='master', sql='select 2'))
+        del event
+        gc.collect()
+
+        self.assertIsNone(event_ref())
+        self.assertEqual(history[0], EventSummary(code='E016', level='debug', name='SQLQuery'))
+        # every event of a type shares its summary
+        self.assertIs(history[0], history[1])
+        self.assertEqual(history.level_counts['debug'], 2)
+
+    def test_retention(self):
+        history = EventHistory(maxlen=10, retain_level='warn', retain_types={SQLQuery})
+        info = UnitTestInfo(msg='info')
+        warning = EventBufferFull()
+        query = SQLQuery(conn_name='master', sql='select 1')
+        for event in (info, warning, query):
+            history.append(event)
+        self.assertEqual(history[0].code, 'T006')
+        self.assertIsInstance(history[0], EventSummary)
+        self.assertIs(history[1], warning)
+        self.assertIs(history[2], query)
+
+    def test_retention_from_flags(self):
+        old_level, old_types = flags.EVENT_HISTORY_RETAIN_LEVEL, flags.EVENT_HISTORY_RETAIN_TYPES
+        try:
+            # values from environment variables are lowercased
+            flags.EVENT_HISTORY_RETAIN_LEVEL = 'warn'
+            flags.EVENT_HISTORY_RETAIN_TYPES = 'sqlquery, EventBufferFull'
+            history = event_funcs.new_event_history()
+            self.assertEqual(history.retain_level, 'warn')
+            self.assertEqual(history.retain_types, {SQLQuery, EventBufferFull})
+
+            flags.EVENT_HISTORY_RETAIN_TYPES = 'NotAnEvent'
+            with self.assertRaises(ValueError):
+                event_funcs.new_event_history()
+        finally:
+            flags.EVENT_HISTORY_RETAIN_LEVEL = old_level
+            flags.EVENT_HISTORY_RETAIN_TYPES = old_types
+
+    def test_memory_is_bounded(self):
+        history = EventHistory(maxlen=1000)
+        history.append(SQLQuery(conn_name='master', sql='select 0'))
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for n in range(5000):
+                history.append(SQLQuery(conn_name='master', sql=f'select {n} ' + 'x' * 1000))
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(history), 1000)
+        self.assertEqual(history.level_counts['debug'], 5001)
+        # a deque of the events themselves would be well over 1MB
+        self.assertLess(after - before, 64 * 1024)
+
+
+class TestFileLogWriter(TestCase):
+
+    def setUp(self):
+        flags.LOG_FORMAT = 'text'
+        reload(event_funcs)
+        self.stream = io.StringIO()
+        event_funcs.FILE_LOG = logging.getLogger('test_file_log_writer')
+        event_funcs.FILE_LOG.setLevel(logging.DEBUG)
+        event_funcs.FILE_LOG.handlers = [logging.StreamHandler(self.stream)]
+
+    def tearDown(self):
+        event_funcs.FILE_LOG_WRITER.flush()
+        reload(event_funcs)
+
+    def fire_events(self, name):
+        for n in range(200):
+            event_funcs.fire_event(SQLQuery(conn_name=name, sql=f'select {n}'))
+
+    def test_lines_are_written_in_order(self):
+        event_funcs.FILE_LOG_WRITER.max_queued = 10
+        threads = [
+            threading.Thread(target=self.fire_events, args=(name,), name=name)
+            for name in ('Thread-A', 'Thread-B', 'Thread-C')
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        event_funcs.flush_file_log()
+
+        lines = [line for line in self.stream.getvalue().splitlines() if ' On Thread-' in line]
+        self.assertEqual(len(lines), 600)
+        for name in ('Thread-A', 'Thread-B', 'Thread-C'):
+            # the thread name is the one that fired the event, not the writer's
+            thread_lines = [line for line in lines if f'[{name}  ]: ' in line]
+            self.assertEqual(
+                [line.split(']: ', 1)[1] for line in thread_lines],
+                [f'On {name}: select {n}' for n in range(200)]
+            )
+
+    def test_message_is_taken_when_fired(self):
+        event = SQLQuery(conn_name='master', sql='original')
+        event_funcs.fire_event(event)
+        event.sql = 'changed'
+        event_funcs.flush_file_log()
+        self.assertIn('original', self.stream.getvalue())
+        self.assertNotIn('changed', self.stream.getvalue())
+
+
+class TestBinaryEventLog(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        self.path = os.path.join(self.tmp_dir, BINARY_EVENT_LOG_FILE_NAME)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_records_convert_to_json_lines(self):
+        expected = []
+        binary_log = BinaryEventLog(self.path)
+        for event in sample_values:
+            if type(event) == EmptyLine:
+                continue
+            snapshot = event_funcs.take_snapshot(event)
+            binary_log.write(event_to_serializable_dict(event, snapshot))
+            expected.append(event_funcs.create_json_log_line(event, snapshot))
+        binary_log.close()
+
+        out = io.StringIO()
+        write_json_lines(self.path, out)
+        self.assertEqual(out.getvalue().splitlines(), expected)
+
+    def test_secrets_are_scrubbed(self):
+        event = SQLQuery(conn_name='master', sql="select 'hunter2'")
+        binary_log = BinaryEventLog(self.path)
+        binary_log.write(event_to_serializable_dict(event), ['hunter2'])
+        binary_log.close()
+
+        with open(self.path, 'rb') as stream:
+            values, = read_records(stream, event_funcs.LOG_VERSION)
+        self.assertEqual(values['msg'], "On master: select '*****'")
+        self.assertEqual(values['data'], {'conn_name': 'master', 'sql': "select '*****'"})
+
+    def test_truncated_record_is_skipped(self):
+        binary_log = BinaryEventLog(self.path)
+        binary_log.write(event_to_serializable_dict(SQLQuery(conn_name='master', sql='one')))
+        binary_log.write(event_to_serializable_dict(SQLQuery(conn_name='master', sql='two')))
+        binary_log.close()
+        with open(self.path, 'rb+') as fp:
+            fp.truncate(os.path.getsize(self.path) - 3)
+
+        with open(self.path, 'rb') as stream:
+            records = list(read_records(stream, event_funcs.LOG_VERSION))
+        self.assertEqual([values['msg'] for values in records], ['On master: one'])
+
+
 class TestEventJSONSerialization(TestCase):
 
     # attempts to test that every event is serializable to json.
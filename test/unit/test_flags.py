@@ -224,3 +224,122 @@ class TestFlags(TestCase):
         self.assertEqual(flags.QUIET, True)
         # cleanup
         self.user_config.quiet = None
+
+        # event_history_retain_level
+        self.user_config.event_history_retain_level = 'warn'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_LEVEL, 'warn')
+        os.environ['DBT_EVENT_HISTORY_RETAIN_LEVEL'] = 'debug'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_LEVEL, 'debug')
+        setattr(self.args, 'event_history_retain_level', 'error')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_LEVEL, 'error')
+        # cleanup
+        os.environ.pop('DBT_EVENT_HISTORY_RETAIN_LEVEL')
+        delattr(self.args, 'event_history_retain_level')
+        self.user_config.event_history_retain_level = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_LEVEL, 'info')
+
+        # event_history_retain_types
+        self.user_config.event_history_retain_types = 'SQLQuery'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_TYPES, 'SQLQuery')
+        os.environ['DBT_EVENT_HISTORY_RETAIN_TYPES'] = 'SQLQuery,EventBufferFull'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_TYPES, 'sqlquery,eventbufferfull')
+        setattr(self.args, 'event_history_retain_types', 'TimingInfoCollected')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_TYPES, 'TimingInfoCollected')
+        # cleanup
+        os.environ.pop('DBT_EVENT_HISTORY_RETAIN_TYPES')
+        delattr(self.args, 'event_history_retain_types')
+        self.user_config.event_history_retain_types = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.EVENT_HISTORY_RETAIN_TYPES, '')
+
+        # parse_processes
+        self.user_config.parse_processes = 4
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_PROCESSES, 4)
+        os.environ['DBT_PARSE_PROCESSES'] = '2'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_PROCESSES, 2)
+        setattr(self.args, 'parse_processes', '8')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_PROCESSES, 8)
+        # cleanup
+        os.environ.pop('DBT_PARSE_PROCESSES')
+        delattr(self.args, 'parse_processes')
+        self.user_config.parse_processes = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.PARSE_PROCESSES, 1)
+
+        # binary_event_log
+        self.user_config.binary_event_log = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BINARY_EVENT_LOG, True)
+        os.environ['DBT_BINARY_EVENT_LOG'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BINARY_EVENT_LOG, False)
+        setattr(self.args, 'binary_event_log', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BINARY_EVENT_LOG, True)
+        # cleanup
+        os.environ.pop('DBT_BINARY_EVENT_LOG')
+        delattr(self.args, 'binary_event_log')
+        self.user_config.binary_event_log = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.BINARY_EVENT_LOG, False)
+
+        # relation_cache_ttl
+        self.user_config.relation_cache_ttl = 600
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATION_CACHE_TTL, 600)
+        os.environ['DBT_RELATION_CACHE_TTL'] = '60'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATION_CACHE_TTL, 60)
+        setattr(self.args, 'relation_cache_ttl', '3600')
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATION_CACHE_TTL, 3600)
+        # cleanup
+        os.environ.pop('DBT_RELATION_CACHE_TTL')
+        delattr(self.args, 'relation_cache_ttl')
+        self.user_config.relation_cache_ttl = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.RELATION_CACHE_TTL, 0)
+
+        # critical_path_scheduling
+        self.user_config.critical_path_scheduling = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CRITICAL_PATH_SCHEDULING, True)
+        os.environ['DBT_CRITICAL_PATH_SCHEDULING'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CRITICAL_PATH_SCHEDULING, False)
+        setattr(self.args, 'critical_path_scheduling', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CRITICAL_PATH_SCHEDULING, True)
+        # cleanup
+        os.environ.pop('DBT_CRITICAL_PATH_SCHEDULING')
+        delattr(self.args, 'critical_path_scheduling')
+        self.user_config.critical_path_scheduling = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.CRITICAL_PATH_SCHEDULING, False)
+
+        # jinja_bytecode_cache
+        self.user_config.jinja_bytecode_cache = True
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_BYTECODE_CACHE, True)
+        os.environ['DBT_JINJA_BYTECODE_CACHE'] = 'false'
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_BYTECODE_CACHE, False)
+        setattr(self.args, 'jinja_bytecode_cache', True)
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_BYTECODE_CACHE, True)
+        # cleanup
+        os.environ.pop('DBT_JINJA_BYTECODE_CACHE')
+        delattr(self.args, 'jinja_bytecode_cache')
+        self.user_config.jinja_bytecode_cache = None
+        flags.set_from_args(self.args, self.user_config)
+        self.assertEqual(flags.JINJA_BYTECODE_CACHE, False)
@@ -3,6 +3,8 @@ from unittest import mock
 
 import pytest
 
+import itertools
+import random
 import string
 import dbt.exceptions
 import dbt.graph.selector as graph_selector
@@ -125,6 +127,26 @@ def test_run_specs(include, exclude, expected):
     assert selected == expected
 
 
+def test_repeated_criteria_are_selected_once():
+    graph = _get_graph()
+    manifest = _get_manifest(graph)
+    selector = graph_selector.NodeSelector(graph, manifest)
+    spec = graph_cli.parse_difference(['tag:abc', 'tag:abc,a', '+tag:abc'], ['tag:abc,a'])
+    with mock.patch.object(
+        selector, 'get_nodes_from_criteria', wraps=selector.get_nodes_from_criteria
+    ) as get_nodes:
+        selected, _ = selector.select_nodes(spec)
+        assert selected == {'m.X.c', 'm.Y.b'}
+        assert get_nodes.call_count == 3
+        # the cached sets can't be changed by the caller
+        criteria = graph_selector.SelectionCriteria.from_single_spec('tag:abc')
+        direct, _ = selector.get_cached_nodes_from_criteria(criteria)
+        direct.clear()
+        selected, _ = selector.select_nodes(spec)
+        assert selected == {'m.X.c', 'm.Y.b'}
+        assert get_nodes.call_count == 3
+
+
 param_specs = [
     ('a', False, None, False, None, 'fqn', 'a', False),
     ('+a', True, None, False, None, 'fqn', 'a', False),
@@ -195,3 +217,91 @@ invalid_specs = [
 def test_invalid_specs(invalid):
     with pytest.raises(dbt.exceptions.RuntimeException):
         graph_selector.SelectionCriteria.from_single_spec(invalid)
+
+
+def _eliminate_unselected(graph, selected):
+    # the original node-by-node algorithm, used to check the subset graph
+    new_graph = graph.copy()
+    for node in graph:
+        if node not in selected:
+            sources = [x for x, _ in new_graph.in_edges(node)]
+            targets = [x for _, x in new_graph.out_edges(node)]
+            new_graph.add_edges_from(
+                (source, target) for source in sources for target in targets
+                if source != target
+            )
+            new_graph.remove_node(node)
+    return new_graph
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_subset_graph_matches_elimination(seed):
+    rng = random.Random(seed)
+    nodes = ['n{}'.format(i) for i in range(60)]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_nodes_from(nodes)
+    for i, j in itertools.combinations(range(len(nodes)), 2):
+        if rng.random() < 0.08:
+            nx_graph.add_edge(nodes[i], nodes[j])
+    selected = set(rng.sample(nodes, rng.randint(0, len(nodes))))
+
+    subset = graph_selector.Graph(nx_graph).get_subset_graph(selected).graph
+    expected = _eliminate_unselected(nx_graph, selected)
+    assert list(subset.nodes()) == list(expected.nodes())
+    assert set(subset.edges()) == set(expected.edges())
+
+
+def test_subset_graph_with_cycle():
+    nx_graph = nx.DiGraph([('a', 'b'), ('b', 'c'), ('c', 'b'), ('c', 'd'), ('d', 'a')])
+    subset = graph_selector.Graph(nx_graph).get_subset_graph({'a', 'd'}).graph
+    assert set(subset.edges()) == {('a', 'd'), ('d', 'a')}
+    assert set(subset.edges()) == set(_eliminate_unselected(nx_graph, {'a', 'd'}).edges())
+
+
+def test_subset_graph_missing_node():
+    with pytest.raises(ValueError):
+        _get_graph().get_subset_graph({'m.X.a', 'm.X.missing'})
+
+
+def _random_dag(seed, size=60, density=0.08):
+    rng = random.Random(seed)
+    nodes = ['n{}'.format(i) for i in range(size)]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_nodes_from(nodes)
+    for i, j in itertools.combinations(range(size), 2):
+        if rng.random() < density:
+            nx_graph.add_edge(nodes[i], nodes[j])
+    return rng, nodes, nx_graph
+
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('max_depth', [None, 1, 2, 5])
+def test_select_parents_and_children_match_networkx(seed, max_depth):
+    rng, nodes, nx_graph = _random_dag(seed)
+    graph = graph_selector.Graph(nx_graph)
+    selected = set(rng.sample(nodes, rng.randint(1, 10)))
+
+    expected_children = set()
+    expected_parents = set()
+    for node in selected:
+        expected_children.update(
+            nx.single_source_shortest_path_length(nx_graph, node, cutoff=max_depth).keys() - {node}
+        )
+        expected_parents.update(
+            nx.single_source_shortest_path_length(
+                nx_graph.reverse(copy=False), node, cutoff=max_depth
+            ).keys() - {node}
+        )
+        assert graph.descendants(node, max_depth) == (
+            nx.single_source_shortest_path_length(nx_graph, node, cutoff=max_depth).keys() - {node}
+        )
+    assert graph.select_children(selected, max_depth) == expected_children
+    assert graph.select_parents(selected, max_depth) == expected_parents
+    assert graph.select_successors(selected) == {
+        child for node in selected for child in nx_graph.successors(node)
+    }
+
+
+def test_select_missing_node():
+    with pytest.raises(dbt.exceptions.InternalException):
+        _get_graph().select_children({'m.X.a', 'm.X.missing'})
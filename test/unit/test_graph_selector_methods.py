@@ -731,6 +731,43 @@ def test_select_config_materialized(manifest):
         'table_model', 'union_model', 'mynamespace.union_model'}
 
 
+def test_select_fqn_matches_every_node(manifest):
+    methods = MethodManager(manifest, None)
+    method = methods.get_method('fqn', [])
+    included = set(manifest.nodes) | set(manifest.sources)
+    selectors = ['*', 'pkg.*', 'pkg.subdirectory', 'pkg.subdirectory.*', 'pkg.mynamespace',
+                 'mynamespace.*', 'mynamespace.union_model', 'union_model', 'subdirectory',
+                 'pkg.subdirectory.union_model.extra', 'pkg.*.missing', 'seed', 'ext.*', '']
+    for selector in selectors:
+        expected = {
+            uid for uid in manifest.nodes
+            if method.node_is_match(selector, manifest.nodes[uid].fqn)
+        }
+        assert set(method.search(included, selector)) == expected, selector
+
+
+def test_select_config_unhashable_values(manifest):
+    methods = MethodManager(manifest, None)
+    method = methods.get_method('config', ['grants'])
+    table_model = manifest.nodes['model.pkg.table_model']
+    table_model.config._extra['grants'] = ['reporter']
+    view_model = manifest.nodes['model.pkg.view_model']
+    view_model.config._extra['grants'] = 'reporter'
+
+    assert search_manifest_using_method(manifest, method, ['reporter']) == {'table_model'}
+    assert search_manifest_using_method(manifest, method, 'reporter') == {'view_model'}
+
+
+def test_methods_share_index(manifest):
+    methods = MethodManager(manifest, None)
+    tag_method = methods.get_method('tag', [])
+    package_method = methods.get_method('package', [])
+    assert tag_method.index is package_method.index
+    # nodes outside of the included set aren't returned
+    assert not set(package_method.search({'model.ext.ext_model'}, 'pkg'))
+    assert set(package_method.search({'model.ext.ext_model'}, 'ext')) == {'model.ext.ext_model'}
+
+
 def test_select_test_name(manifest):
     methods = MethodManager(manifest, None)
     method = methods.get_method('test_name', [])
@@ -1,12 +1,21 @@
 from contextlib import contextmanager
+import marshal
+import os
 import pytest
+import tempfile
 import unittest
+from unittest import mock
 import yaml
 
+from dbt.clients.jinja import BytecodeCache, MacroFuzzEnvironment
+from dbt.clients.jinja import get_environment
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException, JinjaRenderingException
+from dbt.main import persisted_bytecode_cache
+from dbt.task.base import ConfiguredTask
+from dbt import flags
 
 
 @contextmanager
@@ -425,6 +434,113 @@ class TestJinja(unittest.TestCase):
         assert value == '1991'
 
 
+class TestBytecodeCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = BytecodeCache()
+        self.patcher = mock.patch('dbt.clients.jinja.bytecode_cache', self.cache)
+        self.patcher.start()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, 'target', 'jinja_bytecode.cache')
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tempdir.cleanup()
+
+    def compile(self, source, native=False):
+        env = get_environment(native=native)
+        return env.compile(source), BytecodeCache.get_key(env, source)
+
+    def test_templates_compile_once(self):
+        s = '{% for i in range(1, 3) %}{{ i }}{% endfor %}'
+        with mock.patch.object(
+            MacroFuzzEnvironment, '_parse', autospec=True, side_effect=MacroFuzzEnvironment._parse
+        ) as parse:
+            assert get_rendered(s, {}) == '12'
+            assert get_rendered(s, {}) == '12'
+            assert get_rendered(s, {}, native=True) == '12'
+        # the native environment compiles the same source differently
+        assert parse.call_count == 2
+        assert len(self.cache) == 2
+
+    def test_uncacheable_compiles(self):
+        env = get_environment()
+        env.compile('{{ 1 }}', name='a_template')
+        env.compile('{{ 1 }}', raw=True)
+        assert len(self.cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        first, first_key = self.compile('{{ 1 }}')
+        second, second_key = self.compile('{{ 2 }}')
+        size = len(marshal.dumps(first))
+        cache = BytecodeCache(max_size=size + len(marshal.dumps(second)))
+        cache.set(first_key, first)
+        cache.set(second_key, second)
+        assert cache.get(first_key) is not None
+        third, third_key = self.compile('{{ 3 }}')
+        cache.set(third_key, third)
+        assert cache.get(second_key) is None
+        assert cache.get(first_key) is not None
+        assert cache.get(third_key) is not None
+        assert cache.size <= cache.max_size
+
+    def test_save_and_open(self):
+        self.cache.open(self.path)
+        assert get_rendered('{{ "a" ~ "b" }}', {}) == 'ab'
+        self.cache.close()
+        assert os.path.exists(self.path)
+
+        reopened = BytecodeCache()
+        reopened.open(self.path)
+        key = BytecodeCache.get_key(get_environment(), '{{ "a" ~ "b" }}')
+        assert reopened.get(key) is not None
+        # nothing new was compiled, so the file isn't written again
+        os.remove(self.path)
+        reopened.close()
+        assert not os.path.exists(self.path)
+
+    def test_persisted_only_with_flag(self):
+        task = mock.MagicMock(spec=ConfiguredTask)
+        task.config = mock.MagicMock(target_path=os.path.dirname(self.path))
+        with mock.patch('dbt.main.bytecode_cache', self.cache):
+            with mock.patch.object(flags, 'JINJA_BYTECODE_CACHE', False):
+                with persisted_bytecode_cache(task):
+                    get_rendered('{{ "a" ~ "b" }}', {})
+            assert not os.path.exists(self.path)
+
+            with mock.patch.object(flags, 'JINJA_BYTECODE_CACHE', True):
+                with persisted_bytecode_cache(task):
+                    get_rendered('{{ "a" ~ "c" }}', {})
+            assert os.path.exists(self.path)
+            assert self.cache.path is None
+
+    def test_other_versions_are_discarded(self):
+        code, key = self.compile('{{ 1 }}')
+        path = os.path.join(self.tempdir.name, 'jinja_bytecode.cache')
+        with open(path, 'wb') as fp:
+            marshal.dump((('0.0.1', '2.0.0', b'0000'), [(key, marshal.dumps(code))]), fp)
+        cache = BytecodeCache()
+        cache.open(path)
+        assert len(cache) == 0
+
+        with open(path, 'wb') as fp:
+            fp.write(b'not a cache')
+        cache.open(path)
+        assert len(cache) == 0
+
+    def test_take_added(self):
+        first, first_key = self.compile('{{ 1 }}')
+        self.cache.record_added()
+        second, second_key = self.compile('{{ 2 }}')
+        added = self.cache.take_added()
+        assert [key for key, _ in added] == [second_key]
+        assert self.cache.take_added() == []
+
+        parent = BytecodeCache()
+        parent.update(added)
+        assert parent.get(second_key) is not None
+        assert parent.get(first_key) is None
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
@@ -1,16 +1,25 @@
+import json
 import os
+import random
 import tempfile
 import unittest
+from types import SimpleNamespace
 from unittest import mock
 
-from dbt import compilation
+import networkx as nx
+
+from dbt import compilation, flags
 try:
     from queue import Empty
 except ImportError:
     from Queue import Empty
 
+from dbt.graph.queue import GraphQueue
 from dbt.graph.selector import NodeSelector
 from dbt.graph.cli import parse_difference
+from dbt.contracts.graph.manifest import Manifest
+from dbt.node_types import NodeType
+from dbt.task.runnable import GraphRunnableTask
 
 
 def _mock_manifest(nodes):
@@ -165,6 +174,58 @@ class LinkerTest(unittest.TestCase):
         queue_2.mark_done('A')
         self.assert_would_join(queue_2)
 
+    def _get_queue_with_durations(self, durations):
+        # X -> Y -> Z is a chain, W is on its own
+        for (l, r) in [('Y', 'X'), ('Z', 'Y')]:
+            self.linker.dependency(l, r)
+        self.linker.add_node('W')
+        graph = self.linker.graph.copy()
+        return GraphQueue(graph, _mock_manifest('WXYZ'), set('WXYZ'), durations)
+
+    def test_queue_starts_longest_chain_first(self):
+        queue = self._get_queue_with_durations({'W': 1.0, 'X': 2.0, 'Y': 2.0, 'Z': 2.0})
+        self.assertEqual(queue.get(block=False).unique_id, 'X')
+        self.assertEqual(queue.get(block=False).unique_id, 'W')
+        queue.mark_done('W')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        queue.mark_done('X')
+        self.assertEqual(queue.get(block=False).unique_id, 'Y')
+        queue.mark_done('Y')
+        self.assertEqual(queue.get(block=False).unique_id, 'Z')
+        self.assertTrue(queue.empty())
+        queue.mark_done('Z')
+        self.assert_would_join(queue)
+
+    def test_queue_starts_slowest_node_first(self):
+        queue = self._get_queue_with_durations({'W': 10.0, 'X': 1.0, 'Y': 1.0, 'Z': 1.0})
+        self.assertEqual(queue.get(block=False).unique_id, 'W')
+        self.assertEqual(queue.get(block=False).unique_id, 'X')
+
+    def test_queue_unknown_durations_use_average(self):
+        # Y and Z count as taking 3.5 seconds each
+        queue = self._get_queue_with_durations({'W': 6.0, 'X': 1.0})
+        self.assertEqual(queue.get(block=False).unique_id, 'X')
+
+    def test_node_durations_from_last_run(self):
+        results = {'results': [
+            {'unique_id': 'X', 'status': 'success', 'execution_time': 2.0},
+            {'unique_id': 'Y', 'status': 'pass', 'execution_time': 3.0},
+            {'unique_id': 'Z', 'status': 'error', 'execution_time': 0.1},
+            {'unique_id': 'W', 'status': 'skipped', 'execution_time': 0.0},
+        ]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'run_results.json')
+            with open(path, 'w') as fp:
+                json.dump(results, fp)
+            task = SimpleNamespace(previous_state=None, result_path=lambda: path)
+
+            # only used when asked for
+            self.assertIsNone(GraphRunnableTask.get_node_durations(task))
+            with mock.patch.object(flags, 'CRITICAL_PATH_SCHEDULING', True):
+                durations = GraphRunnableTask.get_node_durations(task)
+        self.assertEqual(durations, {'X': 2.0, 'Y': 3.0})
+
     def test__find_cycles__cycles(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'A')]
 
@@ -179,4 +240,78 @@ class LinkerTest(unittest.TestCase):
         for (l, r) in actual_deps:
             self.linker.dependency(l, r)
 
-        self.assertIsNone(self.linker.find_cycles())
\ No newline at end of file
+        self.assertIsNone(self.linker.find_cycles())
+
+def _graph_node(unique_id, depends_on):
+    resource_type = NodeType.Test if unique_id.startswith('test.') else NodeType.Model
+    return SimpleNamespace(
+        unique_id=unique_id,
+        resource_type=resource_type,
+        fqn=unique_id.split('.'),
+        depends_on_nodes=depends_on,
+        config=SimpleNamespace(enabled=True),
+        empty=False,
+    )
+
+
+class TestEdgesTest(unittest.TestCase):
+    def _link(self, depends_on, sources=()):
+        manifest = Manifest(
+            nodes={unique_id: _graph_node(unique_id, deps) for unique_id, deps in depends_on.items()},
+            sources={unique_id: _graph_node(unique_id, []) for unique_id in sources},
+        )
+        compiler = compilation.Compiler(config=None)
+        linker = compilation.Linker()
+        compiler.link_graph(linker, manifest, add_test_edges=True)
+        return linker.graph, manifest
+
+    def test_add_test_edges(self):
+        graph, _ = self._link({
+            'model.x.model1': ['source.x.raw.table'],
+            'model.x.model2': ['model.x.model1'],
+            'model.x.model3': ['model.x.model2'],
+            'model.x.other': ['source.x.raw.table'],
+            'model.x.joined': ['model.x.model2', 'model.x.other'],
+            'test.x.test1': ['model.x.model1'],
+            'test.x.test2': ['model.x.model2'],
+            'test.x.source_test': ['source.x.raw.table'],
+            'test.x.relationships': ['model.x.model1', 'model.x.other'],
+        }, sources=['source.x.raw.table'])
+        test_edges = {(u, v) for u, v in graph.edges if u.startswith('test.')}
+        self.assertEqual(test_edges, {
+            ('test.x.source_test', 'model.x.model1'),
+            ('test.x.source_test', 'model.x.model2'),
+            ('test.x.source_test', 'model.x.model3'),
+            ('test.x.source_test', 'model.x.other'),
+            ('test.x.source_test', 'model.x.joined'),
+            ('test.x.test1', 'model.x.model2'),
+            ('test.x.test1', 'model.x.model3'),
+            ('test.x.test1', 'model.x.joined'),
+            ('test.x.test2', 'model.x.model3'),
+            ('test.x.test2', 'model.x.joined'),
+            # only joined is downstream of both the nodes it tests
+            ('test.x.relationships', 'model.x.joined'),
+        })
+
+    def test_add_test_edges_matches_search_per_node(self):
+        rng = random.Random(0)
+        depends_on = {}
+        model_ids = []
+        for n in range(60):
+            model_ids.append(f'model.x.model_{n}')
+            depends_on[model_ids[-1]] = rng.sample(model_ids[:-1], min(n, rng.randint(0, 3)))
+        for n in range(120):
+            depends_on[f'test.x.test_{n}'] = rng.sample(model_ids, rng.randint(1, 3))
+        graph, manifest = self._link(depends_on)
+
+        expected = nx.DiGraph()
+        for unique_id, deps in depends_on.items():
+            expected.add_node(unique_id)
+            expected.add_edges_from((dep, unique_id) for dep in deps)
+        for model_id in model_ids:
+            upstream = nx.ancestors(expected, model_id)
+            for test_id, deps in depends_on.items():
+                if test_id.startswith('test.') and set(deps) <= upstream:
+                    expected.add_edge(test_id, model_id)
+        self.assertEqual(set(graph.nodes), set(expected.nodes))
+        self.assertEqual(set(graph.edges), set(expected.edges))
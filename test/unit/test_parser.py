@@ -18,6 +18,7 @@ from dbt.parser import (
 from dbt.parser.schemas import (
     TestablePatchParser, SourceParser, AnalysisPatchParser, MacroPatchParser
 )
+from dbt.parser import parallel
 from dbt.parser.search import FileBlock
 from dbt.parser.generic_test_builders import YamlBlock
 from dbt.parser.sources import SourcePatcher
@@ -526,6 +527,76 @@ class ModelParserTest(BaseParserTest):
             self.parser.parse_file(block)
 
 
+class InProcessPool:
+    def imap(self, func, iterable):
+        return map(func, iterable)
+
+
+class ParallelModelParserTest(BaseParserTest):
+    def setUp(self):
+        super().setUp()
+        self.parser = ModelParser(
+            project=self.snowplow_project_config,
+            manifest=self.manifest,
+            root_project=self.root_project_config,
+        )
+        parallel._WORKER_STATE = parallel._WorkerState(
+            self.root_project_config, self.all_projects, self.manifest.macros
+        )
+        self.parallel_parser = parallel.ParallelParser(
+            self.root_project_config, self.all_projects, self.manifest, processes=2
+        )
+        # run the worker function in this process
+        self.parallel_parser._pool = InProcessPool()
+
+    def tearDown(self):
+        parallel._WORKER_STATE = None
+        super().tearDown()
+
+    def file_block_for(self, data, filename):
+        return super().file_block_for(data, filename, 'models')
+
+    def _add_files(self, manifest):
+        file_ids = []
+        for idx in range(10):
+            raw_sql = f'{{{{ config(enabled={idx % 3 != 0}) }}}}select {idx} as id'
+            block = self.file_block_for(raw_sql, f'nested/model_{idx}.sql')
+            manifest.files[block.file.file_id] = block.file
+            file_ids.append(block.file.file_id)
+        return file_ids
+
+    def test_matches_serial_parse(self):
+        file_ids = self._add_files(self.manifest)
+        self.parallel_parser.parse_files(self.parser, file_ids, self.manifest)
+
+        serial_manifest = Manifest(macros=self.manifest.macros)
+        serial_parser = ModelParser(
+            project=self.snowplow_project_config,
+            manifest=serial_manifest,
+            root_project=self.root_project_config,
+        )
+        for file_id in self._add_files(serial_manifest):
+            serial_parser.parse_file(FileBlock(serial_manifest.files[file_id]))
+
+        self.assertEqual(list(self.manifest.nodes), list(serial_manifest.nodes))
+        self.assertEqual(list(self.manifest.disabled), list(serial_manifest.disabled))
+        for unique_id, node in serial_manifest.nodes.items():
+            assertEqualNodes(self.manifest.nodes[unique_id], node)
+        for file_id, source_file in serial_manifest.files.items():
+            self.assertEqual(self.manifest.files[file_id].nodes, source_file.nodes)
+        self.assertEqual(
+            self.manifest._parsing_info.static_analysis_path_count,
+            serial_manifest._parsing_info.static_analysis_path_count,
+        )
+
+    def test_parse_error_raised_by_parent(self):
+        block = self.file_block_for('{{ SYNTAX ERROR }}', 'nested/model_1.sql')
+        self.manifest.files[block.file.file_id] = block.file
+        self.assertIsNone(parallel._parse_chunk(('snowplow', 'ModelParser', [block.file])))
+        with self.assertRaises(CompilationException):
+            self.parallel_parser.parse_files(self.parser, [block.file.file_id], self.manifest)
+
+
 class StaticModelParserTest(BaseParserTest):
     def setUp(self):
         super().setUp()
@@ -1,14 +1,23 @@
+import json
+import os
+import pickle
+import tempfile
 import unittest
 from unittest import mock
 import time
 
 import dbt.exceptions
 from dbt.parser.partial import PartialParsing
-from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_store import PartialParseStore
+from dbt.parser.read_files import load_source_file, load_source_file_contents
+from dbt.contracts.graph.lazy import LazyRecords
+from dbt.contracts.graph.manifest import GraphMemberSummary, Manifest, ManifestStateCheck
 from dbt.contracts.graph.parsed import ParsedModelNode
-from dbt.contracts.files import ParseFileType, SourceFile, SchemaSourceFile, FilePath, FileHash
+from dbt.contracts.files import ParseFileType, SourceFile, SchemaSourceFile, FilePath, FileHash, FileStat
 from dbt.node_types import NodeType
-from .utils import normalize
+from dbt.context.docs import generate_runtime_docs_context
+from dbt.parser.manifest import _process_docs_for_node
+from .utils import config_from_parts_or_dicts, normalize
 
 
 class TestPartialParsing(unittest.TestCase):
@@ -82,3 +91,204 @@ class TestPartialParsing(unittest.TestCase):
         expected_pp_dict = {'version': 2, 'models': [{'name': 'my_model', 'description': 'Test model'}]}
         schema_file = self.saved_files[schema_file_id]
         self.assertEqual(schema_file.pp_dict, expected_pp_dict)
+
+    def test_changed_vars_and_target_keys(self):
+        model_file_id = 'my_test://' + normalize('models/my_model.sql')
+        schema_file_id = 'my_test://' + normalize('models/schema.yml')
+        self.saved_files[model_file_id].vars = ['my_var']
+        self.saved_files[schema_file_id].add_target_key('name', 'models', 'my_model')
+        self.saved_manifest.state_check = ManifestStateCheck(
+            var_hashes={'my_var': FileHash.from_contents('1'), 'other': FileHash.from_contents('2')},
+            target_hashes={'name': FileHash.from_contents('dev'), 'host': FileHash.from_contents('a')},
+        )
+
+        # an unused var and target key changed
+        state_check = ManifestStateCheck(
+            var_hashes={'my_var': FileHash.from_contents('1')},
+            target_hashes={'name': FileHash.from_contents('dev'), 'host': FileHash.from_contents('b')},
+        )
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, state_check)
+        self.assertTrue(partial_parsing.skip_parsing())
+
+        # the var read by the model changed
+        state_check.var_hashes['my_var'] = FileHash.from_contents('3')
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, state_check)
+        self.assertEqual(partial_parsing.file_diff['changed'], [model_file_id])
+        self.assertEqual(partial_parsing.file_diff['changed_schema_files'], [])
+
+        # the target key read by the schema file entry changed
+        state_check.var_hashes['my_var'] = FileHash.from_contents('1')
+        state_check.target_hashes['name'] = FileHash.from_contents('prod')
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, state_check)
+        self.assertEqual(partial_parsing.file_diff['changed'], [])
+        self.assertEqual(partial_parsing.env_vars_changed_schema_files, {schema_file_id: {'models': ['my_model']}})
+
+    def test_vars_in_descriptions(self):
+        project = {
+            'name': 'my_test',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': os.getcwd(),
+            'config-version': 2,
+        }
+        profile = {
+            'target': 'test',
+            'outputs': {
+                'test': {
+                    'type': 'postgres', 'host': 'localhost', 'schema': 'analytics',
+                    'user': 'test', 'pass': 'test', 'dbname': 'test', 'port': 1,
+                },
+            },
+        }
+        config = config_from_parts_or_dicts(project, profile, cli_vars='{"my_var": 7}')
+        schema_file_id = 'my_test://' + normalize('models/schema.yml')
+        node = self.saved_manifest.nodes['model.my_test.my_model']
+        node.description = "{{ var('my_var') }} in {{ target.name }}"
+        ctx = generate_runtime_docs_context(config, node, self.saved_manifest, 'my_test')
+        _process_docs_for_node(ctx, node)
+        self.assertEqual(node.description, '7 in test')
+
+        # the reads are saved with the schema file entry the description is in
+        schema_file = self.saved_files[schema_file_id]
+        self.assertEqual(schema_file.vars, {'models': {'my_model': ['my_var']}})
+        self.assertEqual(schema_file.target_keys, {'models': {'my_model': ['name']}})
+
+        # so a different value of the var parses the entry again
+        self.saved_manifest.state_check = ManifestStateCheck(
+            var_hashes={'my_var': FileHash.from_contents('7')},
+        )
+        state_check = ManifestStateCheck(var_hashes={'my_var': FileHash.from_contents('1')})
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, state_check)
+        self.assertEqual(partial_parsing.env_vars_changed_schema_files, {schema_file_id: {'models': ['my_model']}})
+        partial_parsing.get_parsing_files()
+        self.assertNotIn('model.my_test.my_model', self.saved_manifest.nodes)
+
+
+class TestPartialParseStore(TestPartialParsing):
+
+    def setUp(self):
+        super().setUp()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.store = PartialParseStore(os.path.join(self.tempdir.name, 'target', 'partial_parse.db'))
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_round_trip(self):
+        self.assertFalse(self.store.exists())
+        self.store.write(self.saved_manifest)
+        self.assertTrue(self.store.exists())
+        manifest = self.store.read()
+        self.assertEqual(manifest.to_dict(), self.saved_manifest.to_dict())
+        self.assertEqual(list(manifest.files), list(self.saved_manifest.files))
+
+    @mock.patch('dbt.parser.partial_store.fire_event')
+    def test_only_changed_records_written(self, fire_event):
+        self.store.write(self.saved_manifest)
+        # header, two files and one node
+        self.assertEqual(fire_event.call_args[0][0].written, 4)
+
+        # nothing changed
+        self.store.write(self.saved_manifest)
+        self.assertEqual(fire_event.call_args[0][0].written, 0)
+
+        # add a node and delete a file
+        new_node = self.get_model('my_other_model')
+        self.saved_manifest.nodes[new_node.unique_id] = new_node
+        schema_file_id = 'my_test://' + normalize('models/schema.yml')
+        del self.saved_manifest.files[schema_file_id]
+        self.store.write(self.saved_manifest)
+        event = fire_event.call_args[0][0]
+        # the new node and the header, which has the new order of nodes and files
+        self.assertEqual((event.written, event.deleted), (2, 1))
+
+        manifest = self.store.read()
+        self.assertEqual(list(manifest.nodes), ['model.my_test.my_model', new_node.unique_id])
+        self.assertNotIn(schema_file_id, manifest.files)
+
+    def test_records_decoded_on_access(self):
+        self.store.write(self.saved_manifest)
+        manifest = self.store.read()
+        unique_id = 'model.my_test.my_model'
+        saved_node = self.saved_manifest.nodes[unique_id]
+
+        self.assertIsInstance(manifest.nodes, LazyRecords)
+        self.assertIn(unique_id, manifest.nodes)
+        self.assertIsNotNone(manifest.nodes.packed(unique_id))
+        summary = manifest.graph_member_summary(unique_id)
+        self.assertEqual(summary, GraphMemberSummary.from_member(saved_node))
+
+        self.assertEqual(manifest.nodes[unique_id], saved_node)
+        self.assertIsNone(manifest.nodes.packed(unique_id))
+        self.assertIsNone(manifest.nodes.summary(unique_id))
+        self.assertIs(manifest.nodes[unique_id], manifest.nodes[unique_id])
+
+    def test_unloaded_records_written_as_saved(self):
+        self.store.write(self.saved_manifest)
+        manifest = self.store.read()
+        manifest.build_flat_graph()
+
+        eager_path = os.path.join(self.tempdir.name, 'eager.json')
+        lazy_path = os.path.join(self.tempdir.name, 'lazy.json')
+        self.saved_manifest.write(eager_path)
+        manifest.write(lazy_path)
+        with open(eager_path) as eager, open(lazy_path) as lazy:
+            eager_dct, lazy_dct = json.load(eager), json.load(lazy)
+        for dct in (eager_dct, lazy_dct):
+            del dct['metadata']['generated_at']
+            del dct['metadata']['invocation_id']
+        self.assertEqual(lazy_dct, eager_dct)
+
+        self.saved_manifest.build_flat_graph()
+        self.assertEqual(
+            dict(manifest.flat_graph['nodes']), self.saved_manifest.flat_graph['nodes']
+        )
+        # nothing was decoded, so nothing changed
+        self.assertIsNotNone(manifest.nodes.packed('model.my_test.my_model'))
+
+    def test_lazy_records_pickle(self):
+        self.store.write(self.saved_manifest)
+        manifest = pickle.loads(pickle.dumps(self.store.read()))
+        self.assertEqual(manifest.nodes['model.my_test.my_model'], self.saved_manifest.nodes['model.my_test.my_model'])
+
+
+class TestReadFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tempdir.name, 'models'))
+        self.model_path = os.path.join(self.tempdir.name, 'models', 'my_model.sql')
+        with open(self.model_path, 'w') as fp:
+            fp.write('select 1\n')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def get_path(self):
+        file_stat = os.stat(self.model_path)
+        return FilePath(
+            project_root=self.tempdir.name,
+            searched_path='models',
+            relative_path='my_model.sql',
+            modification_time=file_stat.st_mtime,
+            stat=FileStat(size=file_stat.st_size, mtime_ns=file_stat.st_mtime_ns, inode=file_stat.st_ino),
+        )
+
+    def test_unchanged_file_not_read(self):
+        saved_file = load_source_file(self.get_path(), ParseFileType.Model, 'my_test', {})
+        self.assertEqual(saved_file.contents, 'select 1')
+        saved_files = {saved_file.file_id: saved_file}
+
+        source_file = load_source_file(self.get_path(), ParseFileType.Model, 'my_test', saved_files)
+        self.assertEqual(source_file.checksum, saved_file.checksum)
+        self.assertIsNone(source_file.contents)
+        load_source_file_contents(source_file)
+        self.assertEqual(source_file.contents, 'select 1')
+
+        # a different stat means the file is read again
+        with open(self.model_path, 'w') as fp:
+            fp.write('select 2\n')
+        os.utime(self.model_path, ns=(0, 0))
+        source_file = load_source_file(self.get_path(), ParseFileType.Model, 'my_test', saved_files)
+        self.assertEqual(source_file.contents, 'select 2')
+        self.assertNotEqual(source_file.checksum, saved_file.checksum)
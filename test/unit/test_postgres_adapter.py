@@ -1,17 +1,26 @@
 import agate
 import decimal
+import json
+import os
+import shutil
 import unittest
+from tempfile import mkdtemp
 from unittest import mock
 
 import dbt.flags as flags
 from dbt.task.debug import DebugTask
 
+from dbt.adapters.base.impl import RELATION_CACHE_SNAPSHOT_FILE_NAME
+from dbt.adapters.base.relation import SchemaSearchMap
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
+from dbt.adapters.reference_keys import _make_key
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.adapters.postgres import Plugin as PostgresPlugin
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import ManifestStateCheck
+from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
 from dbt.clients import agate_helper
+from dbt.clients.jinja import MacroGenerator
+from dbt.context.base import BaseContext
 from dbt.exceptions import ValidationException, DbtConfigError
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
@@ -459,6 +468,306 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
             mock.call('/* dbt */\nalter table "postgres"."test_schema".table_a rename to table_b', None)
         ])
 
+    def test_list_relations_in_schemas(self):
+        self.cursor.description = [('database',), ('name',), ('schema',), ('type',)]
+        self.cursor.fetchmany.side_effect = [[
+            ('postgres', 'table_a', 'schema_a', 'table'),
+            ('postgres', 'view_b', 'schema_b', 'view'),
+        ], []]
+        schema_relations = [
+            self.adapter.Relation.create(database='postgres', schema=schema)
+            for schema in ('schema_a', 'schema_b')
+        ]
+        relations = self.adapter.list_relations_in_schemas_without_caching(schema_relations)
+
+        sql, = [call[0][0] for call in self.mock_execute.call_args_list if 'pg_tables' in call[0][0]]
+        self.assertEqual(sql.count("ilike any (array['schema_a', 'schema_b'])"), 2)
+        self.assertEqual(
+            [(r.schema, r.identifier, r.type) for r in relations],
+            [('schema_a', 'table_a', 'table'), ('schema_b', 'view_b', 'view')]
+        )
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_relations_cache_lists_schemas_in_bulk(self, mock_get_schemas, mock_link):
+        mock_get_schemas.return_value = {
+            self.adapter.Relation.create(database='postgres', schema=f'schema_{n}')
+            for n in range(5)
+        }
+        self.cursor.description = [('database',), ('name',), ('schema',), ('type',)]
+        self.cursor.fetchmany.side_effect = [[
+            ('postgres', f'table_{n}', f'schema_{n}', 'table') for n in range(5)
+        ], []]
+        self.adapter.set_relations_cache(mock.MagicMock())
+
+        list_queries = [
+            call for call in self.mock_execute.call_args_list if 'pg_tables' in call[0][0]
+        ]
+        self.assertEqual(len(list_queries), 1)
+        for n in range(5):
+            self.assertEqual(
+                [r.identifier for r in self.adapter.cache.get_relations('postgres', f'schema_{n}')],
+                [f'table_{n}']
+            )
+            self.assertIn(('postgres', f'schema_{n}'), self.adapter.cache)
+
+    def test_copy_csv_file(self):
+        tmp_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, 'seed.csv')
+        with open(path, 'w') as fp:
+            fp.write('id,name,amount,is_active,created_at\n')
+            fp.write('1,"Smith, ""J""",3.5,true,2022-01-01 10:00:00\n')
+            fp.write('2,,null,false,\n')
+            fp.write('3,Jones,1000,true,2022-01-02 10:00:00\n')
+        agate_table = agate_helper.from_csv(path, (), row_limit=2)
+        agate_table.original_abspath = path
+
+        copied = []
+
+        def copy_expert(sql, stream):
+            # psycopg2 reads the stream in fixed size chunks
+            while True:
+                data = stream.read(16)
+                if not data:
+                    break
+                copied.append(data)
+
+        self.cursor.copy_expert.side_effect = copy_expert
+        self.cursor.rowcount = 3
+        sql = 'copy "seed" (id, name) from stdin with (format csv)'
+        self.assertEqual(self.adapter.copy_csv_file(sql, agate_table), 3)
+        self.cursor.copy_expert.assert_called_once_with(sql, mock.ANY)
+        self.assertEqual(''.join(copied), (
+            '1,"Smith, ""J""",3.5,true,2022-01-01T10:00:00\n'
+            '2,,,false,\n'
+            '3,"Jones",1000,true,2022-01-02T10:00:00\n'
+        ))
+
+    def test_seed_bulk_load_is_opt_in(self):
+        macro = load_internal_manifest_macros(self.config).macros[
+            'macro.dbt_postgres.postgres__seed_bulk_load_enabled'
+        ]
+        bulk_load_enabled = MacroGenerator(macro, {'return': BaseContext._return})
+        self.assertFalse(bulk_load_enabled({'config': {}}))
+        self.assertTrue(bulk_load_enabled({'config': {'bulk_load': True}}))
+
+    def test_get_relation_from_cache(self):
+        for n in range(3):
+            self.adapter.cache.add(self.adapter.Relation.create(
+                database='postgres', schema='schema_a', identifier=f'table_{n}', type='table'
+            ))
+        relation = self.adapter.get_relation('postgres', 'schema_a', 'TABLE_1')
+        self.assertEqual(relation.identifier, 'table_1')
+        self.assertIsNone(self.adapter.get_relation('postgres', 'schema_a', 'table_3'))
+        self.mock_execute.assert_not_called()
+
+    def _execute_catalog_batch(self, sql, bindings=None):
+        if 'pg_namespace' not in sql:
+            return
+        schemas = [s for s in ('schema_a', 'schema_b') if f"upper('{s}')" in sql]
+        self.catalog_queries.append(schemas)
+        if 'catalog_rows' in sql:
+            self.cursor.description = [('table_schema',), ('token',)]
+            rows = [(schema, self.tokens[schema]) for schema in schemas]
+        else:
+            self.cursor.description = [
+                ('table_database',), ('table_schema',), ('table_name',), ('column_name',),
+                ('column_index',),
+            ]
+            rows = [
+                ('postgres', schema, f'table_{schema[-1]}', 'id', 1)
+                for schema in schemas
+            ] + [('postgres', 'other', 'table', 'id', 1)]
+        self.cursor.fetchmany.side_effect = [rows, []]
+
+    @mock.patch.object(PostgresAdapter, 'CATALOG_BATCH_SIZE', 1)
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_iter_catalog(self, mock_get_schemas):
+        self.config.threads = 1
+        self.catalog_queries = []
+        self.tokens = {'schema_a': 'abc', 'schema_b': 'def'}
+        self.mock_execute.side_effect = self._execute_catalog_batch
+        info_schema = self.adapter.Relation.create(
+            database='postgres', schema='schema_a'
+        ).information_schema()
+        schema_map = SchemaSearchMap()
+        schema_map[info_schema] = {'schema_a', 'schema_b'}
+        mock_get_schemas.return_value = schema_map
+        manifest = Manifest(macros=self.adapter._macro_manifest_lazy.macros)
+        manifest.get_used_schemas = mock.MagicMock(
+            return_value=[('postgres', 'schema_a'), ('postgres', 'schema_b')]
+        )
+
+        # a batch per schema, with only a catalog query each
+        batches = sorted(self.adapter.iter_catalog(manifest), key=lambda b: sorted(b.schemas))
+        self.assertEqual([batch.schemas for batch in batches], [{'schema_a'}, {'schema_b'}])
+        self.assertEqual(len(self.catalog_queries), 2)
+        self.assertEqual(batches[0].tokens, {})
+
+        # with previous tokens, even none, each batch also has a token query
+        self.catalog_queries = []
+        batches = sorted(
+            self.adapter.iter_catalog(manifest, {}), key=lambda b: sorted(b.schemas)
+        )
+        self.assertEqual(len(self.catalog_queries), 4)
+        self.assertEqual(batches[0].tokens, {'schema_a': 'abc'})
+        self.assertEqual(batches[0].unchanged, set())
+        self.assertEqual(batches[0].column_names[:3], ['table_database', 'table_schema', 'table_name'])
+        self.assertEqual(batches[0].rows, [('postgres', 'schema_a', 'table_a', 'id', decimal.Decimal(1))])
+
+        # the catalog of a schema with the same token isn't queried again
+        self.catalog_queries = []
+        self.tokens['schema_b'] = 'ghi'
+        previous = {('postgres', 'schema_a'): 'abc', ('postgres', 'schema_b'): 'def'}
+        batches = sorted(
+            self.adapter.iter_catalog(manifest, previous), key=lambda b: sorted(b.schemas)
+        )
+        self.assertEqual(self.catalog_queries, [['schema_a'], ['schema_b'], ['schema_b']])
+        self.assertEqual(batches[0].unchanged, {'schema_a'})
+        self.assertEqual(batches[0].rows, ())
+        self.assertEqual(batches[1].unchanged, set())
+        self.assertEqual(batches[1].tokens, {'schema_b': 'ghi'})
+        self.assertEqual(len(batches[1].rows), 1)
+
+    def _set_snapshot_path(self):
+        tmp_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.config.target_path = tmp_dir
+        flags.RELATION_CACHE_TTL = 600
+        self.addCleanup(setattr, flags, 'RELATION_CACHE_TTL', 0)
+        self.token = 'abc'
+        self.mock_execute.side_effect = self._execute_catalog_query
+        return os.path.join(tmp_dir, RELATION_CACHE_SNAPSHOT_FILE_NAME)
+
+    def _execute_catalog_query(self, sql, bindings=None):
+        if 'pg_class' in sql:
+            self.cursor.description = [('md5',)]
+            self.cursor.fetchmany.side_effect = [[(self.token,)], []]
+        else:
+            self.cursor.description = [('database',), ('name',), ('schema',), ('type',)]
+            self.cursor.fetchmany.side_effect = [[
+                ('postgres', 'table_a', 'schema_a', 'table'),
+                ('postgres', 'view_a', 'schema_a', 'view'),
+                ('postgres', 'table_b', 'schema_b', 'table'),
+            ], []]
+
+    def _executed(self, text):
+        return [call for call in self.mock_execute.call_args_list if text in call[0][0]]
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_relations_cache_snapshot(self, mock_get_schemas, mock_link):
+        path = self._set_snapshot_path()
+        mock_get_schemas.return_value = {
+            self.adapter.Relation.create(database='postgres', schema=schema)
+            for schema in ('schema_a', 'schema_b')
+        }
+        self.adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(len(self._executed('pg_tables')), 1)
+        table_a = self.adapter.Relation.create(
+            database='postgres', schema='schema_a', identifier='table_a', type='table'
+        )
+        view_a = self.adapter.Relation.create(
+            database='postgres', schema='schema_a', identifier='view_a', type='view'
+        )
+        self.adapter.cache.add_link(table_a, view_a)
+
+        self.adapter.save_relations_cache_snapshot()
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(len(self._executed('pg_class')), 1)
+        expected = self.adapter.cache.dump_graph()
+
+        # the next run uses the saved cache, after checking the token
+        self.mock_execute.reset_mock()
+        self.adapter.set_relations_cache(mock.MagicMock(), clear=True)
+        self.assertEqual(self._executed('pg_tables'), [])
+        self.assertEqual(len(self._executed('pg_class')), 1)
+        self.assertEqual(self.adapter.cache.dump_graph(), expected)
+        self.assertIn(('postgres', 'schema_b'), self.adapter.cache)
+        mock_link.assert_called_once()
+
+        # changing the cache removes the saved one, and drops cascade
+        self.adapter.cache_dropped(table_a)
+        self.assertFalse(os.path.exists(path))
+        self.assertNotIn(_make_key(view_a), self.adapter.cache.relations)
+        self.adapter.save_relations_cache_snapshot()
+        with open(path) as fp:
+            saved = json.load(fp)
+        self.assertEqual(
+            [relation['path']['identifier'] for relation in saved['relations']], ['table_b']
+        )
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_relations_cache_snapshot_is_checked(self, mock_get_schemas, mock_link):
+        path = self._set_snapshot_path()
+        mock_get_schemas.return_value = {
+            self.adapter.Relation.create(database='postgres', schema='schema_a')
+        }
+        self.adapter.set_relations_cache(mock.MagicMock())
+        self.adapter.save_relations_cache_snapshot()
+
+        # a relation was created or dropped since the cache was saved
+        self.token = 'def'
+        self.mock_execute.reset_mock()
+        self.adapter.set_relations_cache(mock.MagicMock(), clear=True)
+        self.assertEqual(len(self._executed('pg_tables')), 1)
+        self.assertFalse(os.path.exists(path))
+
+        # the schemas were listed too long ago
+        self.token = 'abc'
+        self.adapter.save_relations_cache_snapshot()
+        with open(path) as fp:
+            saved = json.load(fp)
+        saved['listed_at'] -= 601
+        with open(path, 'w') as fp:
+            json.dump(saved, fp)
+        self.mock_execute.reset_mock()
+        self.adapter.set_relations_cache(mock.MagicMock(), clear=True)
+        self.assertEqual(self._executed('pg_class'), [])
+        self.assertEqual(len(self._executed('pg_tables')), 1)
+
+        # the schemas are different
+        self.adapter.save_relations_cache_snapshot()
+        mock_get_schemas.return_value = {
+            self.adapter.Relation.create(database='postgres', schema='schema_b')
+        }
+        self.mock_execute.reset_mock()
+        self.adapter.set_relations_cache(mock.MagicMock(), clear=True)
+        self.assertEqual(len(self._executed('pg_tables')), 1)
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_relations_cache_snapshot_removed_without_ttl(self, mock_get_schemas, mock_link):
+        path = self._set_snapshot_path()
+        mock_get_schemas.return_value = {
+            self.adapter.Relation.create(database='postgres', schema='schema_a')
+        }
+        self.adapter.set_relations_cache(mock.MagicMock())
+        self.adapter.save_relations_cache_snapshot()
+        self.assertTrue(os.path.exists(path))
+
+        # a run without the flag fills the cache again, so the saved one goes
+        flags.RELATION_CACHE_TTL = 0
+        self.adapter.set_relations_cache(mock.MagicMock(), clear=True)
+        self.assertFalse(os.path.exists(path))
+        self.adapter.save_relations_cache_snapshot()
+        self.assertFalse(os.path.exists(path))
+
+        # so does one that drops a relation without listing the schemas,
+        # like run-operation
+        flags.RELATION_CACHE_TTL = 600
+        self.adapter.set_relations_cache(mock.MagicMock(), clear=True)
+        self.adapter.save_relations_cache_snapshot()
+        self.assertTrue(os.path.exists(path))
+        flags.RELATION_CACHE_TTL = 0
+        adapter = PostgresAdapter(self.config)
+        adapter.cache_dropped(self.adapter.Relation.create(
+            database='postgres', schema='schema_a', identifier='table_a', type='table'
+        ))
+        self.assertFalse(os.path.exists(path))
+
     def test_debug_connection_ok(self):
         DebugTask.validate_connection(self.target_dict)
         self.mock_execute.assert_has_calls([
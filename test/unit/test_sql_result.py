@@ -1,5 +1,8 @@
 import unittest
+from unittest import mock
+
 from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.clients.agate_helper import ColumnarTable
 
 class TestProcessSQLResult(unittest.TestCase):
 	def test_duplicated_columns(self):
@@ -16,3 +19,30 @@ class TestProcessSQLResult(unittest.TestCase):
 			SQLConnectionManager.process_results(cols_with_more_dupes, rows),
 			[{"a": 1, "a_2": 2, "a_3": 3, "b": 4}]
 		)
+
+	def test_result_from_cursor_in_batches(self):
+		cursor = mock.MagicMock()
+		cursor.description = [('a',), ('b',), ('a',)]
+		rows = [(n, str(n), n * 2) for n in range(25)]
+		cursor.fetchmany.side_effect = [rows[:10], rows[10:20], rows[20:], []]
+		with mock.patch.object(SQLConnectionManager, 'FETCH_BATCH_SIZE', 10):
+			table = SQLConnectionManager.get_result_from_cursor(cursor)
+		self.assertIsInstance(table, ColumnarTable)
+		self.assertEqual(cursor.fetchmany.call_args_list, [mock.call(10)] * 4)
+		cursor.fetchall.assert_not_called()
+		self.assertEqual(table.column_names, ('a', 'b', 'a_2'))
+		self.assertEqual(list(table.raw_rows()), rows)
+		self.assertEqual(table.rows[24]['b'], '24')
+
+	def test_result_from_cursor_with_process_results(self):
+		class ConnectionManager(SQLConnectionManager):
+			@classmethod
+			def process_results(cls, column_names, rows):
+				return super().process_results(column_names, [(n + 1,) for n, in rows])
+
+		cursor = mock.MagicMock()
+		cursor.description = [('a',)]
+		cursor.fetchall.return_value = [(1,), (2,)]
+		table = ConnectionManager.get_result_from_cursor(cursor)
+		self.assertNotIsInstance(table, ColumnarTable)
+		self.assertEqual(table.columns['a'].values(), (2, 3))
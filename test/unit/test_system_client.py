@@ -158,6 +158,9 @@ class TestFindMatching(unittest.TestCase):
                 'absolute_path': named_file.name,
                 'relative_path': os.path.basename(named_file.name),
                 'modification_time': out[0]['modification_time'],
+                'size': 0,
+                'mtime_ns': os.stat(named_file.name).st_mtime_ns,
+                'inode': os.stat(named_file.name).st_ino,
             }]
             self.assertEqual(out, expected_output)
 
@@ -173,9 +176,25 @@ class TestFindMatching(unittest.TestCase):
                 'absolute_path': named_file.name,
                 'relative_path': os.path.basename(named_file.name),
                 'modification_time': out[0]['modification_time'],
+                'size': 0,
+                'mtime_ns': os.stat(named_file.name).st_mtime_ns,
+                'inode': os.stat(named_file.name).st_ino,
             }]
             self.assertEqual(out, expected_output)
 
+    def test_find_matching_nested_directories(self):
+        os.makedirs(os.path.join(self.tempdir, 'sub', 'deeper'))
+        for path in ('top.sql', os.path.join('sub', 'deeper', 'nested.sql'), os.path.join('sub', 'other.txt')):
+            with open(os.path.join(self.tempdir, path), 'w') as fp:
+                fp.write('select 1')
+        relative_path = os.path.basename(self.tempdir)
+        out = dbt.clients.system.find_matching(self.base_dir, [relative_path], '*.sql')
+        self.assertEqual(
+            [result['relative_path'] for result in out],
+            ['top.sql', os.path.join('sub', 'deeper', 'nested.sql')],
+        )
+        self.assertEqual(out[1]['size'], 8)
+
     def test_find_matching_file_pattern_not_found(self):
         with NamedTemporaryFile(
             prefix='sql-files', suffix='.SQLT', dir=self.tempdir
@@ -1,7 +1,11 @@
 import dbt.tracking
 import datetime
+import http.server
+import json
 import shutil
 import tempfile
+import threading
+import time
 import unittest
 
 
@@ -71,3 +75,60 @@ class TestTracking(unittest.TestCase):
         assert dbt.tracking.active_user.id is None
         assert isinstance(dbt.tracking.active_user.invocation_id, str)
         assert isinstance(dbt.tracking.active_user.run_started_at, datetime.datetime)
+
+
+class StubCollector(http.server.ThreadingHTTPServer):
+    """A local snowplow collector that records the events posted to it."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.events = []
+        super().__init__(('127.0.0.1', 0), StubCollectorHandler)
+
+    @property
+    def endpoint(self):
+        return '127.0.0.1:{}'.format(self.server_address[1])
+
+
+class StubCollectorHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        time.sleep(self.server.delay)
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.events.extend(json.loads(body)['data'])
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTimeoutEmitter(unittest.TestCase):
+    def start_collector(self, delay=0.0):
+        collector = StubCollector(delay)
+        thread = threading.Thread(target=collector.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(collector.server_close)
+        self.addCleanup(collector.shutdown)
+        return collector
+
+    def test_flush_sends_in_background(self):
+        collector = self.start_collector(delay=0.5)
+        emitter = dbt.tracking.TimeoutEmitter(collector.endpoint, protocol='http')
+        emitter.input({'e': 'se', 'se_ac': 'start'})
+        emitter.input({'e': 'se', 'se_ac': 'end'})
+
+        start = time.monotonic()
+        emitter.flush()
+        assert time.monotonic() - start < 0.25
+        assert emitter.wait(5.0)
+        assert [event['se_ac'] for event in collector.events] == ['start', 'end']
+
+    def test_wait_has_a_deadline(self):
+        collector = self.start_collector(delay=2.0)
+        emitter = dbt.tracking.TimeoutEmitter(collector.endpoint, protocol='http')
+        emitter.input({'e': 'se', 'se_ac': 'start'})
+        emitter.flush()
+
+        start = time.monotonic()
+        assert not emitter.wait(0.1)
+        assert time.monotonic() - start < 1.0
@@ -3,6 +3,8 @@ from collections import Sequence
 from typing import Any, Optional, Callable, Iterable, Dict, Union
 
 from . import data_types as data_types
+from . import exceptions as exceptions
+from . import utils as utils
 from .data_types import (
     Text as Text,
     Number as Number,
@@ -63,7 +65,11 @@ class Table:
     ) -> "Table": ...
     @classmethod
     def from_csv(
-        cls, path: Iterable[str], *, column_types: Optional["TypeTester"] = None
+        cls,
+        path: Iterable[str],
+        *,
+        column_types: Optional["TypeTester"] = None,
+        row_limit: Optional[int] = None,
     ) -> "Table": ...
     @classmethod
     def merge(cls, tables: Iterable["Table"]) -> "Table": ...
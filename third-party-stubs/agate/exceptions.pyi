@@ -0,0 +1,4 @@
+class DataTypeError(TypeError): ...
+class UnsupportedAggregationError(TypeError): ...
+class CastError(Exception): ...
+class FieldSizeLimitError(Exception): ...
@@ -0,0 +1,5 @@
+from typing import Iterable, List
+
+def deduplicate(
+    values: Iterable[str], column_names: bool = ..., separator: str = ...
+) -> List[str]: ...